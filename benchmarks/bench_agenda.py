@@ -0,0 +1,21 @@
+from datetime import datetime
+
+import pytest
+
+from hm_semester.agenda import create_agenda, create_moodle_csv, render_agenda
+
+pytest.importorskip("pytest_benchmark")
+
+STAMP = datetime(2026, 1, 1, 12, 0)
+
+
+def bench_create_agenda_to_ical(benchmark, timetable):
+    benchmark(lambda: create_agenda(timetable, 2025, "en", "winter", dtstamp=STAMP).to_ical())
+
+
+def bench_render_agenda(benchmark, timetable):
+    benchmark(render_agenda, timetable, 2025, "en", "winter", STAMP)
+
+
+def bench_create_moodle_csv(benchmark, timetable):
+    benchmark(create_moodle_csv, timetable, 2025, "en", "winter")
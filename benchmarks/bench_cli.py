@@ -0,0 +1,33 @@
+"""Start-up time of the command line interface."""
+
+import subprocess
+import sys
+
+# The CLI may take at most this many times as long to import as click alone
+# (measured at about 1.4-1.7x), so the budget scales with the machine
+IMPORT_BUDGET_RATIO = 2.0
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import times (microseconds) of a fresh ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            imported[name.strip()] = int(cumulative)
+    return imported
+
+
+def bench_cli_import_budget():
+    # Best of three runs each to reduce noise
+    cli = min(_import_times("hm_semester.__main__")["hm_semester.__main__"] for _ in range(3))
+    baseline = min(_import_times("click")["click"] for _ in range(3))
+    assert cli < IMPORT_BUDGET_RATIO * baseline, f"CLI import {cli} us vs. click {baseline} us"
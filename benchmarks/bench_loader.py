@@ -0,0 +1,24 @@
+import csv
+
+import pytest
+
+from hm_semester.loader import load_timetable
+
+pytest.importorskip("pytest_benchmark")
+
+FIELDS = ["calendar", "summary", "course_id", "weekday", "start_time", "end_time", "location", "biweekly", "start_week"]
+
+
+def bench_load_timetable_csv(benchmark, timetable, tmp_path):
+    path = tmp_path / "timetable.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i, ev in enumerate(timetable):
+            writer.writerow([
+                f"P{i % 300}", ev.summary, ev.course_id, ev.weekday,
+                ev.start_time.strftime("%H:%M"), ev.end_time.strftime("%H:%M"),
+                ev.location, "true" if ev.biweekly else "", ev.start_week,
+            ])
+    result = benchmark(load_timetable, path)
+    assert not result.errors
@@ -0,0 +1,39 @@
+import pytest
+
+from hm_semester.cache import get_semester_holidays, get_semester_info
+from hm_semester.schedule import calculate_lecture_dates, calculate_lecture_dates_bulk
+from hm_semester.util import get_holiday_dates, get_winter_semester_info
+
+pytest.importorskip("pytest_benchmark")
+
+
+def bench_calculate_lecture_dates(benchmark, timetable):
+    info = get_semester_info(2025, "winter", "en")
+    holidays = get_semester_holidays(2025, "winter", "en")
+
+    def run():
+        return [
+            calculate_lecture_dates(
+                info.start_date, info.end_date, ev.weekday, holidays,
+                ev.biweekly, ev.start_week,
+            )[: ev.max_reps]
+            for ev in timetable
+        ]
+
+    benchmark(run)
+
+
+def bench_calculate_lecture_dates_bulk(benchmark, timetable):
+    info = get_semester_info(2025, "winter", "en")
+    holidays = get_semester_holidays(2025, "winter", "en")
+    benchmark(calculate_lecture_dates_bulk, timetable, info, holidays)
+
+
+def bench_get_holiday_dates(benchmark):
+    info = get_winter_semester_info(2025, "de")
+    benchmark(get_holiday_dates, info)
+
+
+def bench_get_holiday_dates_native(benchmark):
+    info = get_winter_semester_info(2025, "de")
+    benchmark(get_holiday_dates, info, "native")
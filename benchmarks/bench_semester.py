@@ -0,0 +1,17 @@
+from datetime import datetime
+
+import pytest
+
+from hm_semester.semester import generate_calendar, render_calendar
+
+pytest.importorskip("pytest_benchmark")
+
+STAMP = datetime(2026, 1, 1, 12, 0)
+
+
+def bench_generate_calendar_to_ical(benchmark):
+    benchmark(lambda: generate_calendar(2025, "winter", "de", STAMP).to_ical())
+
+
+def bench_render_calendar(benchmark):
+    benchmark(render_calendar, 2025, "winter", "de", STAMP)
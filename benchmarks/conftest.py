@@ -0,0 +1,50 @@
+"""
+Shared fixtures of the benchmark suite.
+
+Run with ``python -m pytest benchmarks --benchmark-json=results.json``;
+pass ``--bench-large`` to include the 100k event timetables.
+"""
+
+from datetime import time
+
+import pytest
+
+from hm_semester.types import WeeklyEvent
+
+EVENT_COUNTS = [10, 1_000, 100_000]
+LARGE = 100_000
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-large", action="store_true", help="also run the 100k event benchmarks"
+    )
+
+
+def make_timetable(n: int) -> list[WeeklyEvent]:
+    """Return a deterministic synthetic timetable of ``n`` events."""
+    events = []
+    for i in range(n):
+        hour = 8 + (i % 5) * 2
+        biweekly = i % 3 == 0
+        events.append(
+            WeeklyEvent(
+                summary=f"Course {i // 4} group {i % 4}",
+                course_id=f"C{i}",
+                weekday=i % 5,
+                start_time=time(hour, 15),
+                end_time=time(hour + 1, 45),
+                location=f"R{i % 97}",
+                biweekly=biweekly,
+                start_week=1 + (i % 4 if biweekly else 0),
+                max_reps=10 if i % 7 == 0 else None,
+            )
+        )
+    return events
+
+
+@pytest.fixture(params=EVENT_COUNTS, ids=lambda n: f"{n}events")
+def timetable(request) -> list[WeeklyEvent]:
+    if request.param >= LARGE and not request.config.getoption("--bench-large"):
+        pytest.skip("needs --bench-large")
+    return make_timetable(request.param)
@@ -1,21 +1,90 @@
+import json
+import os
+import time
+
 import click
-from hm_semester.semester import generate_calendar
+from hm_semester.semester import render_calendar
 from hm_semester.const import WINTER, SUMMER
 
-@click.command()
-@click.option('--year', required=True, type=int, help='Year of the semester')
-@click.option('--semester', required=True, type=click.Choice([WINTER, SUMMER]), help='Semester (winter or summer)')
+
+@click.group(invoke_without_command=True)
+@click.option('--year', type=int, help='Year of the semester')
+@click.option('--semester', type=click.Choice([WINTER, SUMMER]), help='Semester (winter or summer)')
 @click.option('--lang', default='en', type=click.Choice(['en', 'de']), help='Language (en or de)')
-def main(year, semester, lang):
+@click.pass_context
+def main(ctx, year, semester, lang):
     """Generate a semester calendar and write it to an .ics file."""
-    cal = generate_calendar(year, semester, lang)
+    if ctx.invoked_subcommand is not None:
+        return
+    if year is None or semester is None:
+        raise click.UsageError('--year and --semester are required')
+    # Rendered without icalendar to keep start-up fast
+    ical = render_calendar(year, semester, lang)
 
     # Write to file
     filename = f"{semester}_semester_{year}_{lang}.ics"
     with open(filename, "wb") as f:
-        f.write(cal.to_ical())
+        f.write(ical)
     print(f"Calendar saved as {filename}")
 
 
+def _read_timetables(path):
+    """Read a timetable CSV, reporting invalid rows as a CLI error."""
+    from hm_semester.build import read_timetables
+    from hm_semester.loader import TimetableError
+
+    try:
+        return read_timetables(path)
+    except TimetableError as exc:
+        raise click.ClickException(str(exc)) from None
+
+
+@main.command('build-all')
+@click.option('--input', 'input_path', required=True, type=click.Path(exists=True, dir_okay=False), help='Timetable CSV with a calendar column')
+@click.option('--year', required=True, type=int, help='Year of the semester')
+@click.option('--semester', required=True, type=click.Choice([WINTER, SUMMER]), help='Semester (winter or summer)')
+@click.option('--lang', default='en', type=click.Choice(['en', 'de']), help='Language (en or de)')
+@click.option('--jobs', default=None, type=click.IntRange(min=1), help='Number of worker processes (default: CPU count)')
+@click.option('--out-dir', default='.', type=click.Path(file_okay=False), help='Output directory')
+def build_all_command(input_path, year, semester, lang, jobs, out_dir):
+    """Render agendas and Moodle CSVs for every calendar in a timetable."""
+    from hm_semester.build import build_all
+
+    started = time.perf_counter()
+    timetables = _read_timetables(input_path)
+    results = build_all(timetables, year, semester, lang, out_dir, jobs=jobs)
+    elapsed = time.perf_counter() - started
+
+    report = {
+        'calendars': len(results),
+        'events': sum(r.events for r in results),
+        'seconds': round(elapsed, 3),
+        'outputs': [
+            {'name': r.name, 'events': r.events, 'ics': r.ics_path, 'csv': r.csv_path, 'seconds': round(r.seconds, 4)}
+            for r in results
+        ],
+    }
+    with open(os.path.join(out_dir, "build_report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Built {report['calendars']} calendars ({report['events']} events) in {elapsed:.2f}s")
+
+
+@main.command('serve')
+@click.option('--host', default='127.0.0.1', help='Interface to listen on')
+@click.option('--port', default=8000, type=click.IntRange(min=0, max=65535), help='Port to listen on')
+@click.option('--input', 'input_path', type=click.Path(exists=True, dir_okay=False), help='Timetable CSV with a calendar column, served under /agenda/')
+@click.option('--cache-size', default=128, type=click.IntRange(min=1), help='Number of rendered feeds kept in memory')
+def serve_command(host, port, input_path, cache_size):
+    """Serve semester calendars and agendas as .ics subscription feeds."""
+    from hm_semester.server import CalendarServer, serve
+
+    timetables = _read_timetables(input_path) if input_path else {}
+    print(f"Serving on http://{host}:{port}/semester/<year>/<semester>.ics")
+    try:
+        serve(CalendarServer(timetables, cache_size=cache_size), host, port)
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == '__main__':
     main()
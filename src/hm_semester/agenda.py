@@ -1,92 +1,55 @@
 import csv
 import io
+import os
+import re
 import uuid
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
-from typing import Literal
-from zoneinfo import ZoneInfo
-
-from icalendar import Calendar, Event
-
-from .semester import get_summer_semester_info, get_winter_semester_info
-from .types import SemesterInfo
-from .util import get_holiday_dates
-
-
-def calculate_lecture_dates(
-    start_date: datetime.date,
-    end_date: datetime.date,
-    weekday: int,
-    holidays: set[datetime.date],
-    biweekly: bool = False,
-    start_week: int = 1,
-) -> list[datetime.date]:
-    """
-    Calculate actual lecture dates, skipping holidays and maintaining biweekly alternation.
-    
-    For biweekly lectures, if a holiday interrupts the pattern, subsequent lectures shift
-    to maintain the alternating pattern (e.g., if week 3 is a holiday, shift to week 4, 
-    then continue biweekly from there: 4, 6, 8...).
-    
-    Args:
-        start_date: First day of semester
-        end_date: Last day of semester
-        weekday: Day of week (0=Monday, 6=Sunday)
-        holidays: Set of dates when lectures don't occur
-        biweekly: If True, lectures occur every 2 weeks
-        start_week: Which week to start (1, 2, 3, 4, etc.) - first lecture occurs in this week
-    
-    Returns:
-        List of dates when lectures actually occur
-    """
-    lecture_dates = []
-    
-    # Find first matching weekday in semester
-    current = start_date
-    while current.weekday() != weekday:
-        current += timedelta(days=1)
-    
-    # Default start_week to 1 if not specified
-    if start_week is None:
-        start_week = 1
-    
-    # Skip to the starting week
-    if start_week > 1:
-        weeks_to_skip = start_week - 1
-        current += timedelta(days=7 * weeks_to_skip)
-    
-    # Track occurrences for biweekly alternation (not week numbers)
-    occurrence_count = 0
-    
-    while current <= end_date:
-        if current not in holidays:
-            if not biweekly:
-                # Weekly: add every non-holiday occurrence
-                lecture_dates.append(current)
-            else:
-                # Biweekly: add every other non-holiday occurrence
-                if occurrence_count % 2 == 0:
-                    lecture_dates.append(current)
-                occurrence_count += 1
-        
-        current += timedelta(days=7)
-    
-    return lecture_dates
-
-
-@dataclass
-class WeeklyEvent:
-    summary: str
-    course_id: str  # Used for deterministic UID generation
-    weekday: int  # 0=Monday, 6=Sunday
-    start_time: time
-    end_time: time
-    location: str = ""
-    biweekly: bool = False  # If True, event is every 2 weeks
-    start_week: int = 1  # Which semester week to start (1, 2, 3, 4, etc.)
-    max_reps: int | None = None  # Maximum number of occurrences (None = unlimited)
-    timezone: str = "Europe/Berlin"
-    sequence: int = 0  # Version number for updates
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, TextIO
+
+from .cache import get_semester_holiday_calendar, get_semester_info
+from .const import SUMMER, WINTER
+from .context import GenerationContext
+from .ical import (
+    CALENDAR_FOOTER,
+    LectureTemplate,
+    calendar_header,
+    format_utc,
+    recurring_event,
+    vtimezone,
+)
+from .intervals import HolidayCalendar
+from .occurrences import OccurrenceTable
+from .profiling import count, phase
+from .schedule import calculate_lecture_dates, calculate_lecture_dates_bulk, weekly_exdates
+from .types import SemesterInfo, WeeklyEvent
+from .util import semester_range
+
+if TYPE_CHECKING:
+    from icalendar import Calendar
+
+
+def _prodid(lang: str) -> str:
+    """Return the PRODID of agenda calendars in the given language."""
+    if lang == "de":
+        return "-//Hochschule München//hm-agenda//DE"
+    return "-//Munich University of Applied Sciences//hm-agenda//EN"
+
+
+def _lecture_template(
+    ev: WeeklyEvent, year: int, semester: str, ctx: GenerationContext
+) -> LectureTemplate:
+    """Return the VEVENT template for the lessons of one event."""
+    return LectureTemplate(
+        ev.summary,
+        f"{ev.course_id}-{year}-{semester}-lesson-",
+        "@hm.edu",
+        ev.sequence,
+        ev.location,
+        ctx.dtstamp,
+    )
 
 
 def create_agenda(
@@ -94,128 +57,444 @@ def create_agenda(
     year: int,
     lang: Literal["de", "en"],
     semester: Literal["winter", "summer"],
-) -> Calendar:
+    dtstamp: datetime | None = None,
+    occurrences: OccurrenceTable | None = None,
+    compact: bool = False,
+) -> "Calendar":
     """
     Create an iCalendar with individual lecture events, excluding holidays.
     Each lecture gets its own event with a deterministic UID for update tracking.
     Biweekly lectures maintain alternating pattern even when holidays interrupt.
+    Pass ``dtstamp`` to pin DTSTAMP/LAST-MODIFIED for reproducible output, and a
+    prebuilt :class:`OccurrenceTable` of ``events`` in this semester to skip
+    scheduling (a table of other events or another semester raises ValueError).
+    With ``compact=True`` each event becomes one recurring VEVENT
+    (see :func:`iter_compact_agenda`).
     """
-    if semester == "winter":
-        info: SemesterInfo = get_winter_semester_info(year, lang)
-    elif semester == "summer":
-        info: SemesterInfo = get_summer_semester_info(year, lang)
-    else:
-        raise ValueError("semester must be 'winter' or 'summer'")
+    from icalendar import Calendar
+
+    if compact:
+        return Calendar.from_ical(
+            b"".join(iter_compact_agenda(events, year, lang, semester, dtstamp, occurrences))
+        )
+
+    with phase("semester_info"):
+        info: SemesterInfo = get_semester_info(year, semester, lang)
+    ctx = GenerationContext(dtstamp, info.start_date, info.end_date)
 
     cal = Calendar()
-    if lang == "de":
-        cal.add("prodid", "-//Hochschule München//hm-agenda//DE")
-    else:
-        cal.add("prodid", "-//Munich University of Applied Sciences//hm-agenda//EN")
+    cal.add("prodid", _prodid(lang))
     cal.add("version", "2.0")
 
-    # Get all holiday dates from semester info
-    holidays = get_holiday_dates(info)
-    
-    # Track which timezones we need to add
-    timezones_needed = set()
-    
-    for ev in events:
-        timezones_needed.add(ev.timezone)
-        
-        # Calculate actual lecture dates using holiday-aware scheduler
-        lecture_dates = calculate_lecture_dates(
-            info.start_date,
-            info.end_date,
-            ev.weekday,
-            holidays,
-            ev.biweekly,
-            ev.start_week,
-        )
-        
-        # Limit to max_reps if specified
-        if ev.max_reps is not None:
-            lecture_dates = lecture_dates[:ev.max_reps]
-        
-        timezone = ZoneInfo(ev.timezone)
-        
+    # Get all holiday dates from semester info (shared across calls)
+    with phase("holidays"):
+        holidays = get_semester_holiday_calendar(year, semester, lang)
+
+    # Calculate lecture dates once per distinct weekday/biweekly/start_week
+    if occurrences is None:
+        with phase("scheduling"):
+            occurrences = OccurrenceTable.build(events, info, holidays, ctx)
+    else:
+        occurrences.check(events, info)
+    count("events", len(occurrences.events))
+    count("occurrences", len(occurrences))
+
+    with phase("vevents"):
+        _add_lectures(cal, occurrences, year, semester, ctx)
+    return cal
+
+
+def _add_lectures(
+    cal: "Calendar",
+    occurrences: OccurrenceTable,
+    year: int,
+    semester: str,
+    ctx: GenerationContext,
+) -> None:
+    """Add one ``icalendar`` event per lecture of ``occurrences`` to ``cal``."""
+    from icalendar import Event
+
+    for index, ev in enumerate(occurrences.events):
         # Create individual event for each lecture occurrence
-        for lesson_num, lecture_date in enumerate(lecture_dates, start=1):
+        for row in occurrences.rows(index):
+            occ = occurrences[row]
             event = Event()
-            
+
             # Add lesson number to summary
-            event.add("summary", f"{ev.summary} ({lesson_num})")
-            
+            event.add("summary", f"{ev.summary} ({occ.lesson})")
+
             # Create deterministic UID for update tracking
-            uid = f"{ev.course_id}-{year}-{semester}-lesson-{lesson_num}@hm.edu"
+            uid = f"{ev.course_id}-{year}-{semester}-lesson-{occ.lesson}@hm.edu"
             event.add("uid", uid)
-            
+
             # Add timestamps and version tracking
-            event.add("dtstamp", datetime.now())
+            event.add("dtstamp", ctx.dtstamp)
             event.add("sequence", ev.sequence)
-            
+
             # Add LAST-MODIFIED for modification tracking (only if sequence > 0)
             if ev.sequence > 0:
-                event.add("last-modified", datetime.now())
-            
-            # Set lecture time in local timezone, then convert to UTC
-            # This properly handles daylight saving time transitions
-            dtstart = datetime.combine(lecture_date, ev.start_time, tzinfo=timezone)
-            dtend = datetime.combine(lecture_date, ev.end_time, tzinfo=timezone)
-            event.add("dtstart", dtstart.astimezone(ZoneInfo('UTC')))
-            event.add("dtend", dtend.astimezone(ZoneInfo('UTC')))
-            
+                event.add("last-modified", ctx.dtstamp)
+
+            # Lecture times were converted from local time to UTC when the
+            # table was built, which properly handles daylight saving time
+            event.add("dtstart", occ.dtstart)
+            event.add("dtend", occ.dtend)
+
             if ev.location:
                 event.add("location", ev.location)
-            
+
             cal.add_component(event)
-    
-    return cal
 
 
-def create_moodle_csv(
+def iter_agenda(
     events: list[WeeklyEvent],
     year: int,
     lang: Literal["de", "en"],
     semester: Literal["winter", "summer"],
-) -> str:
+    dtstamp: datetime | None = None,
+    occurrences: OccurrenceTable | None = None,
+    compact: bool = False,
+) -> Iterator[bytes]:
     """
-    Create a Moodle presence plugin CSV for all events.
-    Format: groups;sessiondate;from;to
-    where sessiondate is DD-MM-YYYY and groups is the event summary.
+    Yield the iCalendar bytes of :func:`create_agenda` incrementally.
+
+    The output equals ``create_agenda(...).to_ical()`` for the same ``dtstamp``,
+    but only the lessons of one event are held in memory at a time.
     """
-    if semester == "winter":
-        info: SemesterInfo = get_winter_semester_info(year, lang)
-    elif semester == "summer":
-        info: SemesterInfo = get_summer_semester_info(year, lang)
+    if compact:
+        yield from iter_compact_agenda(events, year, lang, semester, dtstamp, occurrences)
+        return
+
+    yield calendar_header(_prodid(lang))
+    if occurrences is None:
+        with phase("semester_info"):
+            info: SemesterInfo = get_semester_info(year, semester, lang)
+        with phase("holidays"):
+            holidays = get_semester_holiday_calendar(year, semester, lang)
+        yield from _agenda_events(events, year, semester, info, holidays, dtstamp)
     else:
-        raise ValueError("semester must be 'winter' or 'summer'")
+        with phase("semester_info"):
+            occurrences.check(events, get_semester_info(year, semester, lang))
+        ctx = GenerationContext(dtstamp)
+        count("events", len(occurrences.events))
+        count("occurrences", len(occurrences))
+        for index, ev in enumerate(occurrences.events):
+            with phase("serialization"):
+                template = _lecture_template(ev, year, semester, ctx)
+                chunks = []
+                for row in occurrences.rows(index):
+                    occ = occurrences[row]
+                    chunks.append(template.render(occ.lesson, occ.dtstart, occ.dtend))
+            yield from chunks
+    yield CALENDAR_FOOTER
 
-    holidays = get_holiday_dates(info)
 
-    buf = io.StringIO()
-    writer = csv.writer(buf, delimiter=";")
-    writer.writerow(["groups", "sessiondate", "from", "to", "Allow students to record own attendance"])
-
-    for ev in events:
-        lecture_dates = calculate_lecture_dates(
-            info.start_date,
-            info.end_date,
-            ev.weekday,
-            holidays,
-            ev.biweekly,
-            ev.start_week,
-        )
-        if ev.max_reps is not None:
-            lecture_dates = lecture_dates[:ev.max_reps]
+def _agenda_events(
+    events: list[WeeklyEvent],
+    year: int,
+    semester: str,
+    info: SemesterInfo,
+    holidays: HolidayCalendar,
+    dtstamp: datetime | None,
+) -> Iterator[bytes]:
+    """Yield the lecture VEVENTs of one semester."""
+    with phase("scheduling"):
+        schedules = calculate_lecture_dates_bulk(events, info, holidays)
+    ctx = GenerationContext(dtstamp, info.start_date, info.end_date)
+    count("events", len(events))
+    count("occurrences", lambda: sum(map(len, schedules)))
+
+    for ev, lecture_dates in zip(events, schedules):
+        with phase("serialization"):
+            template = _lecture_template(ev, year, semester, ctx)
+            chunks = [
+                template.render(
+                    lesson_num,
+                    ctx.to_utc(lecture_date, ev.start_time, ev.timezone),
+                    ctx.to_utc(lecture_date, ev.end_time, ev.timezone),
+                )
+                for lesson_num, lecture_date in enumerate(lecture_dates, start=1)
+            ]
+        yield from chunks
+
+
+def iter_compact_agenda(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    dtstamp: datetime | None = None,
+    occurrences: OccurrenceTable | None = None,
+) -> Iterator[bytes]:
+    """
+    Yield an agenda with one recurring VEVENT per event instead of one per lecture.
+
+    Regular series become ``RRULE:FREQ=WEEKLY`` (``INTERVAL=2`` if biweekly)
+    with an ``EXDATE`` for every skipped week. Biweekly series that holidays
+    shifted off their two-week grid list their dates as ``RDATE``s instead.
+    Times are local to each event's time zone, which gets a VTIMEZONE, and
+    UIDs are ``{course_id}-{year}-{semester}@hm.edu``.
+    """
+    with phase("semester_info"):
+        info: SemesterInfo = get_semester_info(year, semester, lang)
+    if occurrences is None:
+        with phase("holidays"):
+            holidays = get_semester_holiday_calendar(year, semester, lang)
+        with phase("scheduling"):
+            schedules = calculate_lecture_dates_bulk(events, info, holidays)
+    else:
+        occurrences.check(events, info)
+        schedules = [occurrences.dates(i) for i in range(len(events))]
+    ctx = GenerationContext(dtstamp, info.start_date, info.end_date)
+    count("events", len(events))
+    count("occurrences", lambda: sum(map(len, schedules)))
+
+    yield calendar_header(_prodid(lang))
+    for tz_name in dict.fromkeys(ev.timezone for ev, dates in zip(events, schedules) if dates):
+        yield vtimezone(tz_name, info.start_date, info.end_date)
+    for ev, lecture_dates in zip(events, schedules):
+        if lecture_dates:
+            with phase("serialization"):
+                chunk = _compact_event(ev, lecture_dates, year, semester, ctx)
+            yield chunk
+    yield CALENDAR_FOOTER
+
+
+def _compact_event(
+    ev: WeeklyEvent, lecture_dates: Sequence[date], year: int, semester: str, ctx: GenerationContext
+) -> bytes:
+    """Return the recurring VEVENT covering all lectures of one event."""
+    interval = 2 if ev.biweekly else 1
+    exdates = weekly_exdates(lecture_dates, interval) if len(lecture_dates) > 1 else []
+    rrule = None
+    rdates: Sequence[date] = []
+    if exdates is None:
+        # Holiday shifts broke the regular interval
+        exdates = []
+        rdates = lecture_dates[1:]
+    elif len(lecture_dates) > 1:
+        until = ctx.to_utc(lecture_dates[-1], ev.start_time, ev.timezone)
+        rrule = f"FREQ=WEEKLY;INTERVAL={interval};UNTIL={format_utc(until)}"
+    first = lecture_dates[0]
+    return recurring_event(
+        ev.summary,
+        f"{ev.course_id}-{year}-{semester}@hm.edu",
+        ev.sequence,
+        ev.location,
+        ctx.dtstamp,
+        ev.timezone,
+        datetime.combine(first, ev.start_time),
+        datetime.combine(first, ev.end_time),
+        rrule,
+        [datetime.combine(d, ev.start_time) for d in exdates],
+        [datetime.combine(d, ev.start_time) for d in rdates],
+    )
+
+
+def agenda_range(
+    events: list[WeeklyEvent],
+    start_year: int,
+    end_year: int,
+    semesters: tuple[str, ...] = (SUMMER, WINTER),
+    lang: Literal["de", "en"] = "en",
+    dtstamp: datetime | None = None,
+    combined: bool = True,
+) -> Iterator[bytes]:
+    """
+    Stream the agendas of ``events`` for every semester from ``start_year`` to ``end_year``.
+
+    All semester infos and holiday sets are computed up front in one sweep.
+    With ``combined=True`` the chunks form one VCALENDAR; otherwise each
+    yielded item is the complete agenda of one semester (as
+    :func:`render_agenda` returns it), in chronological order.
+    """
+    terms = semester_range(start_year, end_year, semesters)
+    infos = [get_semester_info(year, semester, lang) for year, semester in terms]
+    holiday_sets = HolidayCalendar.from_semesters(infos)
+    # Share one DTSTAMP across all semesters of the range
+    dtstamp = GenerationContext(dtstamp).dtstamp
+
+    if combined:
+        yield calendar_header(_prodid(lang))
+    for (year, semester), info, holidays in zip(terms, infos, holiday_sets):
+        chunks = _agenda_events(events, year, semester, info, holidays, dtstamp)
+        if combined:
+            yield from chunks
+        else:
+            yield b"".join([calendar_header(_prodid(lang)), *chunks, CALENDAR_FOOTER])
+    if combined:
+        yield CALENDAR_FOOTER
 
+
+def stream_agenda(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    fp: BinaryIO,
+    dtstamp: datetime | None = None,
+    occurrences: OccurrenceTable | None = None,
+    compact: bool = False,
+) -> None:
+    """Write the agenda of :func:`create_agenda` to a binary file object, one VEVENT at a time."""
+    for chunk in iter_agenda(events, year, lang, semester, dtstamp, occurrences, compact):
+        fp.write(chunk)
+
+
+def render_agenda(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    dtstamp: datetime | None = None,
+    occurrences: OccurrenceTable | None = None,
+    compact: bool = False,
+) -> bytes:
+    """
+    Return the agenda of :func:`create_agenda` as iCalendar bytes.
+
+    Much faster than ``create_agenda(...).to_ical()`` because no ``icalendar``
+    components are constructed.
+    """
+    return b"".join(iter_agenda(events, year, lang, semester, dtstamp, occurrences, compact))
+
+
+# Open files kept by split_moodle_csv, well below the usual limit of 1024 descriptors
+MAX_OPEN_FILES = 64
+
+MOODLE_HEADER = ["groups", "sessiondate", "from", "to", "Allow students to record own attendance"]
+
+
+def iter_moodle_rows(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    occurrences: OccurrenceTable | None = None,
+) -> Iterator[list]:
+    """Yield the rows of :func:`create_moodle_csv`, header first, one lecture at a time."""
+    if occurrences is None:
+        with phase("semester_info"):
+            info: SemesterInfo = get_semester_info(year, semester, lang)
+        with phase("holidays"):
+            holidays = get_semester_holiday_calendar(year, semester, lang)
+        with phase("scheduling"):
+            schedules = calculate_lecture_dates_bulk(events, info, holidays)
+    else:
+        with phase("semester_info"):
+            occurrences.check(events, get_semester_info(year, semester, lang))
+        schedules = [occurrences.dates(i) for i in range(len(events))]
+    count("events", len(events))
+    count("occurrences", lambda: sum(map(len, schedules)))
+
+    yield MOODLE_HEADER
+
+    for ev, lecture_dates in zip(events, schedules):
+        start_time = ev.start_time.strftime("%H:%M")
+        end_time = ev.end_time.strftime("%H:%M")
         for lecture_date in lecture_dates:
-            writer.writerow([
-                ev.summary,
-                lecture_date.strftime("%d-%m-%Y"),
-                ev.start_time.strftime("%H:%M"),
-                ev.end_time.strftime("%H:%M"),
-                1,
-            ])
+            yield [ev.summary, lecture_date.strftime("%d-%m-%Y"), start_time, end_time, 1]
+
+
+def write_moodle_csv(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    fp: TextIO,
+    occurrences: OccurrenceTable | None = None,
+) -> None:
+    """Write the CSV of :func:`create_moodle_csv` to a text stream row by row."""
+    csv.writer(fp, delimiter=";").writerows(iter_moodle_rows(events, year, lang, semester, occurrences))
+
+
+def split_moodle_csv(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    out_dir: str | os.PathLike,
+    occurrences: OccurrenceTable | None = None,
+) -> dict[str, Path]:
+    """
+    Write one Moodle CSV per ``summary`` group into ``out_dir`` in a single pass.
+
+    Files are named after the group (made distinct with :func:`output_names`)
+    and each starts with the CSV header.
+    At most :data:`MAX_OPEN_FILES` files are open at a time. Returns the
+    file written for each group.
+    """
+    out_dir = Path(out_dir)
+    file_names = output_names(list(dict.fromkeys(ev.summary for ev in events)))
+    paths: dict[str, Path] = {}
+    # Open files, least recently used first; evicted files are reopened for appending
+    open_files: OrderedDict[Path, tuple[TextIO, Any]] = OrderedDict()
+    started: set[Path] = set()
+    try:
+        rows = iter_moodle_rows(events, year, lang, semester, occurrences)
+        header = next(rows)
+        for row in rows:
+            group = row[0]
+            path = paths.get(group)
+            if path is None:
+                path = paths[group] = out_dir / f"{file_names[group]}.csv"
+            entry = open_files.get(path)
+            if entry is None:
+                if len(open_files) >= MAX_OPEN_FILES:
+                    open_files.popitem(last=False)[1][0].close()
+                fp = open(path, "a" if path in started else "w", encoding="utf-8", newline="")
+                entry = open_files[path] = fp, csv.writer(fp, delimiter=";")
+                if path not in started:
+                    started.add(path)
+                    entry[1].writerow(header)
+            else:
+                open_files.move_to_end(path)
+            entry[1].writerow(row)
+    finally:
+        for fp, _ in open_files.values():
+            fp.close()
+    return paths
+
+
+def safe_name(name: str) -> str:
+    """Return a file name for a calendar or group name."""
+    return re.sub(r"[^\w.-]+", "_", name).strip("._") or "calendar"
+
+
+def output_names(names: list[str]) -> dict[str, str]:
+    """
+    Return a distinct output file name (without suffix) for every calendar or group name.
 
+    Names that :func:`safe_name` maps to the same file (also when only their
+    case differs) get a ``-2``, ``-3``, ... suffix in order of appearance.
+    """
+    bases = {name: safe_name(name) for name in names}
+    natural = {base.lower() for base in bases.values()}
+    used: set[str] = set()
+    result = {}
+    for name, base in bases.items():
+        candidate, k = base, 1
+        # Suffixed names must not take another calendar's natural name either
+        while candidate.lower() in used or (k > 1 and candidate.lower() in natural):
+            k += 1
+            candidate = f"{base}-{k}"
+        used.add(candidate.lower())
+        result[name] = candidate
+    return result
+
+
+def create_moodle_csv(
+    events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    occurrences: OccurrenceTable | None = None,
+) -> str:
+    """
+    Create a Moodle presence plugin CSV for all events.
+    Format: groups;sessiondate;from;to
+    where sessiondate is DD-MM-YYYY and groups is the event summary.
+    """
+    buf = io.StringIO()
+    write_moodle_csv(events, year, lang, semester, buf, occurrences)
     return buf.getvalue()
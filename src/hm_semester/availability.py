@@ -0,0 +1,196 @@
+"""
+Room availability index for one semester.
+
+Each room keeps one occupancy bitmap per day (a Python int with one bit per
+``slot_minutes`` slot of local time), so checking a time window is a single
+AND with a precomputed mask. Events can be added and removed one at a time;
+removing an event rebuilds only the days it occupied.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Literal
+
+from .cache import get_semester_holiday_calendar, get_semester_info
+from .intervals import HolidayCalendar
+from .schedule import calculate_lecture_dates_bulk, first_lecture_ordinal
+from .types import SemesterInfo, WeeklyEvent
+
+
+class AvailabilityIndex:
+    """
+    Occupied time slots per room and day of a semester.
+
+    Rooms are event locations (plus any ``rooms`` passed explicitly); events
+    without a location are ignored. Times are local wall-clock times and are
+    rounded outwards to whole slots.
+    """
+
+    def __init__(
+        self,
+        info: SemesterInfo,
+        holidays: Iterable[date] | HolidayCalendar,
+        rooms: Iterable[str] = (),
+        slot_minutes: int = 15,
+    ):
+        if 1440 % slot_minutes:
+            raise ValueError("slot_minutes must divide a day")
+        self.info = info
+        self.holidays = holidays
+        self.slot_minutes = slot_minutes
+        self._start_ord = info.start_date.toordinal()
+        # room -> ordinal -> occupied slot bitmap
+        self._busy: dict[str, dict[int, int]] = {room: {} for room in rooms}
+        # room -> [(event, lecture ordinals)]
+        self._events: dict[str, list[tuple[WeeklyEvent, list[int]]]] = defaultdict(list)
+
+    @classmethod
+    def from_events(
+        cls,
+        events: list[WeeklyEvent],
+        year: int,
+        semester: Literal["winter", "summer"],
+        lang: Literal["de", "en"] = "en",
+        rooms: Iterable[str] = (),
+        slot_minutes: int = 15,
+    ) -> "AvailabilityIndex":
+        """Build the index of a timetable for one semester."""
+        index = cls(
+            get_semester_info(year, semester, lang),
+            get_semester_holiday_calendar(year, semester, lang),
+            rooms,
+            slot_minutes,
+        )
+        schedules = calculate_lecture_dates_bulk(events, index.info, index.holidays)
+        for ev, lecture_dates in zip(events, schedules):
+            index._add(ev, lecture_dates)
+        return index
+
+    @property
+    def rooms(self) -> list[str]:
+        return sorted(self._busy)
+
+    def mask(self, start: time, end: time) -> int:
+        """Return the bitmap of the slots touched by ``start``-``end``."""
+        first = (start.hour * 60 + start.minute) // self.slot_minutes
+        last = -(-(end.hour * 60 + end.minute) // self.slot_minutes)
+        if last <= first:
+            return 0
+        return ((1 << last) - 1) ^ ((1 << first) - 1)
+
+    def week_of(self, day: date) -> int:
+        """
+        Return the semester week of a date, counted like ``WeeklyEvent.start_week``.
+
+        Week 1 of a weekday starts at its first occurrence on or after the
+        semester start, so a Monday event with ``start_week=3`` is in week 3
+        even if the semester starts mid-week.
+        """
+        first = first_lecture_ordinal(self._start_ord, day.weekday())
+        return (day.toordinal() - first) // 7 + 1
+
+    def date_of(self, week: int, weekday: int) -> date:
+        """Return the date of a weekday (0=Monday) in a semester week (see :meth:`week_of`)."""
+        return date.fromordinal(first_lecture_ordinal(self._start_ord, weekday, week))
+
+    def _add(self, ev: WeeklyEvent, lecture_dates: Iterable[date]) -> None:
+        if not ev.location:
+            return
+        ordinals = [d.toordinal() for d in lecture_dates]
+        self._events[ev.location].append((ev, ordinals))
+        busy = self._busy.setdefault(ev.location, {})
+        mask = self.mask(ev.start_time, ev.end_time)
+        for o in ordinals:
+            busy[o] = busy.get(o, 0) | mask
+
+    def add(self, ev: WeeklyEvent) -> None:
+        """Schedule an event and mark its lectures as occupied."""
+        (lecture_dates,) = calculate_lecture_dates_bulk([ev], self.info, self.holidays)
+        self._add(ev, lecture_dates)
+
+    def remove(self, ev: WeeklyEvent) -> None:
+        """Remove an event added before; raises ValueError if it is not indexed."""
+        entries = self._events.get(ev.location, [])
+        for i, (indexed, ordinals) in enumerate(entries):
+            if indexed == ev:
+                del entries[i]
+                break
+        else:
+            raise ValueError(f"Event not in index: {ev.course_id}")
+        # Rebuild the affected days from the room's remaining events
+        busy = self._busy[ev.location]
+        affected = set(ordinals)
+        for o in affected:
+            busy.pop(o, None)
+        for other, other_ordinals in entries:
+            mask = self.mask(other.start_time, other.end_time)
+            for o in affected.intersection(other_ordinals):
+                busy[o] = busy.get(o, 0) | mask
+
+    def occupied(self, room: str, day: date) -> int:
+        """Return the occupied slot bitmap of a room on a day."""
+        return self._busy.get(room, {}).get(day.toordinal(), 0)
+
+    def is_free(self, room: str, day: date, start: time, end: time) -> bool:
+        """Return whether a room is free on ``day`` from ``start`` to ``end``."""
+        return not self.occupied(room, day) & self.mask(start, end)
+
+    def free_rooms(
+        self, weekday: int, start: time, end: time, weeks: Iterable[int] | None = None
+    ) -> list[str]:
+        """
+        Return the rooms free on ``weekday`` from ``start`` to ``end`` in all ``weeks``.
+
+        ``weeks`` are semester weeks (see :meth:`week_of`) and default to the
+        whole semester.
+        """
+        first = first_lecture_ordinal(self._start_ord, weekday)
+        if weeks is None:
+            weeks = range(1, (self.info.end_date.toordinal() - first) // 7 + 2)
+        ordinals = [first + (week - 1) * 7 for week in weeks]
+        mask = self.mask(start, end)
+        return [
+            room
+            for room in sorted(self._busy)
+            if not any(self._busy[room].get(o, 0) & mask for o in ordinals)
+        ]
+
+    def next_free_slot(
+        self,
+        room: str,
+        duration: timedelta,
+        after: datetime | None = None,
+        earliest: time = time(8, 0),
+        latest: time = time(20, 0),
+        weekdays: Iterable[int] = range(5),
+    ) -> datetime | None:
+        """
+        Return the start of the first free slot of ``duration`` in a room.
+
+        The search runs from ``after`` (default: semester start) to the end of
+        the semester, on ``weekdays`` between ``earliest`` and ``latest``.
+        Returns None if there is no such slot.
+        """
+        needed = -(-int(duration.total_seconds()) // (self.slot_minutes * 60))
+        if needed <= 0:
+            raise ValueError("duration must be positive")
+        if after is None:
+            after = datetime.combine(self.info.start_date, time.min)
+        weekdays = set(weekdays)
+        window = self.mask(earliest, latest)
+        busy = self._busy.get(room, {})
+        for o in range(after.toordinal(), self.info.end_date.toordinal() + 1):
+            if (o - 1) % 7 not in weekdays:  # date.fromordinal(1) is a Monday
+                continue
+            free = window & ~busy.get(o, 0)
+            if o == after.toordinal():
+                free &= ~self.mask(time.min, after.time())
+            # Keep the slots that start a run of ``needed`` free slots
+            runs = free
+            for shift in range(1, needed):
+                runs &= free >> shift
+            if runs:
+                slot = (runs & -runs).bit_length() - 1
+                return datetime.fromordinal(o) + timedelta(minutes=slot * self.slot_minutes)
+        return None
@@ -0,0 +1,58 @@
+"""Native calculator for the public holidays of Bavaria (Germany, BY).
+
+Bavarian public holidays are either on fixed dates or a fixed number of days
+from Easter Sunday, so they can be computed without loading the ``holidays``
+package. The result matches ``holidays.Germany(subdiv="BY")``, including its
+historic rules (Buß- und Bettag until 1994, Reformationstag 2017) and its
+coverage starting in 1991.
+"""
+
+from datetime import date, timedelta
+
+from dateutil.easter import easter
+
+FIRST_YEAR = 1991
+
+# (month, day, name)
+FIXED_HOLIDAYS = [
+    (1, 1, "Neujahr"),
+    (1, 6, "Heilige Drei Könige"),
+    (5, 1, "Erster Mai"),
+    (10, 3, "Tag der Deutschen Einheit"),
+    (11, 1, "Allerheiligen"),
+    (12, 25, "Erster Weihnachtstag"),
+    (12, 26, "Zweiter Weihnachtstag"),
+]
+
+# (days after Easter Sunday, name)
+EASTER_HOLIDAYS = [
+    (-2, "Karfreitag"),
+    (1, "Ostermontag"),
+    (39, "Christi Himmelfahrt"),
+    (50, "Pfingstmontag"),
+    (60, "Fronleichnam"),
+]
+
+
+def bavarian_holidays(year: int) -> dict[date, str]:
+    """Return the Bavarian public holidays of a year, mapped to their German names."""
+    if year < FIRST_YEAR:
+        return {}
+
+    names: dict[date, list[str]] = {}
+    for month, day, name in FIXED_HOLIDAYS:
+        names.setdefault(date(year, month, day), []).append(name)
+    easter_sunday = easter(year)
+    for offset, name in EASTER_HOLIDAYS:
+        names.setdefault(easter_sunday + timedelta(days=offset), []).append(name)
+    if year <= 1994:
+        # Wednesday before 23 November
+        nov_22 = date(year, 11, 22)
+        names.setdefault(nov_22 - timedelta(days=(nov_22.weekday() - 2) % 7), []).append(
+            "Buß- und Bettag"
+        )
+    if year == 2017:
+        names.setdefault(date(2017, 10, 31), []).append("Reformationstag")
+
+    # Holidays on the same day are joined like the holidays package does
+    return {day: "; ".join(sorted(names[day])) for day in sorted(names)}
@@ -0,0 +1,107 @@
+"""Parallel bulk build of agendas and Moodle CSVs for many timetables."""
+
+import os
+import time as timer
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .agenda import output_names, render_agenda, safe_name, write_moodle_csv
+from .cache import get_semester_holiday_calendar, get_semester_info, get_utc_offset_table
+from .loader import load_timetable
+from .types import WeeklyEvent
+
+
+@dataclass
+class BuildResult:
+    name: str
+    events: int
+    ics_path: str
+    csv_path: str
+    seconds: float
+
+
+def read_timetables(path: str | os.PathLike) -> dict[str, list[WeeklyEvent]]:
+    """
+    Read a CSV timetable and group its rows into one event list per calendar.
+
+    Required columns: ``calendar``, ``summary``, ``course_id``, ``weekday``,
+    ``start_time``, ``end_time`` (``HH:MM``). Optional columns are the remaining
+    :class:`WeeklyEvent` fields. Raises :class:`~hm_semester.loader.TimetableError`
+    if any row is invalid.
+    """
+    result = load_timetable(path, "csv")
+    result.raise_for_errors()
+    return result.timetables
+
+
+def warm_caches(year: int, semester: str, lang: str, timezones=("Europe/Berlin",)) -> None:
+    """Fill the semester, holiday and UTC offset caches of the current process."""
+    info = get_semester_info(year, semester, lang)
+    get_semester_holiday_calendar(year, semester, lang)
+    for tz_name in timezones:
+        get_utc_offset_table(tz_name, info.start_date, info.end_date)
+
+
+def build_one(
+    name: str,
+    events: list[WeeklyEvent],
+    year: int,
+    semester: str,
+    lang: str,
+    out_dir: str,
+    dtstamp: datetime | None = None,
+    file_name: str | None = None,
+) -> BuildResult:
+    """
+    Render the agenda (.ics) and Moodle CSV of one timetable into ``out_dir``.
+
+    The files are named ``file_name`` (default: :func:`safe_name` of ``name``).
+    """
+    started = timer.perf_counter()
+    base = Path(out_dir) / (file_name or safe_name(name))
+    ics_path = base.with_name(base.name + ".ics")
+    csv_path = base.with_name(base.name + ".csv")
+    ics_path.write_bytes(render_agenda(events, year, lang, semester, dtstamp))
+    with open(csv_path, "w", encoding="utf-8", newline="") as fp:
+        write_moodle_csv(events, year, lang, semester, fp)
+    return BuildResult(name, len(events), str(ics_path), str(csv_path), timer.perf_counter() - started)
+
+
+def build_all(
+    timetables: dict[str, list[WeeklyEvent]],
+    year: int,
+    semester: str,
+    lang: str,
+    out_dir: str | os.PathLike,
+    jobs: int | None = None,
+    dtstamp: datetime | None = None,
+) -> list[BuildResult]:
+    """
+    Render all timetables, in parallel worker processes if ``jobs`` is not 1.
+
+    Each worker warms the semester caches once at start-up, so tasks only
+    schedule and serialize their events. Calendars whose names map to the
+    same file name are written to distinct files (see :func:`output_names`).
+    """
+    out_dir = str(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    timezones = sorted({ev.timezone for events in timetables.values() for ev in events})
+    file_names = output_names(list(timetables))
+    tasks = [
+        (name, events, year, semester, lang, out_dir, dtstamp, file_names[name])
+        for name, events in timetables.items()
+    ]
+
+    if jobs == 1 or len(tasks) <= 1:
+        warm_caches(year, semester, lang, timezones)
+        return [build_one(*task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=warm_caches,
+        initargs=(year, semester, lang, timezones),
+    ) as pool:
+        futures = [pool.submit(build_one, *task) for task in tasks]
+        return [future.result() for future in futures]
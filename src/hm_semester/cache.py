@@ -0,0 +1,77 @@
+"""Process-wide caches for semester information and holiday sets.
+
+Semester dates and holidays only depend on ``(year, semester, lang)``, so
+batch jobs rendering many agendas for the same semester can share one
+immutable :class:`SemesterInfo` and one holiday calendar (scheduling uses the
+interval form; the frozen holiday set is kept for callers that want dates). UTC offset
+tables are shared per time zone and date range in the same way.
+"""
+
+from dataclasses import replace
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+from .const import SUMMER, WINTER
+from .intervals import HolidayCalendar
+from .offsets import UtcOffsetTable
+from .types import SemesterInfo
+from .util import get_holiday_dates, get_summer_semester_info, get_winter_semester_info
+
+CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_semester_info(year: int, semester: str, lang: str) -> SemesterInfo:
+    """Return the shared, read-only semester information for a semester."""
+    if semester == WINTER:
+        info = get_winter_semester_info(year, lang)
+    elif semester == SUMMER:
+        info = get_summer_semester_info(year, lang)
+    else:
+        raise ValueError("semester must be 'winter' or 'summer'")
+    return replace(info, breaks=MappingProxyType(dict(info.breaks)))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_semester_holidays(year: int, semester: str, lang: str) -> frozenset[date]:
+    """Return the shared holiday set (breaks and public holidays) for a semester."""
+    return frozenset(get_holiday_dates(get_semester_info(year, semester, lang)))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_semester_holiday_calendar(year: int, semester: str, lang: str) -> HolidayCalendar:
+    """Return the shared holidays of a semester as merged day intervals."""
+    return HolidayCalendar.from_semester(get_semester_info(year, semester, lang))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_semester_holiday_ordinals(year: int, semester: str, lang: str) -> tuple[int, ...]:
+    """Return the sorted ordinals of the shared holiday set for a semester."""
+    return tuple(get_semester_holiday_calendar(year, semester, lang).ordinals())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_utc_offset_table(tz_name: str, first: date, last: date) -> UtcOffsetTable:
+    """Return the shared UTC offset table of a time zone for a date range."""
+    return UtcOffsetTable(tz_name, first, last)
+
+
+def cache_info() -> dict:
+    """Return hit/miss statistics of all semester caches."""
+    return {
+        "semester_info": get_semester_info.cache_info(),
+        "holidays": get_semester_holidays.cache_info(),
+        "holiday_calendar": get_semester_holiday_calendar.cache_info(),
+        "holiday_ordinals": get_semester_holiday_ordinals.cache_info(),
+        "utc_offsets": get_utc_offset_table.cache_info(),
+    }
+
+
+def clear_caches() -> None:
+    """Invalidate all semester caches, e.g. after changing holiday rules."""
+    get_semester_info.cache_clear()
+    get_semester_holidays.cache_clear()
+    get_semester_holiday_calendar.cache_clear()
+    get_semester_holiday_ordinals.cache_clear()
+    get_utc_offset_table.cache_clear()
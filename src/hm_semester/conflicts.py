@@ -0,0 +1,98 @@
+"""
+Double-booking detection over scheduled lectures.
+
+Lectures are grouped by a resource (the location by default, or e.g. the
+lecturer) and each group is swept once in start-time order, keeping the
+lectures still running in a heap ordered by end time. Every lecture that
+starts before an active one ends overlaps it, so all clashes are found in
+O(n log n + k) for n lectures and k clashes instead of comparing all pairs.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Literal
+
+from .cache import get_semester_holiday_calendar, get_semester_info
+from .context import GenerationContext
+from .occurrences import EPOCH, OccurrenceTable
+from .types import WeeklyEvent
+
+
+@dataclass(frozen=True)
+class Conflict:
+    resource: str
+    date: date
+    uid: str  # UID of the lesson that starts first
+    other_uid: str
+    start: datetime  # Start of the overlap (UTC)
+    end: datetime  # End of the overlap (UTC)
+    event: int  # Index of the first lesson's event
+    other_event: int
+
+
+def location_key(event: WeeklyEvent) -> str:
+    """Return the resource of an event for room conflicts."""
+    return event.location
+
+
+def find_conflicts(
+    events: list[WeeklyEvent],
+    year: int,
+    semester: Literal["winter", "summer"],
+    lang: Literal["de", "en"] = "en",
+    key: Callable[[WeeklyEvent], str | None] = location_key,
+    occurrences: OccurrenceTable | None = None,
+) -> list[Conflict]:
+    """
+    Return every pair of overlapping lectures that share a resource.
+
+    ``key`` maps an event to its resource; events with an empty resource are
+    ignored. Pass a prebuilt :class:`OccurrenceTable` of ``events`` in this
+    semester to skip scheduling. Conflicts are ordered by overlap start.
+    """
+    info = get_semester_info(year, semester, lang)
+    if occurrences is None:
+        holidays = get_semester_holiday_calendar(year, semester, lang)
+        ctx = GenerationContext(None, info.start_date, info.end_date)
+        occurrences = OccurrenceTable.build(events, info, holidays, ctx)
+    else:
+        occurrences.check(events, info)
+    events = occurrences.events
+
+    rows_by_resource: dict[str, list[int]] = defaultdict(list)
+    for index, ev in enumerate(events):
+        resource = key(ev)
+        if resource:
+            rows_by_resource[resource].extend(occurrences.rows(index))
+
+    starts, ends, lessons = occurrences.start, occurrences.end, occurrences.lesson
+    event_of = occurrences.event
+    conflicts = []
+    for resource, rows in rows_by_resource.items():
+        rows.sort(key=starts.__getitem__)
+        active: list[tuple[int, int]] = []  # (end, row) of running lectures
+        for row in rows:
+            start = starts[row]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for end, other in active:
+                a, b = event_of[other], event_of[row]
+                conflicts.append(
+                    Conflict(
+                        resource,
+                        date.fromordinal(occurrences.ordinal[row]),
+                        f"{events[a].course_id}-{year}-{semester}-lesson-{lessons[other]}@hm.edu",
+                        f"{events[b].course_id}-{year}-{semester}-lesson-{lessons[row]}@hm.edu",
+                        EPOCH + timedelta(seconds=start),
+                        EPOCH + timedelta(seconds=min(end, ends[row])),
+                        a,
+                        b,
+                    )
+                )
+            heapq.heappush(active, (ends[row], row))
+
+    conflicts.sort(key=lambda c: (c.start, c.resource, c.uid, c.other_uid))
+    return conflicts
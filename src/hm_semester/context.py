@@ -0,0 +1,52 @@
+"""Per-run state shared by all events of one calendar generation."""
+
+from datetime import date, datetime, time
+
+from .cache import get_utc_offset_table
+from .offsets import UTC, UtcOffsetTable
+
+
+class GenerationContext:
+    """
+    Run timestamp and UTC offset tables for one calendar.
+
+    Creating the context once per call keeps clock calls and time zone lookups
+    out of the per-lecture loop. Passing a fixed ``dtstamp`` makes the output
+    reproducible: identical inputs then yield identical bytes. ``first`` and
+    ``last`` give the date range (usually the semester) that local lecture
+    times are converted for.
+    """
+
+    def __init__(
+        self,
+        dtstamp: datetime | None = None,
+        first: date | None = None,
+        last: date | None = None,
+    ):
+        if dtstamp is None:
+            dtstamp = datetime.now(UTC)
+        elif dtstamp.tzinfo is None:
+            # Like icalendar, treat naive timestamps as UTC
+            dtstamp = dtstamp.replace(tzinfo=UTC)
+        else:
+            dtstamp = dtstamp.astimezone(UTC)
+        self.dtstamp: datetime = dtstamp.replace(microsecond=0)
+        self.first = first
+        self.last = last
+        self._tables: dict[str, UtcOffsetTable] = {}
+
+    def offsets(self, tz_name: str) -> UtcOffsetTable:
+        """Return the UTC offset table of a time zone for the context's date range."""
+        table = self._tables.get(tz_name)
+        if table is None:
+            if self.first is None or self.last is None:
+                # Without a range every conversion falls back to zoneinfo
+                table = UtcOffsetTable(tz_name)
+            else:
+                table = get_utc_offset_table(tz_name, self.first, self.last)
+            self._tables[tz_name] = table
+        return table
+
+    def to_utc(self, day: date, local_time: time, tz_name: str) -> datetime:
+        """Convert a local date and time in ``tz_name`` to a UTC datetime."""
+        return self.offsets(tz_name).to_utc(day, local_time)
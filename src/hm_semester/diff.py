@@ -0,0 +1,114 @@
+"""Incremental agenda updates.
+
+When only a few events change, re-rendering and re-uploading the complete
+agenda is wasteful. :func:`diff_agenda` compares two event lists lesson by
+lesson (using the deterministic lesson UIDs) and emits only what changed.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Literal
+
+from .agenda import _lecture_template, _prodid
+from .cache import get_semester_holiday_calendar, get_semester_info
+from .context import GenerationContext
+from .ical import CALENDAR_FOOTER, calendar_header, cancelled_event
+from .schedule import calculate_lecture_dates_bulk
+from .types import WeeklyEvent
+
+# UID -> (event, lesson number, UTC start, UTC end)
+Lessons = dict[str, tuple[WeeklyEvent, int, datetime, datetime]]
+
+
+@dataclass
+class AgendaDiff:
+    added: list[str] = field(default_factory=list)  # UIDs of new lessons
+    removed: list[str] = field(default_factory=list)  # UIDs of dropped lessons
+    changed: list[str] = field(default_factory=list)  # UIDs of modified lessons
+    update: bytes = b""  # VCALENDAR with the added and changed VEVENTs
+    cancel: bytes = b""  # METHOD:CANCEL VCALENDAR for the removed lessons
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _lessons(
+    events: list[WeeklyEvent], year: int, semester: str, lang: str, ctx: GenerationContext
+) -> Lessons:
+    """Return all lessons of the events keyed by their UID."""
+    info = get_semester_info(year, semester, lang)
+    holidays = get_semester_holiday_calendar(year, semester, lang)
+    lessons: Lessons = {}
+    for ev, lecture_dates in zip(events, calculate_lecture_dates_bulk(events, info, holidays)):
+        for lesson_num, lecture_date in enumerate(lecture_dates, start=1):
+            uid = f"{ev.course_id}-{year}-{semester}-lesson-{lesson_num}@hm.edu"
+            lessons[uid] = (
+                ev,
+                lesson_num,
+                ctx.to_utc(lecture_date, ev.start_time, ev.timezone),
+                ctx.to_utc(lecture_date, ev.end_time, ev.timezone),
+            )
+    return lessons
+
+
+def _lesson_fields(lesson: tuple[WeeklyEvent, int, datetime, datetime]) -> tuple:
+    """Return everything that ends up in a lesson's VEVENT, apart from timestamps."""
+    ev, lesson_num, dtstart, dtend = lesson
+    return ev.summary, ev.location, ev.sequence, lesson_num, dtstart, dtend
+
+
+def diff_agenda(
+    old_events: list[WeeklyEvent],
+    new_events: list[WeeklyEvent],
+    year: int,
+    lang: Literal["de", "en"],
+    semester: Literal["winter", "summer"],
+    dtstamp: datetime | None = None,
+) -> AgendaDiff:
+    """
+    Compare two versions of an agenda and render only the differences.
+
+    ``update`` contains the VEVENTs of added and changed lessons as they appear
+    in ``create_agenda(new_events, ...)``. Remember to bump
+    ``WeeklyEvent.sequence`` for changed events so clients apply the update.
+    ``cancel`` is a METHOD:CANCEL calendar with one cancelled VEVENT per removed
+    lesson, using the old sequence number plus one. Both are empty when there
+    is nothing to send.
+    """
+    info = get_semester_info(year, semester, lang)
+    ctx = GenerationContext(dtstamp, info.start_date, info.end_date)
+    old = _lessons(old_events, year, semester, lang, ctx)
+    new = _lessons(new_events, year, semester, lang, ctx)
+
+    diff = AgendaDiff()
+    emit = []  # added and changed lessons in agenda order
+    for uid, lesson in new.items():
+        if uid not in old:
+            diff.added.append(uid)
+            emit.append(uid)
+        elif _lesson_fields(old[uid]) != _lesson_fields(lesson):
+            diff.changed.append(uid)
+            emit.append(uid)
+    diff.removed = [uid for uid in old if uid not in new]
+
+    if emit:
+        templates = {}
+        chunks = [calendar_header(_prodid(lang))]
+        for uid in emit:
+            ev, lesson_num, dtstart, dtend = new[uid]
+            template = templates.get(id(ev))
+            if template is None:
+                template = templates[id(ev)] = _lecture_template(ev, year, semester, ctx)
+            chunks.append(template.render(lesson_num, dtstart, dtend))
+        chunks.append(CALENDAR_FOOTER)
+        diff.update = b"".join(chunks)
+
+    if diff.removed:
+        chunks = [calendar_header(_prodid(lang), method="CANCEL")]
+        for uid in diff.removed:
+            ev, _, dtstart, dtend = old[uid]
+            chunks.append(cancelled_event(uid, ev.sequence + 1, dtstart, dtend, ctx.dtstamp))
+        chunks.append(CALENDAR_FOOTER)
+        diff.cancel = b"".join(chunks)
+
+    return diff
@@ -0,0 +1,268 @@
+"""Minimal iCalendar (RFC 5545) serialization helpers.
+
+These produce the same bytes as ``icalendar``'s ``to_ical()`` for the
+properties used by this package, without building a component tree.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from .offsets import UTC, UtcOffsetTable
+
+CRLF = b"\r\n"
+FOLD_LIMIT = 75
+
+
+def escape_text(text: str) -> str:
+    """Escape a TEXT value (backslash, semicolon, comma and newlines)."""
+    return (
+        text.replace(r"\N", "\n")
+        .replace("\\", "\\\\")
+        .replace(";", r"\;")
+        .replace(",", r"\,")
+        .replace("\r\n", r"\n")
+        .replace("\n", r"\n")
+        .replace("\r", r"\n")
+    )
+
+
+_ESCAPED = re.compile(r"\\([\\;,nN])")
+
+
+def unescape_text(value: str) -> str:
+    """Decode a TEXT value escaped by :func:`escape_text`."""
+    if "\\" not in value:
+        return value
+    return _ESCAPED.sub(lambda m: "\n" if m[1] in "nN" else m[1], value)
+
+
+def fold_line(line: str) -> str:
+    """
+    Fold a content line so no physical line exceeds 75 octets.
+
+    Folds never separate a backslash or caret from the character it escapes.
+    """
+    if len(line) < FOLD_LIMIT and line.isascii():
+        return line
+
+    folded: list[str] = []
+    current: list[str] = []
+    byte_count = 0
+    for char in line:
+        char_len = len(char.encode("utf-8"))
+        if current and byte_count + char_len >= FOLD_LIMIT:
+            if len(current) > 1 and current[-1] in "\\^":
+                escaped_prefix = current.pop()
+                folded.append("".join(current))
+                current = [escaped_prefix]
+                byte_count = len(escaped_prefix)
+            else:
+                folded.append("".join(current))
+                current = []
+                byte_count = 0
+        current.append(char)
+        byte_count += char_len
+    if current:
+        folded.append("".join(current))
+    return "\r\n ".join(folded)
+
+
+def content_line(name: str, value: str) -> bytes:
+    """Return a folded, CRLF-terminated content line for an already encoded value."""
+    return fold_line(f"{name}:{value}").encode("utf-8") + CRLF
+
+
+def text_line(name: str, text: str) -> bytes:
+    """Return a content line for a TEXT property."""
+    return content_line(name, escape_text(text))
+
+
+def calendar_header(prodid: str, method: str | None = None) -> bytes:
+    """Return the opening lines of a VCALENDAR up to its first component."""
+    header = b"BEGIN:VCALENDAR\r\n" + content_line("VERSION", "2.0") + text_line("PRODID", prodid)
+    if method:
+        header += content_line("METHOD", method)
+    return header
+
+
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+def format_date(day: date) -> str:
+    """Format a date as an iCalendar DATE value."""
+    return f"{day.year:04d}{day.month:02d}{day.day:02d}"
+
+
+def format_utc(dt: datetime) -> str:
+    """Format a UTC datetime as an iCalendar DATE-TIME value."""
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+        f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+    )
+
+
+def format_local(dt: datetime) -> str:
+    """Format the wall-clock time of a datetime as a DATE-TIME value without ``Z``."""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+
+def format_offset(offset: timedelta) -> str:
+    """Format a UTC offset as a UTC-OFFSET value (``+0100``)."""
+    sign = "-" if offset < timedelta(0) else "+"
+    seconds = abs(int(offset.total_seconds()))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{sign}{hours:02d}{minutes:02d}" + (f"{seconds:02d}" if seconds else "")
+
+
+def _observance(tz: ZoneInfo, instant: datetime, offset_from: timedelta, offset_to: timedelta) -> bytes:
+    local = instant.astimezone(tz)
+    kind = "DAYLIGHT" if local.dst() else "STANDARD"
+    return b"".join(
+        (
+            content_line("BEGIN", kind),
+            content_line("DTSTART", format_local(instant + offset_from)),
+            content_line("TZOFFSETFROM", format_offset(offset_from)),
+            content_line("TZOFFSETTO", format_offset(offset_to)),
+            text_line("TZNAME", local.tzname()),
+            content_line("END", kind),
+        )
+    )
+
+
+def vtimezone(tz_name: str, first: date, last: date) -> bytes:
+    """
+    Return a VTIMEZONE with the observances of ``tz_name`` between ``first`` and ``last``.
+
+    Transitions are listed explicitly (no RRULE); an initial observance
+    covers the start of the range.
+    """
+    tz = ZoneInfo(tz_name)
+    start = datetime.combine(first, time.min, tzinfo=UTC)
+    initial = start.astimezone(tz).utcoffset()
+    lines = [
+        b"BEGIN:VTIMEZONE\r\n",
+        text_line("TZID", tz_name),
+        _observance(tz, start - initial, initial, initial),
+    ]
+    for instant, offset_from, offset_to in UtcOffsetTable(tz_name, first, last).transitions():
+        if instant > start:
+            lines.append(_observance(tz, instant, offset_from, offset_to))
+    lines.append(b"END:VTIMEZONE\r\n")
+    return b"".join(lines)
+
+
+def recurring_event(
+    summary: str,
+    uid: str,
+    sequence: int,
+    location: str,
+    dtstamp: datetime,
+    tz_name: str,
+    dtstart: datetime,
+    dtend: datetime,
+    rrule: str | None = None,
+    exdates: list[datetime] = (),
+    rdates: list[datetime] = (),
+) -> bytes:
+    """
+    Return a VEVENT recurring by ``rrule`` and/or ``rdates``.
+
+    ``dtstart``, ``dtend``, ``exdates`` and ``rdates`` are wall-clock times in
+    ``tz_name``; a VTIMEZONE for it must be part of the calendar.
+    """
+    tzid = f"TZID={tz_name}"
+    stamp = format_utc(dtstamp)
+    lines = [
+        b"BEGIN:VEVENT\r\n",
+        text_line("SUMMARY", summary),
+        content_line(f"DTSTART;{tzid}", format_local(dtstart)),
+        content_line(f"DTEND;{tzid}", format_local(dtend)),
+        content_line("DTSTAMP", stamp),
+        text_line("UID", uid),
+        content_line("SEQUENCE", str(sequence)),
+    ]
+    if sequence > 0:
+        lines.append(content_line("LAST-MODIFIED", stamp))
+    if rrule:
+        lines.append(content_line("RRULE", rrule))
+    if exdates:
+        lines.append(content_line(f"EXDATE;{tzid}", ",".join(map(format_local, exdates))))
+    if rdates:
+        lines.append(content_line(f"RDATE;{tzid}", ",".join(map(format_local, rdates))))
+    if location:
+        lines.append(text_line("LOCATION", location))
+    lines.append(b"END:VEVENT\r\n")
+    return b"".join(lines)
+
+
+class LectureTemplate:
+    """
+    Precompiled serializer for the fixed-shape VEVENT of one lecture series.
+
+    Everything that does not depend on the lesson (escaped summary and UID
+    parts, DTSTAMP, SEQUENCE, LAST-MODIFIED, LOCATION) is encoded once, so
+    rendering a lesson only formats its number and UTC start/end times.
+    The properties are emitted in the order ``icalendar`` uses.
+    """
+
+    __slots__ = ("_summary", "_uid_prefix", "_uid_suffix", "_dtstamp", "_tail")
+
+    def __init__(
+        self,
+        summary: str,
+        uid_prefix: str,
+        uid_suffix: str,
+        sequence: int,
+        location: str,
+        dtstamp: datetime,
+    ):
+        # Lesson numbers are plain digits, so escaping the parts suffices
+        self._summary = "SUMMARY:" + escape_text(summary)
+        self._uid_prefix = "UID:" + escape_text(uid_prefix)
+        self._uid_suffix = escape_text(uid_suffix)
+        stamp = format_utc(dtstamp)
+        self._dtstamp = content_line("DTSTAMP", stamp)
+        tail = content_line("SEQUENCE", str(sequence))
+        if sequence > 0:
+            tail += content_line("LAST-MODIFIED", stamp)
+        if location:
+            tail += text_line("LOCATION", location)
+        self._tail = tail + b"END:VEVENT\r\n"
+
+    def render(self, lesson_num: int, dtstart: datetime, dtend: datetime) -> bytes:
+        """Return the VEVENT of one lesson; ``dtstart`` and ``dtend`` must be in UTC."""
+        return b"".join(
+            (
+                b"BEGIN:VEVENT\r\n",
+                fold_line(f"{self._summary} ({lesson_num})").encode("utf-8"),
+                b"\r\nDTSTART:",
+                format_utc(dtstart).encode("ascii"),
+                b"\r\nDTEND:",
+                format_utc(dtend).encode("ascii"),
+                b"\r\n",
+                self._dtstamp,
+                fold_line(f"{self._uid_prefix}{lesson_num}{self._uid_suffix}").encode("utf-8"),
+                b"\r\n",
+                self._tail,
+            )
+        )
+
+
+def cancelled_event(
+    uid: str, sequence: int, dtstart: datetime, dtend: datetime, dtstamp: datetime
+) -> bytes:
+    """Return a STATUS:CANCELLED VEVENT for use in a METHOD:CANCEL calendar."""
+    return b"".join(
+        (
+            b"BEGIN:VEVENT\r\n",
+            content_line("DTSTART", format_utc(dtstart)),
+            content_line("DTEND", format_utc(dtend)),
+            content_line("DTSTAMP", format_utc(dtstamp)),
+            text_line("UID", uid),
+            content_line("SEQUENCE", str(sequence)),
+            content_line("STATUS", "CANCELLED"),
+            b"END:VEVENT\r\n",
+        )
+    )
@@ -0,0 +1,239 @@
+"""
+Read agendas written by :func:`~hm_semester.agenda.create_agenda` back into events.
+
+The file is streamed line by line (unfolding continuation lines on the fly)
+and only the properties needed to rebuild a :class:`WeeklyEvent` are kept,
+so no ``icalendar`` component tree is built. Lessons are grouped by their
+deterministic UID ``{course_id}-{year}-{semester}-lesson-{n}@hm.edu``; the
+weekday and local times are those most of the lessons share, and ``biweekly``,
+``start_week`` and ``max_reps`` are recovered by matching the lesson dates
+against the semester's lecture series.
+"""
+
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from pathlib import Path
+from typing import BinaryIO
+
+from .cache import get_semester_holiday_ordinals, get_semester_info, get_utc_offset_table
+from .ical import unescape_text
+from .offsets import UTC, UtcOffsetTable
+from .schedule import first_lecture_ordinal, lecture_ordinals
+from .types import WeeklyEvent
+
+LESSON_UID = re.compile(
+    r"^(?P<course_id>.+)-(?P<year>\d{4})-(?P<semester>winter|summer)-lesson-(?P<lesson>\d+)@hm\.edu$"
+)
+
+_PROPERTIES = {"UID", "SUMMARY", "DTSTART", "DTEND", "LOCATION", "SEQUENCE"}
+
+
+@dataclass
+class ImportedLesson:
+    course_id: str
+    year: int
+    semester: str
+    lesson: int
+    summary: str  # Without the " (n)" lesson suffix
+    start: datetime  # Local wall-clock time in ``timezone``
+    end: datetime
+    timezone: str
+    location: str = ""
+    sequence: int = 0
+
+
+@dataclass
+class ImportedAgenda:
+    year: int
+    semester: str
+    events: list[WeeklyEvent] = field(default_factory=list)
+    # Course IDs whose lessons fit no weekly series (imported as weekly with max_reps)
+    irregular: list[str] = field(default_factory=list)
+
+
+def iter_content_lines(fp: BinaryIO) -> Iterator[str]:
+    """Yield the unfolded content lines of an iCalendar file."""
+    pending = b""
+    for raw in fp:
+        if raw[0] in (0x20, 0x09):  # Continuation line (space or tab)
+            pending = pending.rstrip(b"\r\n") + raw[1:]
+            continue
+        if pending:
+            yield pending.rstrip(b"\r\n").decode("utf-8")
+        pending = raw
+    if pending.strip():
+        yield pending.rstrip(b"\r\n").decode("utf-8")
+
+
+def _parse_datetime(head: str, value: str, table: UtcOffsetTable) -> tuple[datetime, str]:
+    """Return the wall-clock time and time zone of a DATE-TIME property; UTC values use ``table``."""
+    local = datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15]),
+    )
+    if value[-1] == "Z":
+        return local + table.offset_at(local.replace(tzinfo=UTC)), table.tz_name
+    for param in head.split(";")[1:]:
+        name, _, tz_name = param.partition("=")
+        if name.upper() == "TZID":
+            return local, tz_name.strip('"')
+    return local, table.tz_name
+
+
+def iter_lessons(fp: BinaryIO, timezone: str = "Europe/Berlin") -> Iterator[ImportedLesson]:
+    """
+    Yield every lesson VEVENT of an agenda file.
+
+    UTC times are converted to ``timezone``; times with a ``TZID`` keep their
+    zone. Events whose UID does not follow the lesson pattern are skipped.
+    """
+    props: dict[str, tuple[str, str]] | None = None
+    # Lessons in the same time slot share their DTSTART/DTEND values
+    times: dict[tuple[str, str, int, str], tuple[datetime, str]] = {}
+    for line in iter_content_lines(fp):
+        if props is None:
+            if line == "BEGIN:VEVENT":
+                props = {}
+            continue
+        if line == "END:VEVENT":
+            lesson = _lesson(props, timezone, times)
+            props = None
+            if lesson is not None:
+                yield lesson
+            continue
+        head, _, value = line.partition(":")
+        name = head.partition(";")[0].upper()
+        if name in _PROPERTIES:
+            props[name] = head, value
+
+
+def _lesson(
+    props: dict[str, tuple[str, str]],
+    timezone: str,
+    times: dict[tuple[str, str, int, str], tuple[datetime, str]],
+) -> ImportedLesson | None:
+    """Return the lesson of a VEVENT's properties, or None for other events."""
+    if "UID" not in props or "DTSTART" not in props or "DTEND" not in props:
+        return None
+    match = LESSON_UID.match(unescape_text(props["UID"][1]))
+    if match is None:
+        return None
+    lesson = int(match["lesson"])
+    summary = unescape_text(props.get("SUMMARY", ("", ""))[1])
+    summary = summary.removesuffix(f" ({lesson})")
+    year, semester = int(match["year"]), match["semester"]
+    parsed = []
+    for name in ("DTSTART", "DTEND"):
+        key = (*props[name], year, semester)
+        if key not in times:
+            info = get_semester_info(year, semester, "en")
+            table = get_utc_offset_table(timezone, info.start_date, info.end_date)
+            times[key] = _parse_datetime(*props[name], table)
+        parsed.append(times[key])
+    (start, tz_name), (end, _) = parsed
+    return ImportedLesson(
+        match["course_id"],
+        year,
+        semester,
+        lesson,
+        summary,
+        start,
+        end,
+        tz_name,
+        unescape_text(props.get("LOCATION", ("", ""))[1]),
+        int(props.get("SEQUENCE", ("", "0"))[1]),
+    )
+
+
+def _rendered(offsets: UtcOffsetTable, day: datetime, local_time: time) -> datetime:
+    """Return the wall-clock time an agenda shows for ``local_time`` on ``day``."""
+    utc = offsets.to_utc(day.date(), local_time)
+    return (utc + offsets.offset_at(utc)).replace(tzinfo=None)
+
+
+def _infer_event(
+    lessons: list[ImportedLesson], year: int, semester: str
+) -> tuple[WeeklyEvent, bool]:
+    """Rebuild the event of one course's lessons; the flag is False if no series matched."""
+    lessons.sort(key=lambda lesson: lesson.lesson)
+    first = lessons[0]
+    # Lessons at local times skipped by a DST switch were moved, so take the
+    # most common slot rather than the first lesson's
+    slots = Counter(
+        (lesson.start.weekday(), lesson.start.time(), lesson.end.time()) for lesson in lessons
+    )
+    (weekday, start_time, end_time), _ = slots.most_common(1)[0]
+    ordinals = [lesson.start.toordinal() for lesson in lessons]
+
+    info = get_semester_info(year, semester, "en")
+    start_ord, end_ord = info.start_date.toordinal(), info.end_date.toordinal()
+    start_week = (ordinals[0] - first_lecture_ordinal(start_ord, weekday)) // 7 + 1
+    offsets = get_utc_offset_table(first.timezone, info.start_date, info.end_date)
+    regular = start_week >= 1 and all(
+        lesson.lesson == n
+        and lesson.timezone == first.timezone
+        and lesson.start == _rendered(offsets, lesson.start, start_time)
+        and lesson.end == _rendered(offsets, lesson.start, end_time)
+        for n, lesson in enumerate(lessons, start=1)
+    )
+    biweekly, max_reps = False, len(ordinals)
+    if regular:
+        holiday_ords = get_semester_holiday_ordinals(year, semester, "en")
+        for biweekly in (False, True):
+            series = lecture_ordinals(start_ord, end_ord, weekday, holiday_ords, biweekly, start_week)
+            if series[: len(ordinals)] == ordinals:
+                max_reps = None if len(series) == len(ordinals) else len(ordinals)
+                break
+        else:
+            biweekly, regular = False, False
+    event = WeeklyEvent(
+        first.summary,
+        first.course_id,
+        weekday,
+        start_time,
+        end_time,
+        location=first.location,
+        biweekly=biweekly,
+        start_week=max(start_week, 1),
+        max_reps=max_reps,
+        timezone=first.timezone,
+        sequence=max(lesson.sequence for lesson in lessons),
+    )
+    return event, regular
+
+
+def group_lessons(lessons: Iterable[ImportedLesson]) -> list[ImportedAgenda]:
+    """Rebuild the events of streamed lessons, one agenda per semester in file order."""
+    courses: dict[tuple[int, str], dict[str, list[ImportedLesson]]] = {}
+    for lesson in lessons:
+        semester = courses.setdefault((lesson.year, lesson.semester), {})
+        semester.setdefault(lesson.course_id, []).append(lesson)
+
+    agendas = []
+    for (year, semester), by_course in courses.items():
+        agenda = ImportedAgenda(year, semester)
+        for course_id, course_lessons in by_course.items():
+            event, regular = _infer_event(course_lessons, year, semester)
+            agenda.events.append(event)
+            if not regular:
+                agenda.irregular.append(course_id)
+        agendas.append(agenda)
+    return agendas
+
+
+def read_agendas(path: str | os.PathLike, timezone: str = "Europe/Berlin") -> list[ImportedAgenda]:
+    """Read the events of every semester in an agenda file."""
+    with open(path, "rb") as fp:
+        return group_lessons(iter_lessons(fp, timezone))
+
+
+def read_agenda(path: str | os.PathLike, timezone: str = "Europe/Berlin") -> ImportedAgenda:
+    """Read the events of a single-semester agenda file."""
+    agendas = read_agendas(path, timezone)
+    if len(agendas) != 1:
+        raise ValueError(f"Expected one semester in {Path(path).name}, found {len(agendas)}")
+    return agendas[0]
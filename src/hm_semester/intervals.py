@@ -0,0 +1,150 @@
+"""Compact holiday representation as merged, sorted day intervals."""
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+from .types import SemesterInfo
+from .util import get_public_holidays, semester_public_holidays, semester_years
+
+
+class HolidayCalendar:
+    """
+    A set of days stored as merged, sorted, inclusive ordinal intervals.
+
+    Breaks are kept as one interval instead of one ``date`` per day, and single
+    public holidays are intervals of length one. Membership tests and range
+    queries use binary search, intersections and unions a linear merge.
+    Iterating yields the individual dates, so a ``HolidayCalendar`` can be
+    used wherever a set of holiday dates is expected.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(
+        self,
+        intervals: Iterable[tuple[date, date]] = (),
+        points: Iterable[date] = (),
+    ):
+        spans = [(start.toordinal(), end.toordinal()) for start, end in intervals if start <= end]
+        spans.extend((day.toordinal(), day.toordinal()) for day in points)
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._extend_merged(sorted(spans))
+
+    @classmethod
+    def _from_spans(cls, spans: Iterable[tuple[int, int]]) -> "HolidayCalendar":
+        """Create a calendar from ordinal spans sorted by start."""
+        calendar = cls.__new__(cls)
+        calendar._starts = []
+        calendar._ends = []
+        calendar._extend_merged(spans)
+        return calendar
+
+    @classmethod
+    def from_semester(cls, info: SemesterInfo, backend: str | None = None) -> "HolidayCalendar":
+        """Return the breaks and public holidays of a semester (see ``get_holiday_dates``)."""
+        public = get_public_holidays(semester_years(info), backend)
+        return cls(info.breaks.values(), semester_public_holidays(info, public))
+
+    @classmethod
+    def from_semesters(
+        cls, infos: list[SemesterInfo], backend: str | None = None
+    ) -> list["HolidayCalendar"]:
+        """
+        Return the holidays of many semesters (see ``get_holiday_dates_range``).
+
+        The public holidays of all covered years are computed in a single sweep.
+        """
+        years = set().union(*map(semester_years, infos))
+        public = get_public_holidays(years, backend) if years else []
+        return [cls(info.breaks.values(), semester_public_holidays(info, public)) for info in infos]
+
+    def _extend_merged(self, spans: Iterable[tuple[int, int]]) -> None:
+        starts, ends = self._starts, self._ends
+        for start, end in spans:
+            # Merge overlapping and adjacent intervals
+            if ends and start <= ends[-1] + 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+
+    def contains_ordinal(self, ordinal: int) -> bool:
+        """Return whether the day with the given ordinal is a holiday."""
+        i = bisect_right(self._starts, ordinal) - 1
+        return i >= 0 and ordinal <= self._ends[i]
+
+    def __contains__(self, day: object) -> bool:
+        return isinstance(day, date) and self.contains_ordinal(day.toordinal())
+
+    def intervals(self) -> list[tuple[date, date]]:
+        """Return the merged intervals as ``(first, last)`` date pairs."""
+        return [
+            (date.fromordinal(start), date.fromordinal(end))
+            for start, end in zip(self._starts, self._ends)
+        ]
+
+    def between(self, first: date, last: date) -> "HolidayCalendar":
+        """Return the holidays from ``first`` to ``last`` (inclusive)."""
+        lo, hi = first.toordinal(), last.toordinal()
+        i = max(bisect_right(self._starts, lo) - 1, 0)
+        j = bisect_right(self._starts, hi)
+        return HolidayCalendar._from_spans(
+            (max(start, lo), min(end, hi))
+            for start, end in zip(self._starts[i:j], self._ends[i:j])
+            if end >= lo
+        )
+
+    def __and__(self, other: "HolidayCalendar") -> "HolidayCalendar":
+        spans = []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            end = min(self._ends[i], other._ends[j])
+            if start <= end:
+                spans.append((start, end))
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return HolidayCalendar._from_spans(spans)
+
+    def __or__(self, other: "HolidayCalendar") -> "HolidayCalendar":
+        spans = sorted(
+            list(zip(self._starts, self._ends)) + list(zip(other._starts, other._ends))
+        )
+        return HolidayCalendar._from_spans(spans)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HolidayCalendar):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def ordinals(self, first: int | None = None, last: int | None = None) -> list[int]:
+        """Return the sorted ordinals of all holidays, optionally limited to a range."""
+        result = []
+        for start, end in zip(self._starts, self._ends):
+            if first is not None:
+                start = max(start, first)
+            if last is not None:
+                end = min(end, last)
+            result.extend(range(start, end + 1))
+        return result
+
+    def __iter__(self) -> Iterator[date]:
+        return (date.fromordinal(o) for o in self.ordinals())
+
+    def to_set(self) -> set[date]:
+        """Materialize the holidays as a set of dates."""
+        return set(self)
+
+    def __repr__(self) -> str:
+        return f"HolidayCalendar({self.intervals()!r})"
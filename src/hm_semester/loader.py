@@ -0,0 +1,405 @@
+"""
+Streaming, validating timetable loader for CSV, JSON and JSONL files.
+
+Each record describes one :class:`WeeklyEvent`. Required fields are
+``summary``, ``course_id``, ``weekday`` (0=Monday), ``start_time`` and
+``end_time`` (``HH:MM`` or ``H:MM``); optional fields are ``calendar`` and the remaining
+event fields. Invalid records are skipped and reported as :class:`RowError`.
+Records are validated in batches, column by column; values repeat a lot in
+real timetables, so each distinct value of a column is parsed only once.
+"""
+
+import csv
+import json
+import os
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .types import WeeklyEvent
+
+FORMATS = {".csv": "csv", ".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+_TRUE = {"1", "true", "yes", "y", "x"}
+_FALSE = {"", "0", "false", "no", "n"}
+
+
+@dataclass
+class RowError:
+    row: int  # 1-based record number (line number for CSV and JSONL)
+    field: str | None
+    message: str
+
+    def __str__(self) -> str:
+        where = f"row {self.row}" + (f", {self.field}" if self.field else "")
+        return f"{where}: {self.message}"
+
+
+class TimetableError(ValueError):
+    """Raised by :meth:`LoadResult.raise_for_errors` for invalid timetables."""
+
+    def __init__(self, errors: list[RowError]):
+        self.errors = errors
+        shown = "; ".join(map(str, errors[:5]))
+        more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} invalid timetable rows: {shown}{more}")
+
+
+@dataclass
+class LoadResult:
+    timetables: dict[str, list[WeeklyEvent]] = field(default_factory=dict)
+    errors: list[RowError] = field(default_factory=list)
+
+    @property
+    def events(self) -> list[WeeklyEvent]:
+        """All valid events, in file order per calendar."""
+        return [ev for events in self.timetables.values() for ev in events]
+
+    def raise_for_errors(self) -> None:
+        """Raise :class:`TimetableError` if any record was invalid."""
+        if self.errors:
+            raise TimetableError(self.errors)
+
+
+def _parse_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"not an integer: {value!r}") from None
+
+
+def _parse_weekday(value: str) -> int:
+    weekday = _parse_int(value)
+    if not 0 <= weekday <= 6:
+        raise ValueError(f"weekday must be 0 (Monday) to 6 (Sunday), got {weekday}")
+    return weekday
+
+
+_TIME = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+
+
+def _parse_time(value: str) -> time:
+    match = _TIME.fullmatch(value)
+    try:
+        if match is None:
+            raise ValueError
+        return time(int(match[1]), int(match[2]), int(match[3] or 0))
+    except ValueError:
+        raise ValueError(f"not a time (HH:MM): {value!r}") from None
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _parse_positive(value: str) -> int:
+    number = _parse_int(value)
+    if number < 1:
+        raise ValueError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parse_sequence(value: str) -> int:
+    number = _parse_int(value)
+    if number < 0:
+        raise ValueError(f"must not be negative, got {number}")
+    return number
+
+
+def _parse_timezone(value: str) -> str:
+    try:
+        ZoneInfo(value)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"unknown time zone: {value!r}") from None
+    return value
+
+
+_REQUIRED = object()
+
+# Field name, parser (None keeps the text) and value for empty cells
+_FIELDS: tuple[tuple[str, Callable[[str], Any] | None, Any], ...] = (
+    ("summary", None, _REQUIRED),
+    ("course_id", None, _REQUIRED),
+    ("weekday", _parse_weekday, _REQUIRED),
+    ("start_time", _parse_time, _REQUIRED),
+    ("end_time", _parse_time, _REQUIRED),
+    ("location", None, ""),
+    ("biweekly", _parse_bool, False),
+    ("start_week", _parse_positive, 1),
+    ("max_reps", _parse_positive, None),
+    ("timezone", _parse_timezone, "Europe/Berlin"),
+    ("sequence", _parse_sequence, 0),
+)
+
+
+_BATCH_SIZE = 8192
+
+
+class TimetableLoader:
+    """
+    Convert timetable records to events, collecting errors in :attr:`errors`.
+
+    Records are converted in batches, one column at a time: each distinct
+    cell text of a column is parsed once and the results are mapped back onto
+    the rows. ``course_id`` must be unique per calendar, since it determines
+    the lesson UIDs. ``event_type`` may be
+    :class:`~hm_semester.types.FrozenWeeklyEvent` for large timetables.
+    """
+
+    def __init__(self, event_type: type = WeeklyEvent):
+        self.event_type = event_type
+        self.errors: list[RowError] = []
+        # Per parsed column: cell text to parsed value, and to error message
+        self._values: dict[str, dict[str, Any]] = {name: {} for name, parser, _ in _FIELDS if parser}
+        self._invalid: dict[str, dict[str, str]] = {name: {} for name, parser, _ in _FIELDS if parser}
+        self._seen: set[tuple[str, str]] = set()
+
+    def _parse_column(
+        self, name: str, parser: Callable[[str], Any], default: Any, cells: Sequence[str]
+    ) -> tuple[list[Any], set[str]]:
+        """Return the parsed cells of a column (None if invalid) and the invalid cell texts."""
+        values = self._values[name]
+        invalid = self._invalid[name]
+        distinct = set(cells)
+        for text in distinct.difference(values, invalid):
+            stripped = text.strip()
+            if not stripped:
+                if default is _REQUIRED:
+                    invalid[text] = "missing value"
+                else:
+                    values[text] = default
+                continue
+            try:
+                values[text] = parser(stripped)
+            except ValueError as exc:
+                invalid[text] = str(exc)
+        return list(map(values.get, cells)), distinct.intersection(invalid)
+
+    def convert_columns(
+        self, rows: Sequence[int], columns: Mapping[str, Sequence[str]]
+    ) -> list[tuple[str, WeeklyEvent]]:
+        """
+        Return ``(calendar, event)`` for every valid row of a batch, recording the errors.
+
+        ``rows`` are the record numbers and ``columns`` map field names to
+        equally long sequences of cell texts; absent columns are empty.
+        """
+        n = len(rows)
+        blank = ("",) * n
+        errors: list[tuple[int, int, RowError]] = []  # (index, order, error)
+        parsed = []
+        for order, (name, parser, default) in enumerate(_FIELDS):
+            cells = columns.get(name) or blank
+            if parser is None:
+                values = list(map(str.strip, cells))
+                if default is _REQUIRED and not all(values):
+                    errors += [
+                        (i, order, RowError(rows[i], name, "missing value"))
+                        for i, value in enumerate(values)
+                        if not value
+                    ]
+            else:
+                values, bad = self._parse_column(name, parser, default, cells)
+                if bad:
+                    messages = self._invalid[name]
+                    errors += [
+                        (i, order, RowError(rows[i], name, messages[cell]))
+                        for i, cell in enumerate(cells)
+                        if cell in bad
+                    ]
+            parsed.append(values)
+
+        order = len(_FIELDS)
+        times = list(zip(parsed[3], parsed[4]))  # start_time, end_time
+        # Few distinct time slots, so check each (start, end) pair once
+        backwards = {t for t in set(times) if None not in t and t[0] >= t[1]}
+        if backwards:
+            errors += [
+                (i, order, RowError(rows[i], "end_time", "end_time must be after start_time"))
+                for i, t in enumerate(times)
+                if t in backwards
+            ]
+        invalid_rows = {i for i, _, _ in errors}
+        calendars = list(map(str.strip, columns.get("calendar") or blank))
+        keys = list(zip(calendars, parsed[1]))
+        seen = self._seen
+        if not errors and len(set(keys)) == n and seen.isdisjoint(keys):
+            seen.update(keys)
+        else:
+            for i, key in enumerate(keys):
+                if not key[1]:
+                    continue
+                if key in seen:
+                    errors.append((i, order + 1, RowError(rows[i], "course_id", f"duplicate course_id {key[1]!r}")))
+                elif i not in invalid_rows:
+                    seen.add(key)
+
+        if not errors:
+            return list(zip(calendars, map(self.event_type, *parsed)))
+        errors.sort(key=lambda e: (e[0], e[1]))
+        self.errors.extend(error for _, _, error in errors)
+        invalid_rows.update(i for i, _, _ in errors)
+        return [
+            (calendars[i], self.event_type(*(column[i] for column in parsed)))
+            for i in range(n)
+            if i not in invalid_rows
+        ]
+
+    def convert(self, row: int, record: Mapping[str, Any]) -> tuple[str, WeeklyEvent] | None:
+        """Return ``(calendar, event)`` for one record, or None after recording its errors."""
+        converted = self.convert_columns([row], _columns([record]))
+        return converted[0] if converted else None
+
+    def iter_records(
+        self, records: Iterable[tuple[int, Mapping[str, Any]]]
+    ) -> Iterator[tuple[str, WeeklyEvent]]:
+        """Yield ``(calendar, event)`` for every valid ``(row, record)`` pair."""
+        return self._iter_batches(_record_batches(records))
+
+    def iter_file(self, fp: TextIO, format: str) -> Iterator[tuple[str, WeeklyEvent]]:
+        """Yield ``(calendar, event)`` for every valid record of an open text file."""
+        return self._iter_batches(_batches(fp, format, self.errors))
+
+    def _iter_batches(
+        self, batches: Iterable[tuple[Sequence[int], Mapping[str, Sequence[str]]]]
+    ) -> Iterator[tuple[str, WeeklyEvent]]:
+        for rows, columns in batches:
+            yield from self.convert_columns(rows, columns)
+
+
+_COLUMNS = ("calendar",) + tuple(name for name, _, _ in _FIELDS)
+
+
+def _columns(records: Sequence[Mapping[str, Any]]) -> dict[str, list[str]]:
+    """Return the cell texts of JSON-like records by column."""
+    columns = {}
+    for name in _COLUMNS:
+        values = [record.get(name) for record in records]
+        columns[name] = [
+            value if type(value) is str else ("" if value is None else str(value)) for value in values
+        ]
+    return columns
+
+
+def _record_batches(
+    records: Iterable[tuple[int, Mapping[str, Any]]],
+) -> Iterator[tuple[list[int], dict[str, list[str]]]]:
+    """Group ``(row, record)`` pairs into column batches."""
+    records = iter(records)
+    while batch := list(islice(records, _BATCH_SIZE)):
+        yield [row for row, _ in batch], _columns([record for _, record in batch])
+
+
+def _csv_batches(fp: TextIO) -> Iterator[tuple[list[int], dict[str, Sequence[str]]]]:
+    """Yield the rows of a CSV file in column batches."""
+    reader = csv.reader(fp)
+    header = [name.strip() for name in next(reader, [])]
+    width = len(header)
+    padding = [""] * width
+    line_num = reader.line_num
+    while True:
+        batch = list(islice(reader, _BATCH_SIZE))
+        if not batch:
+            return
+        if reader.line_num - line_num == len(batch):
+            # One line per record: rows are numbered consecutively
+            rows = list(range(line_num + 1, reader.line_num + 1))
+        else:
+            # Quoted cells span lines; count them to number the rows
+            rows = []
+            for cells in batch:
+                line_num += 1 + sum(cell.count("\n") for cell in cells)
+                rows.append(line_num)
+        line_num = reader.line_num
+        if set(map(len, batch)) != {width}:
+            # Skip blank lines and pad or cut rows to the header's width
+            kept = [(row, cells) for row, cells in zip(rows, batch) if cells]
+            rows = [row for row, _ in kept]
+            batch = [cells if len(cells) == width else (cells + padding)[:width] for _, cells in kept]
+        if rows:
+            yield rows, dict(zip(header, zip(*batch)))
+
+
+def _records(fp: TextIO, format: str, errors: list[RowError]) -> Iterator[tuple[int, Mapping[str, Any]]]:
+    """Yield ``(row, record)`` pairs of a JSON or JSONL file."""
+    if format == "jsonl":
+        for line_num, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                errors.append(RowError(line_num, None, f"invalid JSON: {exc.msg}"))
+                continue
+            if not isinstance(record, dict):
+                errors.append(RowError(line_num, None, "record is not an object"))
+                continue
+            yield line_num, record
+    elif format == "json":
+        data = json.load(fp)
+        records = data.get("events") if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            raise ValueError("JSON timetable must be a list of records or an object with an 'events' list")
+        for row, record in enumerate(records, start=1):
+            if not isinstance(record, dict):
+                errors.append(RowError(row, None, "record is not an object"))
+                continue
+            yield row, record
+    else:
+        raise ValueError(f"Unknown timetable format: {format}")
+
+
+def _batches(
+    fp: TextIO, format: str, errors: list[RowError]
+) -> Iterator[tuple[Sequence[int], Mapping[str, Sequence[str]]]]:
+    """Yield the records of a CSV, JSON or JSONL file in column batches."""
+    if format == "csv":
+        return _csv_batches(fp)
+    return _record_batches(_records(fp, format, errors))
+
+
+def iter_timetable(
+    path: str | os.PathLike,
+    format: str | None = None,
+    loader: TimetableLoader | None = None,
+) -> Iterator[tuple[str, WeeklyEvent]]:
+    """
+    Stream ``(calendar, event)`` pairs from a timetable file.
+
+    ``format`` (``"csv"``, ``"json"`` or ``"jsonl"``) defaults to the file
+    suffix. Errors are collected in ``loader.errors``. JSON documents (a list
+    of records or ``{"events": [...]}``) are parsed as a whole; CSV and JSONL
+    are read line by line.
+    """
+    path = Path(path)
+    if format is None:
+        format = FORMATS.get(path.suffix.lower())
+        if format is None:
+            raise ValueError(f"Cannot infer timetable format from {path.name}")
+    loader = loader or TimetableLoader()
+    # utf-8-sig drops the byte order mark of Excel exports
+    with open(path, newline="", encoding="utf-8-sig") as fp:
+        yield from loader.iter_file(fp, format)
+
+
+def load_timetable(
+    path: str | os.PathLike, format: str | None = None, event_type: type = WeeklyEvent
+) -> LoadResult:
+    """Load a timetable file into one event list per calendar plus all row errors."""
+    loader = TimetableLoader(event_type)
+    timetables: dict[str, list[WeeklyEvent]] = defaultdict(list)
+    for calendar, event in iter_timetable(path, format, loader):
+        timetables[calendar].append(event)
+    # Errors are collected per batch; report them in file order
+    return LoadResult(dict(timetables), sorted(loader.errors, key=lambda error: error.row))
@@ -0,0 +1,126 @@
+"""
+Columnar storage of scheduled lectures.
+
+An :class:`OccurrenceTable` keeps one row per lecture in parallel
+:mod:`array` columns instead of one object per lecture, so a timetable with
+hundreds of thousands of lectures needs 26 bytes per occurrence (event
+index, ordinal, lesson number, start and end) plus 8 bytes per event.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+from .context import GenerationContext
+from .intervals import HolidayCalendar
+from .offsets import UTC
+from .schedule import calculate_lecture_dates_bulk
+from .types import SemesterInfo, WeeklyEvent
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class Occurrence(NamedTuple):
+    event: int  # Index into OccurrenceTable.events
+    ordinal: int  # Lecture date as date.toordinal()
+    lesson: int  # 1-based lesson number within the event
+    start: int  # UTC start in seconds since the epoch
+    end: int  # UTC end in seconds since the epoch
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def dtstart(self) -> datetime:
+        return EPOCH + timedelta(seconds=self.start)
+
+    @property
+    def dtend(self) -> datetime:
+        return EPOCH + timedelta(seconds=self.end)
+
+
+class OccurrenceTable:
+    """
+    All lectures of a list of events within one semester.
+
+    Rows of the same event are contiguous and ordered by lesson number, so
+    :meth:`rows` returns an event's lectures as a slice. Functions that take
+    a prebuilt table :meth:`check` that it belongs to their events and semester.
+    """
+
+    def __init__(self, events: Sequence[WeeklyEvent], info: SemesterInfo):
+        self.events = tuple(events)
+        self.info = info
+        self.event = array("I")
+        self.ordinal = array("i")  # date.max.toordinal() fits in 32 bits
+        self.lesson = array("H")
+        self.start = array("q")
+        self.end = array("q")
+        # Row offsets: the lectures of event i are rows offsets[i]:offsets[i + 1]
+        self._offsets = array("l", [0])
+
+    @classmethod
+    def build(
+        cls,
+        events: Sequence[WeeklyEvent],
+        info: SemesterInfo,
+        holidays: Iterable[date] | HolidayCalendar,
+        ctx: GenerationContext | None = None,
+    ) -> "OccurrenceTable":
+        """Schedule ``events`` within a semester and store their lectures."""
+        if ctx is None:
+            ctx = GenerationContext(None, info.start_date, info.end_date)
+        table = cls(events, info)
+        schedules = calculate_lecture_dates_bulk(table.events, info, holidays)
+        for index, (ev, lecture_dates) in enumerate(zip(table.events, schedules)):
+            offsets = ctx.offsets(ev.timezone)
+            for lesson_num, lecture_date in enumerate(lecture_dates, start=1):
+                table.event.append(index)
+                table.ordinal.append(lecture_date.toordinal())
+                table.lesson.append(lesson_num)
+                table.start.append(_seconds(offsets.to_utc(lecture_date, ev.start_time)))
+                table.end.append(_seconds(offsets.to_utc(lecture_date, ev.end_time)))
+            table._offsets.append(len(table.ordinal))
+        return table
+
+    def check(self, events: Sequence[WeeklyEvent], info: SemesterInfo) -> None:
+        """Raise ValueError unless the table was built for ``events`` within ``info``'s semester."""
+        if (self.info.start_date, self.info.end_date) != (info.start_date, info.end_date):
+            raise ValueError(
+                f"OccurrenceTable was built for the semester starting {self.info.start_date}, "
+                f"not {info.start_date}"
+            )
+        if self.events != tuple(events):
+            raise ValueError("OccurrenceTable was built for different events")
+
+    def __len__(self) -> int:
+        return len(self.ordinal)
+
+    def __getitem__(self, row: int) -> Occurrence:
+        return Occurrence(
+            self.event[row], self.ordinal[row], self.lesson[row], self.start[row], self.end[row]
+        )
+
+    def __iter__(self) -> Iterator[Occurrence]:
+        return map(Occurrence, self.event, self.ordinal, self.lesson, self.start, self.end)
+
+    def rows(self, event_index: int) -> range:
+        """Return the row numbers of one event's lectures."""
+        return range(self._offsets[event_index], self._offsets[event_index + 1])
+
+    def dates(self, event_index: int) -> list[date]:
+        """Return the lecture dates of one event."""
+        rows = self.rows(event_index)
+        return [date.fromordinal(o) for o in self.ordinal[rows.start : rows.stop]]
+
+    def nbytes(self) -> int:
+        """Return the memory used by the columns' data."""
+        columns = (self.event, self.ordinal, self.lesson, self.start, self.end, self._offsets)
+        return sum(len(c) * c.itemsize for c in columns)
+
+
+def _seconds(instant: datetime) -> int:
+    """Return a UTC datetime as whole seconds since the epoch."""
+    return (instant - EPOCH) // timedelta(seconds=1)
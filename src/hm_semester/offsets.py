@@ -0,0 +1,125 @@
+"""Precomputed local-to-UTC offset tables for a date range.
+
+A semester contains at most a couple of DST transitions, so converting
+lecture times to UTC can be reduced to a per-day offset lookup. Only days
+around a transition need a full resolution, which is where ambiguous
+(repeated) and nonexistent (skipped) local times are handled explicitly.
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Literal
+from zoneinfo import ZoneInfo
+
+UTC = ZoneInfo("UTC")
+
+Ambiguous = Literal["earlier", "later", "raise"]
+Nonexistent = Literal["shift_forward", "shift_backward", "raise"]
+
+
+class UtcOffsetTable:
+    """
+    UTC offsets of one time zone for all days between ``first`` and ``last``.
+
+    Local times on days without a transition are converted with one list
+    lookup. Around a transition, local times that occur twice are resolved
+    according to ``ambiguous`` and local times that do not exist according
+    to ``nonexistent``. The defaults (``"earlier"``, ``"shift_forward"``)
+    match ``zoneinfo``'s behavior for ``fold=0``. Days outside the range
+    (or all days, if no range is given) are converted with ``zoneinfo``.
+    """
+
+    def __init__(self, tz_name: str, first: date | None = None, last: date | None = None):
+        self.tz_name = tz_name
+        self.tz = ZoneInfo(tz_name)
+        self._transitions: list[datetime] = []
+        self._offsets: list[timedelta] = []
+        # Per-day offsets; None marks days close to a transition
+        self._days: list[timedelta | None] = []
+        self._first = 0
+        if first is None or last is None or last < first:
+            return
+        self._first = first.toordinal()
+
+        # Sample one UTC instant per day (with margin) and locate transitions
+        origin = datetime.combine(first - timedelta(days=2), time.min, tzinfo=UTC)
+        n_days = (last - first).days + 5
+        samples = [origin + timedelta(days=i) for i in range(n_days + 1)]
+        sample_offsets = [self._offset_at(u) for u in samples]
+        self._offsets.append(sample_offsets[0])
+        for i in range(n_days):
+            if sample_offsets[i] != sample_offsets[i + 1]:
+                self._transitions.append(self._find_transition(samples[i], samples[i + 1]))
+                self._offsets.append(sample_offsets[i + 1])
+
+        for i in range((last - first).days + 1):
+            midnight = datetime.combine(first + timedelta(days=i), time.min, tzinfo=UTC)
+            lo = bisect_right(self._transitions, midnight - timedelta(days=1))
+            hi = bisect_right(self._transitions, midnight + timedelta(days=2))
+            self._days.append(self._offsets[lo] if lo == hi else None)
+
+    def _offset_at(self, instant: datetime) -> timedelta:
+        return instant.astimezone(self.tz).utcoffset()
+
+    def _find_transition(self, lo: datetime, hi: datetime) -> datetime:
+        """Return the first instant in (lo, hi] whose offset differs from lo's."""
+        before = self._offset_at(lo)
+        while hi - lo > timedelta(seconds=1):
+            mid = lo + (hi - lo) / 2
+            mid = mid.replace(microsecond=0)
+            if self._offset_at(mid) == before:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    def transitions(self) -> list[tuple[datetime, timedelta, timedelta]]:
+        """Return ``(utc_instant, offset_before, offset_after)`` of every transition in the range."""
+        return [
+            (instant, self._offsets[k], self._offsets[k + 1])
+            for k, instant in enumerate(self._transitions)
+        ]
+
+    def offset_at(self, instant: datetime) -> timedelta:
+        """Return the UTC offset in effect at a UTC instant."""
+        return self._offsets[bisect_right(self._transitions, instant)]
+
+    def to_utc(
+        self,
+        day: date,
+        local_time: time,
+        ambiguous: Ambiguous = "earlier",
+        nonexistent: Nonexistent = "shift_forward",
+    ) -> datetime:
+        """Convert a local date and time to a UTC datetime."""
+        i = day.toordinal() - self._first
+        if 0 <= i < len(self._days):
+            offset = self._days[i]
+            if offset is not None:
+                return datetime.combine(day, local_time, tzinfo=UTC) - offset
+            return self._resolve(
+                datetime.combine(day, local_time, tzinfo=UTC), ambiguous, nonexistent
+            )
+        return datetime.combine(day, local_time, tzinfo=self.tz).astimezone(UTC)
+
+    def _resolve(self, wall: datetime, ambiguous: Ambiguous, nonexistent: Nonexistent) -> datetime:
+        """Convert a wall-clock time (stored with UTC tzinfo) near a transition."""
+        candidates = sorted(
+            {wall - off for off in set(self._offsets) if self.offset_at(wall - off) == off}
+        )
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            if ambiguous == "raise":
+                raise ValueError(f"Ambiguous local time {wall:%Y-%m-%d %H:%M} in {self.tz_name}")
+            return candidates[0] if ambiguous == "earlier" else candidates[-1]
+
+        for k, instant in enumerate(self._transitions):
+            before, after = self._offsets[k], self._offsets[k + 1]
+            if instant + before <= wall < instant + after:
+                break
+        else:  # pragma: no cover - every gap belongs to a transition
+            raise ValueError(f"Cannot resolve local time {wall:%Y-%m-%d %H:%M} in {self.tz_name}")
+        if nonexistent == "raise":
+            raise ValueError(f"Nonexistent local time {wall:%Y-%m-%d %H:%M} in {self.tz_name}")
+        return wall - (before if nonexistent == "shift_forward" else after)
@@ -0,0 +1,112 @@
+"""
+Opt-in timing of calendar generation.
+
+Generation functions report their phases (``semester_info``, ``holidays``,
+``scheduling``, ``vevents``, ``serialization``) and counts (``events``,
+``occurrences``, ``vevents``) to the active :class:`Profile`. Without an
+active profile, :func:`phase` and :func:`count` do nothing::
+
+    with profile() as prof:
+        render_agenda(events, 2026, "en", "summer")
+    prof.as_dict()  # or prof.log()
+"""
+
+import logging
+import time as timer
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import ContextManager
+
+from .cache import cache_info
+
+logger = logging.getLogger("hm_semester")
+
+_active: ContextVar["Profile | None"] = ContextVar("hm_semester_profile", default=None)
+_DISABLED = nullcontext()
+
+
+class Profile:
+    """Accumulated phase timings (seconds), counts and cache statistics of a profiled block."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = defaultdict(float)
+        self.counts: dict[str, int] = defaultdict(int)
+        self.cache: dict[str, dict[str, int]] = {}
+        self.total = 0.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase ``name``."""
+        started = timer.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += timer.perf_counter() - started
+
+    def as_dict(self) -> dict:
+        """Return timings, counts and cache hits/misses as plain dicts."""
+        return {
+            "total": self.total,
+            "timings": dict(self.timings),
+            "counts": dict(self.counts),
+            "cache": {name: dict(stats) for name, stats in self.cache.items()},
+        }
+
+    def log(self, log: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        """Write a one-line summary to ``log`` (the ``hm_semester`` logger by default)."""
+        timings = " ".join(f"{name}={seconds * 1000:.2f}ms" for name, seconds in self.timings.items())
+        counts = " ".join(f"{name}={n}" for name, n in self.counts.items())
+        hits = sum(stats["hits"] for stats in self.cache.values())
+        misses = sum(stats["misses"] for stats in self.cache.values())
+        (log or logger).log(
+            level,
+            "total=%.2fms %s %s cache_hits=%d cache_misses=%d",
+            self.total * 1000, timings, counts, hits, misses,
+        )
+
+
+@contextmanager
+def profile(callback: Callable[[dict], None] | None = None) -> Iterator[Profile]:
+    """
+    Profile all calendar generation inside the block.
+
+    ``callback``, if given, is called with :meth:`Profile.as_dict` on exit.
+    """
+    prof = Profile()
+    before = cache_info()
+    token = _active.set(prof)
+    started = timer.perf_counter()
+    try:
+        yield prof
+    finally:
+        prof.total = timer.perf_counter() - started
+        _active.reset(token)
+        for name, info in cache_info().items():
+            prof.cache[name] = {
+                "hits": info.hits - before[name].hits,
+                "misses": info.misses - before[name].misses,
+            }
+        if callback is not None:
+            callback(prof.as_dict())
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Time the block as phase ``name`` of the active profile, if any."""
+    prof = _active.get()
+    if prof is None:
+        return _DISABLED
+    return prof.phase(name)
+
+
+def count(name: str, n: int | Callable[[], int] = 1) -> None:
+    """
+    Add ``n`` to count ``name`` of the active profile, if any.
+
+    Pass a callable for counts that are costly to compute; it is only called
+    while profiling.
+    """
+    prof = _active.get()
+    if prof is not None:
+        prof.counts[name] += n() if callable(n) else n
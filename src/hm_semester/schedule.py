@@ -0,0 +1,235 @@
+"""Holiday-aware lecture scheduling on ordinal day numbers.
+
+Dates are handled as proleptic Gregorian ordinals (``date.toordinal()``), so
+a lecture series is just an arithmetic progression with step 7 from which
+holidays are removed.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date
+
+from .intervals import HolidayCalendar
+from .types import SemesterInfo, WeeklyEvent
+
+
+def holiday_ordinals(
+    holidays: Iterable[date] | HolidayCalendar,
+    first: int | None = None,
+    last: int | None = None,
+) -> list[int]:
+    """Return the sorted ordinals of the given holidays, optionally limited to a range."""
+    if isinstance(holidays, HolidayCalendar):
+        return holidays.ordinals(first, last)
+    ordinals = (h.toordinal() for h in holidays)
+    if first is not None or last is not None:
+        lo = first if first is not None else 1
+        hi = last if last is not None else date.max.toordinal()
+        ordinals = (o for o in ordinals if lo <= o <= hi)
+    return sorted(ordinals)
+
+
+def first_lecture_ordinal(start_ord: int, weekday: int, start_week: int | None = 1) -> int:
+    """Return the ordinal of the first ``weekday`` in week ``start_week`` of the semester."""
+    # Ordinal 1 (0001-01-01) is a Monday, so the weekday of ordinal o is (o - 1) % 7
+    first = start_ord + (weekday - (start_ord - 1)) % 7
+    if start_week is not None and start_week > 1:
+        first += 7 * (start_week - 1)
+    return first
+
+
+def lecture_ordinals(
+    start_ord: int,
+    end_ord: int,
+    weekday: int,
+    holiday_ords: Sequence[int],
+    biweekly: bool = False,
+    start_week: int | None = 1,
+) -> list[int]:
+    """
+    Return the ordinals of all lectures between ``start_ord`` and ``end_ord``.
+
+    ``holiday_ords`` must be sorted. Holidays are dropped from the weekly series;
+    biweekly lectures take every other remaining occurrence, so a holiday shifts
+    the alternation instead of skipping two weeks.
+    """
+    first = first_lecture_ordinal(start_ord, weekday, start_week)
+    if first > end_ord:
+        return []
+    series = range(first, end_ord + 1, 7)
+
+    # Only holidays that fall on the series' weekday inside the range matter
+    lo = bisect_left(holiday_ords, first)
+    hi = bisect_right(holiday_ords, end_ord)
+    blocked = {h for h in holiday_ords[lo:hi] if (h - first) % 7 == 0}
+    ordinals = [o for o in series if o not in blocked] if blocked else list(series)
+
+    if biweekly:
+        return ordinals[::2]
+    return ordinals
+
+
+def calculate_lecture_dates(
+    start_date: date,
+    end_date: date,
+    weekday: int,
+    holidays: Iterable[date] | HolidayCalendar,
+    biweekly: bool = False,
+    start_week: int = 1,
+) -> list[date]:
+    """
+    Calculate actual lecture dates, skipping holidays and maintaining biweekly alternation.
+
+    For biweekly lectures, if a holiday interrupts the pattern, subsequent lectures shift
+    to maintain the alternating pattern (e.g., if week 3 is a holiday, shift to week 4,
+    then continue biweekly from there: 4, 6, 8...).
+
+    Args:
+        start_date: First day of semester
+        end_date: Last day of semester
+        weekday: Day of week (0=Monday, 6=Sunday)
+        holidays: Set of dates when lectures don't occur
+        biweekly: If True, lectures occur every 2 weeks
+        start_week: Which week to start (1, 2, 3, 4, etc.) - first lecture occurs in this week
+
+    Returns:
+        List of dates when lectures actually occur
+    """
+    start_ord = start_date.toordinal()
+    end_ord = end_date.toordinal()
+    ordinals = lecture_ordinals(
+        start_ord,
+        end_ord,
+        weekday,
+        holiday_ordinals(holidays, start_ord, end_ord),
+        biweekly,
+        start_week,
+    )
+    return [date.fromordinal(o) for o in ordinals]
+
+
+def weekly_exdates(dates: Sequence[date], interval: int = 1) -> list[date] | None:
+    """
+    Return the dates a weekly rule would add to ``dates``.
+
+    The rule starts at the first date and repeats every ``interval`` weeks
+    until the last one. Returns None if some date is not on that grid, i.e.
+    the dates cannot be expressed as such a rule with exceptions.
+    """
+    step = 7 * interval
+    first = dates[0].toordinal()
+    ordinals = {d.toordinal() for d in dates}
+    if any((o - first) % step for o in ordinals):
+        return None
+    return [
+        date.fromordinal(o) for o in range(first, dates[-1].toordinal() + 1, step) if o not in ordinals
+    ]
+
+
+def schedule_key(event: WeeklyEvent) -> tuple[int, bool, int]:
+    """Return the fields that determine an event's lecture dates within a semester."""
+    return event.weekday, bool(event.biweekly), max(event.start_week or 1, 1)
+
+
+def calculate_lecture_dates_bulk(
+    events: Sequence[WeeklyEvent],
+    info: SemesterInfo,
+    holidays: Iterable[date] | HolidayCalendar,
+    vectorized: bool = False,
+) -> list[tuple[date, ...]]:
+    """
+    Calculate the lecture dates of many events at once.
+
+    Events sharing weekday, biweekly flag and start week share one computed
+    series, so the work is bounded by the number of distinct schedule keys
+    rather than the number of events. ``max_reps`` is applied per event.
+    With ``vectorized=True`` the distinct series are computed together by
+    :func:`lecture_dates_matrix`.
+
+    Returns:
+        One tuple of dates per event, in the order of ``events``
+    """
+    keys = [schedule_key(ev) for ev in events]
+    distinct = list(dict.fromkeys(keys))
+    if vectorized:
+        computed = lecture_dates_matrix(distinct, info, holidays)
+    else:
+        computed = _lecture_dates_python(distinct, info, holidays)
+    series = {key: tuple(dates) for key, dates in zip(distinct, computed)}
+
+    result = []
+    for ev, key in zip(events, keys):
+        dates = series[key]
+        if ev.max_reps is not None:
+            dates = dates[: ev.max_reps]
+        result.append(dates)
+    return result
+
+
+def _lecture_dates_python(
+    keys: Sequence[tuple[int, bool, int]],
+    info: SemesterInfo,
+    holidays: Iterable[date] | HolidayCalendar,
+) -> list[list[date]]:
+    """Pure Python backend of :func:`lecture_dates_matrix`."""
+    start_ord = info.start_date.toordinal()
+    end_ord = info.end_date.toordinal()
+    holiday_ords = holiday_ordinals(holidays, start_ord, end_ord)
+    return [
+        [
+            date.fromordinal(o)
+            for o in lecture_ordinals(start_ord, end_ord, weekday, holiday_ords, biweekly, start_week)
+        ]
+        for weekday, biweekly, start_week in keys
+    ]
+
+
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def lecture_dates_matrix(
+    keys: Sequence[tuple[int, bool, int]],
+    info: SemesterInfo,
+    holidays: Iterable[date] | HolidayCalendar,
+) -> list[list[date]]:
+    """
+    Calculate the lecture dates for many ``(weekday, biweekly, start_week)`` keys at once.
+
+    With NumPy installed, all series are computed as one ``datetime64[D]`` matrix
+    (one row per key, one column per semester week): holidays are masked with
+    ``np.isin`` and biweekly rows keep every other remaining occurrence via a
+    cumulative-sum parity mask. Without NumPy, each key is computed in pure Python.
+
+    Returns:
+        One list of dates per key, in the order of ``keys``
+    """
+    np = _numpy()
+    if np is None or not keys:
+        return _lecture_dates_python(keys, info, holidays)
+
+    start = np.datetime64(info.start_date, "D")
+    end = np.datetime64(info.end_date, "D")
+    weekdays = np.array([k[0] for k in keys], dtype=np.int64)
+    biweekly = np.array([bool(k[1]) for k in keys], dtype=bool)
+    start_weeks = np.array([max(k[2] or 1, 1) for k in keys], dtype=np.int64)
+
+    # Offset of each row's first lecture from the semester start
+    offsets = (weekdays - info.start_date.weekday()) % 7 + 7 * (start_weeks - 1)
+    n_weeks = (end - start).astype(np.int64) // 7 + 1
+    grid = start + offsets[:, None] + 7 * np.arange(n_weeks)[None, :]
+
+    epoch = date(1970, 1, 1).toordinal()
+    holiday_ords = holiday_ordinals(holidays, info.start_date.toordinal(), info.end_date.toordinal())
+    holiday_arr = (np.array(holiday_ords, dtype=np.int64) - epoch).astype("datetime64[D]")
+    valid = (grid <= end) & ~np.isin(grid, holiday_arr)
+    # Running count of lecture-able occurrences; biweekly rows keep the odd ones
+    parity = np.cumsum(valid, axis=1) % 2 == 1
+    take = valid & (parity | ~biweekly[:, None])
+
+    return [row[mask].tolist() for row, mask in zip(grid, take)]
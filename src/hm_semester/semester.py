@@ -1,31 +1,65 @@
+from collections.abc import Iterator
 from datetime import datetime, timedelta
-from typing import Literal
-
-from icalendar import Calendar, Event
+from typing import TYPE_CHECKING, Literal
 
+from .cache import get_semester_info
 from .const import LABELS, SUMMER, WINTER
-from .util import get_summer_semester_info, get_winter_semester_info
+from .context import GenerationContext
+from .ical import CALENDAR_FOOTER, calendar_header, content_line, format_date, format_utc, text_line
+from .profiling import count, phase
+from .types import SemesterInfo
+from .util import get_summer_semester_info, get_winter_semester_info, semester_range
+
+if TYPE_CHECKING:
+    from icalendar import Calendar
+
+PRODID = "-//Munich University of Applied Sciences//Semester Calendar//EN"
 
 
 def generate_calendar(
-    year: int, semester: Literal["winter", "summer"], lang: Literal["de", "en"] = "en"
-) -> Calendar:
-    """Generate an iCalendar file for the given semester and year in the specified language."""
+    year: int,
+    semester: Literal["winter", "summer"],
+    lang: Literal["de", "en"] = "en",
+    dtstamp: datetime | None = None,
+) -> "Calendar":
+    """Generate an iCalendar file for the given semester and year in the specified language.
+
+    Pass ``dtstamp`` to pin the DTSTAMP of all events for reproducible output.
+    """
+    from icalendar import Calendar
+
+    dtstamp = GenerationContext(dtstamp).dtstamp
     cal = Calendar()
     # Add required calendar properties for RFC 5545 compliance
-    cal.add("prodid", "-//Munich University of Applied Sciences//Semester Calendar//EN")
+    cal.add("prodid", PRODID)
     cal.add("version", "2.0")
 
-    l = LABELS[lang]  # Get labels for the requested language
+    with phase("semester_info"):
+        params = _semester_info(year, semester, lang)
+    with phase("vevents"):
+        _add_semester_events(cal, year, semester, lang, params, dtstamp)
+    count("vevents", 2 + len(params.breaks))
 
+    return cal
+
+
+def _semester_info(year: int, semester: str, lang: str) -> SemesterInfo:
+    """Return the semester info of the given semester."""
     if semester == WINTER:
-        params = get_winter_semester_info(year, lang)
-    elif semester == SUMMER:
-        params = get_summer_semester_info(year, lang)
-    else:
-        raise ValueError(f"Unknown semester: {semester}")
+        return get_winter_semester_info(year, lang)
+    if semester == SUMMER:
+        return get_summer_semester_info(year, lang)
+    raise ValueError(f"Unknown semester: {semester}")
 
 
+def _add_semester_events(
+    cal: "Calendar", year: int, semester: str, lang: str, params: SemesterInfo, dtstamp: datetime
+) -> None:
+    """Add the start, end and break events of a semester to ``cal``."""
+    from icalendar import Event
+
+    l = LABELS[lang]  # Get labels for the requested language
+
     # Add semester start (all-day event)
     event = Event()
     event.add("summary", f"{l['START']}: {params.label} (HM)")
@@ -34,7 +68,7 @@ def generate_calendar(
     event.add("transp", "TRANSPARENT")  # Don't block time
     event["X-MICROSOFT-CDO-ALLDAYEVENT"] = "TRUE"  # Mark as all-day event
     # Add required event properties for RFC 5545 compliance
-    event.add("dtstamp", datetime.now())
+    event.add("dtstamp", dtstamp)
     event.add("uid", f"{semester}-start-{year}@hm-semester.example.com")
     cal.add_component(event)
 
@@ -46,7 +80,7 @@ def generate_calendar(
     event.add("transp", "TRANSPARENT")  # Don't block time
     event["X-MICROSOFT-CDO-ALLDAYEVENT"] = "TRUE"  # Mark as all-day event
     # Add required event properties for RFC 5545 compliance
-    event.add("dtstamp", datetime.now())
+    event.add("dtstamp", dtstamp)
     event.add("uid", f"{semester}-end-{year}@hm-semester.example.com")
     cal.add_component(event)
 
@@ -57,8 +91,93 @@ def generate_calendar(
         event.add("dtstart", break_start)
         event.add("dtend", break_end + timedelta(days=1))  # End date is exclusive
         # Add required event properties for RFC 5545 compliance
-        event.add("dtstamp", datetime.now())
+        event.add("dtstamp", dtstamp)
         event.add("uid", f"{semester}-break-{i}-{year}@hm-semester.example.com")
         cal.add_component(event)
 
-    return cal
+
+def _all_day_event(summary: str, start, end, dtstamp: str, uid: str, transparent: bool) -> bytes:
+    """Return an all-day VEVENT; ``end`` is the last day (inclusive)."""
+    lines = [
+        b"BEGIN:VEVENT\r\n",
+        text_line("SUMMARY", summary),
+        content_line("DTSTART;VALUE=DATE", format_date(start)),
+        content_line("DTEND;VALUE=DATE", format_date(end + timedelta(days=1))),
+        dtstamp,
+        text_line("UID", uid),
+    ]
+    if transparent:
+        lines.append(content_line("TRANSP", "TRANSPARENT"))
+        lines.append(content_line("X-MICROSOFT-CDO-ALLDAYEVENT", "TRUE"))
+    lines.append(b"END:VEVENT\r\n")
+    return b"".join(lines)
+
+
+def _semester_events(
+    year: int, semester: str, lang: str, params: SemesterInfo, stamp: bytes
+) -> Iterator[bytes]:
+    """Yield the VEVENTs of a semester calendar (start, end and breaks)."""
+    l = LABELS[lang]
+    yield _all_day_event(
+        f"{l['START']}: {params.label} (HM)", params.start_date, params.start_date,
+        stamp, f"{semester}-start-{year}@hm-semester.example.com", True,
+    )
+    yield _all_day_event(
+        f"{l['END']}: {params.label} (HM)", params.end_date, params.end_date,
+        stamp, f"{semester}-end-{year}@hm-semester.example.com", True,
+    )
+    for i, (break_label, (break_start, break_end)) in enumerate(params.breaks.items()):
+        yield _all_day_event(
+            f"{break_label} (HM)", break_start, break_end,
+            stamp, f"{semester}-break-{i}-{year}@hm-semester.example.com", False,
+        )
+
+
+def render_calendar(
+    year: int,
+    semester: Literal["winter", "summer"],
+    lang: Literal["de", "en"] = "en",
+    dtstamp: datetime | None = None,
+) -> bytes:
+    """
+    Return ``generate_calendar(...).to_ical()`` without importing ``icalendar``.
+
+    This is the fast path used by the CLI: it neither builds components nor
+    loads the ``holidays`` package.
+    """
+    with phase("semester_info"):
+        params = _semester_info(year, semester, lang)
+    stamp = content_line("DTSTAMP", format_utc(GenerationContext(dtstamp).dtstamp))
+    with phase("serialization"):
+        vevents = list(_semester_events(year, semester, lang, params, stamp))
+    count("vevents", len(vevents))
+    return b"".join([calendar_header(PRODID), *vevents, CALENDAR_FOOTER])
+
+
+def generate_calendar_range(
+    start_year: int,
+    end_year: int,
+    semesters: tuple[str, ...] = (SUMMER, WINTER),
+    lang: Literal["de", "en"] = "en",
+    dtstamp: datetime | None = None,
+    combined: bool = True,
+) -> Iterator[bytes]:
+    """
+    Stream the semester calendars of all years from ``start_year`` to ``end_year``.
+
+    With ``combined=True`` the chunks form one VCALENDAR containing every
+    semester; otherwise each yielded item is the complete calendar of one
+    semester (as :func:`render_calendar` returns it), in chronological order.
+    """
+    stamp = content_line("DTSTAMP", format_utc(GenerationContext(dtstamp).dtstamp))
+    if combined:
+        yield calendar_header(PRODID)
+    for year, semester in semester_range(start_year, end_year, semesters):
+        params = get_semester_info(year, semester, lang)
+        events = _semester_events(year, semester, lang, params, stamp)
+        if combined:
+            yield from events
+        else:
+            yield b"".join([calendar_header(PRODID), *events, CALENDAR_FOOTER])
+    if combined:
+        yield CALENDAR_FOOTER
@@ -0,0 +1,241 @@
+"""
+Asyncio HTTP server publishing calendars as subscription feeds.
+
+Routes (``?lang=de`` selects German labels)::
+
+    /semester/{year}/{semester}.ics           render_calendar
+    /agenda/{name}/{year}/{semester}.ics      render_agenda of timetable ``name``
+
+Rendered feeds are kept in an in-memory LRU cache and served with an ETag, so
+clients polling with ``If-None-Match`` get ``304 Not Modified``. Rendering runs
+in an executor (the loop's default thread pool unless one is given), so slow
+renders do not block the event loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .agenda import render_agenda
+from .const import LABELS
+from .context import GenerationContext
+from .semester import render_calendar
+from .types import WeeklyEvent
+
+logger = logging.getLogger("hm_semester")
+
+DEFAULT_CACHE_SIZE = 128
+
+_SEMESTER_ROUTE = re.compile(r"/semester/(\d{4})/(winter|summer)\.ics")
+_AGENDA_ROUTE = re.compile(r"/agenda/([^/]+)/(\d{4})/(winter|summer)\.ics")
+
+_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def to_bytes(self, head_only: bool = False) -> bytes:
+        """Return the HTTP/1.1 response message."""
+        lines = [f"HTTP/1.1 {self.status} {_REASONS[self.status]}"]
+        lines += [f"{name}: {value}" for name, value in self.headers.items()]
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head if head_only else head + self.body
+
+
+def _error(status: int, message: str) -> Response:
+    body = (message + "\n").encode("utf-8")
+    return Response(status, {"Content-Type": "text/plain; charset=utf-8", "Content-Length": str(len(body))}, body)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+class CalendarServer:
+    """
+    Serve semester calendars and the agendas of ``timetables`` (name to events).
+
+    All feeds share one DTSTAMP (``dtstamp``, or the time the server was
+    created), so a feed's bytes and ETag only change when its input does.
+    """
+
+    def __init__(
+        self,
+        timetables: dict[str, list[WeeklyEvent]] | None = None,
+        dtstamp: datetime | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        executor: Executor | None = None,
+    ):
+        self.timetables = dict(timetables or {})
+        self.dtstamp = GenerationContext(dtstamp).dtstamp
+        self.cache_size = cache_size
+        self.executor = executor
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple, tuple[bytes, str]] = OrderedDict()
+        self._pending: dict[tuple, asyncio.Future] = {}
+        # Bumped by set_timetable so renders of replaced timetables are not cached
+        self._generations: dict[str, int] = {}
+
+    def set_timetable(self, name: str, events: list[WeeklyEvent]) -> None:
+        """Add or replace a timetable and drop its cached and in-flight feeds."""
+        self.timetables[name] = events
+        self._generations[name] = self._generations.get(name, 0) + 1
+        for key in [k for k in self._cache if k[0] == "agenda" and k[1] == name]:
+            del self._cache[key]
+        for key in [k for k in self._pending if k[0] == "agenda" and k[1] == name]:
+            del self._pending[key]
+
+    def _generation(self, key: tuple) -> int:
+        return self._generations.get(key[1], 0) if key[0] == "agenda" else 0
+
+    async def render(self, key: tuple) -> tuple[bytes, str]:
+        """Return the body and ETag of a feed, rendering it in the executor on a miss."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+        pending = self._pending.get(key)
+        if pending is not None:
+            # Another request is already rendering this feed
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[key] = future
+        generation = self._generation(key)
+        try:
+            body = await loop.run_in_executor(self.executor, self._renderer(key))
+            result = body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters re-raise the exception; avoid "never retrieved" warnings
+            future.exception()
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        future.set_result(result)
+        if self._generation(key) == generation:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _renderer(self, key: tuple):
+        if key[0] == "semester":
+            _, year, semester, lang = key
+            return partial(render_calendar, year, semester, lang, self.dtstamp)
+        _, name, year, semester, lang = key
+        return partial(render_agenda, self.timetables[name], year, lang, semester, self.dtstamp)
+
+    def route(self, target: str) -> tuple | Response:
+        """Return the cache key of a request target, or an error response."""
+        url = urlsplit(target)
+        lang = parse_qs(url.query).get("lang", ["en"])[-1]
+        if lang not in LABELS:
+            return _error(400, f"Unknown language: {lang}")
+        match = _SEMESTER_ROUTE.fullmatch(url.path)
+        if match:
+            key = ("semester", int(match[1]), match[2], lang)
+        else:
+            match = _AGENDA_ROUTE.fullmatch(url.path)
+            if not match:
+                return _error(404, "Not found")
+            name = unquote(match[1])
+            if name not in self.timetables:
+                return _error(404, f"Unknown timetable: {name}")
+            key = ("agenda", name, int(match[2]), match[3], lang)
+        # date() needs years 1-9999, and winter semesters end in the following year
+        if not 1 <= key[-3] < 9999:
+            return _error(400, f"Year out of range: {key[-3]}")
+        return key
+
+    async def handle(self, method: str, target: str, headers: dict[str, str]) -> Response:
+        """Answer one request; ``headers`` are keyed by lower-case name."""
+        if method not in ("GET", "HEAD"):
+            response = _error(405, "Method not allowed")
+            response.headers["Allow"] = "GET, HEAD"
+            return response
+        key = self.route(target)
+        if isinstance(key, Response):
+            return key
+        try:
+            body, etag = await self.render(key)
+        except Exception:
+            logger.exception("Rendering %s failed", target)
+            return _error(500, "Internal server error")
+        if _etag_matches(headers.get("if-none-match", ""), etag):
+            return Response(304, {"ETag": etag})
+        return Response(
+            200,
+            {
+                "Content-Type": "text/calendar; charset=utf-8",
+                "Content-Length": str(len(body)),
+                "ETag": etag,
+                "Cache-Control": "no-cache",
+            },
+            body,
+        )
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        method = ""
+        try:
+            try:
+                request_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+            except (ValueError, asyncio.LimitOverrunError):
+                response = _error(400, "Bad request")
+            else:
+                response = await self.handle(method, target, headers)
+            response.headers["Connection"] = "close"
+            writer.write(response.to_bytes(head_only=method == "HEAD"))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Start listening; use ``port=0`` for a free port (see ``server.sockets``)."""
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+def serve(server: CalendarServer, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """Run ``server`` until interrupted."""
+
+    async def main():
+        async with await server.start(host, port) as listener:
+            await listener.serve_forever()
+
+    asyncio.run(main())
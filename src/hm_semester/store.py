@@ -0,0 +1,193 @@
+"""Content-addressed on-disk cache for rendered calendars and Moodle CSVs.
+
+Rendered outputs are pure functions of their inputs, so they can be stored
+under a hash of those inputs (events, year, semester, language, output kind,
+DTSTAMP, package version and holiday source) and reused across runs.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable, Literal
+
+from .agenda import create_moodle_csv, render_agenda
+from .semester import generate_calendar
+from .types import WeeklyEvent
+from .util import get_holiday_backend
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@functools.cache
+def _version(distribution: str) -> str:
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _holiday_source() -> str:
+    """Return what the public holidays are computed with, e.g. ``holidays 0.80``."""
+    backend = get_holiday_backend()
+    if backend == "holidays":
+        return f"holidays {_version('holidays')}"
+    return backend
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Cannot hash value of type {type(value).__name__}")
+
+
+def cache_key(kind: str, events: list[WeeklyEvent] | None, **params) -> str:
+    """Return a stable hash of an output kind, its events and parameters."""
+    payload = {
+        "kind": kind,
+        "version": _version("hm-semester"),
+        "holidays": _holiday_source(),
+        "events": [asdict(ev) for ev in events] if events is not None else None,
+        "params": params,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_json_default)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """
+    Size-bounded LRU cache of rendered outputs in a directory.
+
+    Entries are written atomically (temporary file plus ``os.replace``), so
+    concurrent readers never see partial files. The modification time of an
+    entry is refreshed on every hit, and the least recently used entries are
+    deleted once the directory grows beyond ``max_bytes``.
+
+    Without a pinned ``dtstamp`` a cached output keeps the DTSTAMP of the run
+    that first rendered it.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [e for e in os.scandir(self.directory) if e.is_file() and not e.name.startswith(".")]
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached bytes for ``key``, or None."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted concurrently; the data is still valid
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key`` atomically and evict old entries if needed."""
+        path = self._path(key)
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if self._size is None:
+            self._size = sum(e.stat().st_size for e in self._entries())
+        else:
+            self._size += len(data) - old_size
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = sorted((e.stat().st_mtime, e.stat().st_size, e.path) for e in self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for entry in self._entries():
+            os.unlink(entry.path)
+        self._size = 0
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        """Return the cached output for ``key``, rendering and storing it on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def agenda(
+        self,
+        events: list[WeeklyEvent],
+        year: int,
+        lang: Literal["de", "en"],
+        semester: Literal["winter", "summer"],
+        dtstamp: datetime | None = None,
+    ) -> bytes:
+        """Cached :func:`hm_semester.agenda.render_agenda`."""
+        key = cache_key("agenda", events, year=year, lang=lang, semester=semester, dtstamp=dtstamp)
+        return self.get_or_render(
+            key, lambda: render_agenda(events, year, lang, semester, dtstamp)
+        )
+
+    def moodle_csv(
+        self,
+        events: list[WeeklyEvent],
+        year: int,
+        lang: Literal["de", "en"],
+        semester: Literal["winter", "summer"],
+    ) -> str:
+        """Cached :func:`hm_semester.agenda.create_moodle_csv`."""
+        key = cache_key("moodle", events, year=year, lang=lang, semester=semester)
+        data = self.get_or_render(
+            key, lambda: create_moodle_csv(events, year, lang, semester).encode("utf-8")
+        )
+        return data.decode("utf-8")
+
+    def semester_calendar(
+        self,
+        year: int,
+        semester: Literal["winter", "summer"],
+        lang: Literal["de", "en"] = "en",
+        dtstamp: datetime | None = None,
+    ) -> bytes:
+        """Cached ``generate_calendar(...).to_ical()``."""
+        key = cache_key("semester", None, year=year, lang=lang, semester=semester, dtstamp=dtstamp)
+        return self.get_or_render(
+            key, lambda: generate_calendar(year, semester, lang, dtstamp).to_ical()
+        )
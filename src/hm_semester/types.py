@@ -1,12 +1,45 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, time
 
 
-@dataclass
+@dataclass(frozen=True)
 class SemesterInfo:
     start_date: date
     end_date: date
     vacation_start: date
     vacation_end: date
-    breaks: dict[str, tuple[date, date]]
+    breaks: Mapping[str, tuple[date, date]]
     label: str
+
+
+@dataclass
+class WeeklyEvent:
+    summary: str
+    course_id: str  # Used for deterministic UID generation
+    weekday: int  # 0=Monday, 6=Sunday
+    start_time: time
+    end_time: time
+    location: str = ""
+    biweekly: bool = False  # If True, event is every 2 weeks
+    start_week: int = 1  # Which semester week to start (1, 2, 3, 4, etc.)
+    max_reps: int | None = None  # Maximum number of occurrences (None = unlimited)
+    timezone: str = "Europe/Berlin"
+    sequence: int = 0  # Version number for updates
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenWeeklyEvent:
+    """Immutable, slotted :class:`WeeklyEvent` for large timetables (no per-instance ``__dict__``)."""
+
+    summary: str
+    course_id: str
+    weekday: int
+    start_time: time
+    end_time: time
+    location: str = ""
+    biweekly: bool = False
+    start_week: int = 1
+    max_reps: int | None = None
+    timezone: str = "Europe/Berlin"
+    sequence: int = 0
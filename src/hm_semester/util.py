@@ -1,11 +1,49 @@
+import os
+from collections.abc import Iterable
 from datetime import date, timedelta
 
-import holidays as public_holidays
 from dateutil.easter import easter
 
-from .const import LABELS
+from .bavaria import bavarian_holidays
+from .const import LABELS, SUMMER, WINTER
 from .types import SemesterInfo
 
+HOLIDAY_BACKENDS = ("holidays", "native")
+_holiday_backend = os.environ.get("HM_SEMESTER_HOLIDAY_BACKEND", "holidays")
+
+
+def set_holiday_backend(backend: str) -> None:
+    """
+    Select how Bavarian public holidays are computed.
+
+    ``"holidays"`` (default) uses the ``holidays`` package, ``"native"`` the
+    built-in calculator in :mod:`hm_semester.bavaria`. The default can also be
+    set with the ``HM_SEMESTER_HOLIDAY_BACKEND`` environment variable. Call
+    :func:`hm_semester.cache.clear_caches` after switching at runtime.
+    """
+    global _holiday_backend
+    if backend not in HOLIDAY_BACKENDS:
+        raise ValueError(f"Unknown holiday backend: {backend}")
+    _holiday_backend = backend
+
+
+def get_holiday_backend() -> str:
+    """Return the selected holiday backend (see :func:`set_holiday_backend`)."""
+    return _holiday_backend
+
+
+def get_public_holidays(years: set[int], backend: str | None = None) -> list[date]:
+    """Return the Bavarian public holidays of the given years."""
+    backend = backend or _holiday_backend
+    if backend == "native":
+        return [day for year in years for day in bavarian_holidays(year)]
+    if backend != "holidays":
+        raise ValueError(f"Unknown holiday backend: {backend}")
+    # Imported here because loading the holidays package is expensive
+    import holidays as public_holidays
+
+    return list(public_holidays.Germany(subdiv="BY", years=years).keys())
+
 
 def adjust_start_date(start_date: date) -> date:
     """Adjust start date to the next Monday if it falls on a Friday, Saturday, or Sunday."""
@@ -48,7 +86,28 @@ def get_pentecost_break(year: int) -> tuple[date, date]:
     return start, end
 
 
-def get_holiday_dates(semester_info: SemesterInfo) -> set[date]:
+def semester_years(semester_info: SemesterInfo) -> set[int]:
+    """Return the calendar years a semester touches."""
+    return {semester_info.start_date.year, semester_info.end_date.year}
+
+
+def semester_public_holidays(semester_info: SemesterInfo, public: Iterable[date]) -> list[date]:
+    """Return the days of ``public`` (precomputed public holidays) within the semester."""
+    return [day for day in public if semester_info.start_date <= day <= semester_info.end_date]
+
+
+def semester_holidays(semester_info: SemesterInfo, public: Iterable[date]) -> set[date]:
+    """Return all break days of a semester plus the days of ``public`` within it."""
+    holiday_dates = {
+        break_start + timedelta(days=i)
+        for break_start, break_end in semester_info.breaks.values()
+        for i in range((break_end - break_start).days + 1)
+    }
+    holiday_dates.update(semester_public_holidays(semester_info, public))
+    return holiday_dates
+
+
+def get_holiday_dates(semester_info: SemesterInfo, backend: str | None = None) -> set[date]:
     """
     Return a set of all dates when lectures do not take place.
     Includes all days within semester breaks and all Bavarian public holidays
@@ -56,27 +115,38 @@ def get_holiday_dates(semester_info: SemesterInfo) -> set[date]:
 
     Args:
         semester_info: The semester information containing break periods
+        backend: "holidays" or "native" (default: see set_holiday_backend)
 
     Returns:
         Set of dates when lectures do not occur
     """
-    holiday_dates: set[date] = set()
-
-    # Add all days within semester break periods
-    for break_start, break_end in semester_info.breaks.values():
-        current = break_start
-        while current <= break_end:
-            holiday_dates.add(current)
-            current += timedelta(days=1)
-
-    # Add Bavarian public holidays within the semester date range
-    years = {semester_info.start_date.year, semester_info.end_date.year}
-    by_holidays = public_holidays.Germany(subdiv="BY", years=years)
-    for h_date in by_holidays.keys():
-        if semester_info.start_date <= h_date <= semester_info.end_date:
-            holiday_dates.add(h_date)
+    return semester_holidays(semester_info, get_public_holidays(semester_years(semester_info), backend))
 
-    return holiday_dates
+
+def get_holiday_dates_range(
+    infos: list[SemesterInfo], backend: str | None = None
+) -> list[set[date]]:
+    """
+    Return the holiday dates (see :func:`get_holiday_dates`) of many semesters.
+
+    The public holidays of all covered years are computed in a single sweep,
+    i.e. with one ``holidays`` instantiation.
+    """
+    years = set().union(*map(semester_years, infos))
+    public = get_public_holidays(years, backend) if years else []
+    return [semester_holidays(info, public) for info in infos]
+
+
+def semester_range(
+    start_year: int, end_year: int, semesters: tuple[str, ...] = (SUMMER, WINTER)
+) -> list[tuple[int, str]]:
+    """Return ``(year, semester)`` pairs from ``start_year`` to ``end_year`` in chronological order."""
+    for semester in semesters:
+        if semester not in (SUMMER, WINTER):
+            raise ValueError(f"Unknown semester: {semester}")
+    # The summer semester starts in March, the winter semester in October
+    order = [s for s in (SUMMER, WINTER) if s in semesters]
+    return [(year, semester) for year in range(start_year, end_year + 1) for semester in order]
 
 
 def get_winter_semester_info(year: int, lang: str) -> SemesterInfo:
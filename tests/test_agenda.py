@@ -1,10 +1,26 @@
+import io
+import re
 from collections import defaultdict
-from datetime import date, time, timedelta
+from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 import icalendar
 
-from hm_semester.agenda import WeeklyEvent, create_agenda
+from hm_semester.agenda import (
+    WeeklyEvent,
+    agenda_range,
+    create_agenda,
+    create_moodle_csv,
+    iter_agenda,
+    iter_compact_agenda,
+    iter_moodle_rows,
+    render_agenda,
+    split_moodle_csv,
+    stream_agenda,
+    write_moodle_csv,
+)
+from hm_semester.cache import get_semester_holidays, get_semester_info
+from hm_semester.schedule import calculate_lecture_dates
 from hm_semester.semester import WINTER
 
 
@@ -436,3 +452,233 @@ def test_agenda_skips_heilige_drei_koenige_winter():
     """Heilige Drei Könige (6 Jan) is a Bavarian holiday — should be skipped in WS.
     In WS 2025 it falls on a Tuesday (6 Jan 2026)."""
     assert date(2026, 1, 6) not in _weekday_winter(1, 2025)
+
+
+# ---------------------------------------------------------------------------
+# Streaming writer
+# ---------------------------------------------------------------------------
+
+
+def _mask_timestamps(ical: bytes) -> bytes:
+    return re.sub(rb"(DTSTAMP|LAST-MODIFIED):\d{8}T\d{6}Z", rb"\1:X", ical)
+
+
+def test_stream_agenda_matches_create_agenda():
+    events = [
+        WeeklyEvent(
+            summary='Algorithms, Intro; "Übung" \\ with a summary long enough to be folded',
+            course_id="CS101",
+            weekday=0,
+            start_time=time(9, 0),
+            end_time=time(11, 0),
+            location="Room 101, Building A; Lecture Hall with a long name, too",
+            sequence=1,
+        ),
+        WeeklyEvent(
+            summary="Seminar",
+            course_id="SEM",
+            weekday=2,
+            start_time=time(14, 0),
+            end_time=time(16, 0),
+            biweekly=True,
+            start_week=2,
+            timezone="America/New_York",
+        ),
+    ]
+    for lang, semester in [("de", "summer"), ("en", WINTER)]:
+        expected = create_agenda(events, 2026, lang, semester).to_ical()
+        buf = io.BytesIO()
+        stream_agenda(events, 2026, lang, semester, buf)
+        assert _mask_timestamps(buf.getvalue()) == _mask_timestamps(expected)
+
+
+def test_iter_agenda_yields_one_chunk_per_lecture():
+    events = [WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0))]
+    chunks = list(iter_agenda(events, 2025, "en", WINTER))
+    vevents = [c for c in create_agenda(events, 2025, "en", WINTER).walk() if c.name == "VEVENT"]
+    # Header, one chunk per VEVENT, footer
+    assert len(chunks) == len(vevents) + 2
+    assert chunks[-1] == b"END:VCALENDAR\r\n"
+
+
+def test_render_agenda_matches_create_agenda():
+    events = [
+        WeeklyEvent("Lecture", "lec", 1, time(9, 0), time(10, 0), location="R1", sequence=2),
+        WeeklyEvent("Lab", "lab", 3, time(13, 0), time(15, 0), biweekly=True, max_reps=4),
+    ]
+    expected = create_agenda(events, 2026, "de", "summer").to_ical()
+    assert _mask_timestamps(render_agenda(events, 2026, "de", "summer")) == _mask_timestamps(expected)
+
+
+def test_pinned_dtstamp_is_reproducible():
+    events = [WeeklyEvent("Lecture", "lec", 1, time(9, 0), time(10, 0), sequence=1)]
+    stamp = datetime(2026, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+    first = create_agenda(events, 2026, "en", "summer", dtstamp=stamp).to_ical()
+    second = create_agenda(events, 2026, "en", "summer", dtstamp=stamp).to_ical()
+    assert first == second
+    assert b"DTSTAMP:20260101T120000Z" in first
+    assert b"LAST-MODIFIED:20260101T120000Z" in first
+    assert render_agenda(events, 2026, "en", "summer", dtstamp=stamp) == first
+
+
+def test_dst_transition_converted_to_utc():
+    # Summer 2026: CET until 29 March, CEST afterwards
+    events = [WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0))]
+    cal = create_agenda(events, 2026, "en", "summer")
+    starts = {e.get("dtstart").dt.date(): e.get("dtstart").dt for e in cal.walk("VEVENT")}
+    assert starts[date(2026, 3, 23)].hour == 8
+    assert starts[date(2026, 3, 30)].hour == 7
+
+
+def test_agenda_range_matches_render_agenda():
+    events = [WeeklyEvent("Lecture", "lec", 1, time(9, 0), time(10, 0), sequence=1)]
+    stamp = datetime(2026, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+    chunks = list(agenda_range(events, 2025, 2026, lang="de", dtstamp=stamp, combined=False))
+    expected = [
+        render_agenda(events, year, "de", semester, dtstamp=stamp)
+        for year in (2025, 2026)
+        for semester in ("summer", "winter")
+    ]
+    assert chunks == expected
+
+
+def test_agenda_range_combined_contains_all_semesters():
+    events = [WeeklyEvent("Lecture", "lec", 1, time(9, 0), time(10, 0))]
+    ical = b"".join(agenda_range(events, 2025, 2026))
+    cal = icalendar.Calendar.from_ical(ical)
+    semesters = {str(e.get("uid")).split("-lesson-")[0] for e in cal.walk("VEVENT")}
+    assert semesters == {"lec-2025-summer", "lec-2025-winter", "lec-2026-summer", "lec-2026-winter"}
+
+
+# Streaming Moodle CSV
+# ---------------------------------------------------------------------------
+
+MOODLE_EVENTS = [
+    WeeklyEvent("Lecture A", "a", 0, time(9, 0), time(10, 0)),
+    WeeklyEvent("Lab/B", "b", 2, time(13, 0), time(15, 0), biweekly=True),
+    WeeklyEvent("Lecture A", "a2", 3, time(11, 0), time(12, 0), max_reps=2),
+]
+
+
+def test_write_moodle_csv_matches_create_moodle_csv():
+    buf = io.StringIO()
+    write_moodle_csv(MOODLE_EVENTS, 2026, "en", "summer", buf)
+    assert buf.getvalue() == create_moodle_csv(MOODLE_EVENTS, 2026, "en", "summer")
+
+
+def test_iter_moodle_rows_is_lazy():
+    rows = iter_moodle_rows(MOODLE_EVENTS, 2026, "en", "summer")
+    assert next(rows)[0] == "groups"
+    assert next(rows) == ["Lecture A", "16-03-2026", "09:00", "10:00", 1]
+
+
+def test_split_moodle_csv_per_group(tmp_path):
+    paths = split_moodle_csv(MOODLE_EVENTS, 2026, "en", "summer", tmp_path)
+    assert paths == {"Lecture A": tmp_path / "Lecture_A.csv", "Lab/B": tmp_path / "Lab_B.csv"}
+    lines = create_moodle_csv(MOODLE_EVENTS, 2026, "en", "summer").splitlines(keepends=True)
+    for group, path in paths.items():
+        expected = [lines[0]] + [line for line in lines[1:] if line.startswith(group + ";")]
+        assert path.read_bytes().decode("utf-8") == "".join(expected)
+
+
+def test_split_moodle_csv_colliding_groups(tmp_path):
+    events = [
+        WeeklyEvent("A/B", "one", 0, time(9, 0), time(10, 0), max_reps=2),
+        WeeklyEvent("A B", "two", 1, time(9, 0), time(10, 0), max_reps=2),
+        WeeklyEvent("a b", "three", 2, time(9, 0), time(10, 0), max_reps=2),
+    ]
+    paths = split_moodle_csv(events, 2026, "en", "summer", tmp_path)
+    assert paths == {
+        "A/B": tmp_path / "A_B.csv",
+        "A B": tmp_path / "A_B-2.csv",
+        "a b": tmp_path / "a_b-3.csv",
+    }
+    lines = create_moodle_csv(events, 2026, "en", "summer").splitlines(keepends=True)
+    for group, path in paths.items():
+        expected = [lines[0]] + [line for line in lines[1:] if line.startswith(group + ";")]
+        assert path.read_bytes().decode("utf-8") == "".join(expected)
+
+
+# Compact RRULE/EXDATE output
+# ---------------------------------------------------------------------------
+
+COMPACT_EVENTS = [
+    WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 30), location="R1", sequence=1),
+    WeeklyEvent("Lab", "lab", 3, time(13, 0), time(15, 0), biweekly=True, start_week=2),
+    WeeklyEvent("Tutorial", "tut", 2, time(8, 0), time(9, 0), biweekly=True),
+    WeeklyEvent("Exercise", "ex", 4, time(10, 0), time(12, 0), max_reps=3),
+    WeeklyEvent("Seminar", "sem", 1, time(17, 0), time(18, 0), timezone="America/New_York"),
+    WeeklyEvent("Once", "once", 0, time(9, 0), time(10, 0), max_reps=1),
+]
+
+
+def _expand(component) -> list[datetime]:
+    """Expand DTSTART/RRULE/EXDATE/RDATE of a parsed VEVENT into local start times."""
+    from dateutil.rrule import rrulestr
+
+    dtstart = component.get("dtstart").dt
+    if "rrule" in component:
+        rule = component.get("rrule").to_ical().decode()
+        starts = set(rrulestr(rule, dtstart=dtstart))
+    else:
+        starts = {dtstart}
+    for prop, remove in (("exdate", True), ("rdate", False)):
+        values = component.get(prop, [])
+        for value in values if isinstance(values, list) else [values]:
+            for entry in value.dts:
+                (starts.discard if remove else starts.add)(entry.dt)
+    return sorted(starts)
+
+
+def test_compact_agenda_expands_to_lecture_dates():
+    for year, semester in [(2025, WINTER), (2026, "summer"), (2027, "summer")]:
+        info = get_semester_info(year, semester, "en")
+        holidays = get_semester_holidays(year, semester, "en")
+        cal = create_agenda(COMPACT_EVENTS, year, "en", semester, compact=True)
+        vevents = {str(c.get("uid")): c for c in cal.walk("VEVENT")}
+        assert len(vevents) == len(COMPACT_EVENTS)
+        for ev in COMPACT_EVENTS:
+            expected = calculate_lecture_dates(
+                info.start_date, info.end_date, ev.weekday, holidays, ev.biweekly, ev.start_week
+            )[: ev.max_reps]
+            starts = _expand(vevents[f"{ev.course_id}-{year}-{semester}@hm.edu"])
+            assert [s.date() for s in starts] == expected
+            # Local time stays fixed across daylight saving transitions
+            assert {s.time() for s in starts} == {ev.start_time}
+            assert {s.tzinfo.key for s in starts} == {ev.timezone}
+
+
+def test_compact_agenda_uses_rrule_exdate_and_rdate():
+    ical = render_agenda(COMPACT_EVENTS, 2026, "en", "summer", compact=True)
+    cal = icalendar.Calendar.from_ical(ical)
+    vevents = {str(c.get("uid")).split("-")[0]: c for c in cal.walk("VEVENT")}
+    assert vevents["lec"].get("rrule")["INTERVAL"] == [1]
+    assert "exdate" in vevents["lec"]
+    assert vevents["tut"].get("rrule")["INTERVAL"] == [2]
+    # The Easter break shifts the Thursday lab off its two-week grid
+    assert "rrule" not in vevents["lab"] and "rdate" in vevents["lab"]
+    assert "rrule" not in vevents["once"] and "rdate" not in vevents["once"]
+    assert {str(tz.get("tzid")) for tz in cal.walk("VTIMEZONE")} == {"Europe/Berlin", "America/New_York"}
+    assert len(ical) < len(render_agenda(COMPACT_EVENTS, 2026, "en", "summer")) / 3
+
+
+def test_compact_agenda_stream_matches_render():
+    stamp = datetime(2026, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+    buf = io.BytesIO()
+    stream_agenda(COMPACT_EVENTS, 2026, "de", "summer", buf, dtstamp=stamp, compact=True)
+    assert buf.getvalue() == b"".join(iter_compact_agenda(COMPACT_EVENTS, 2026, "de", "summer", stamp))
+
+
+def test_split_moodle_csv_bounds_open_files(tmp_path, monkeypatch):
+    monkeypatch.setattr("hm_semester.agenda.MAX_OPEN_FILES", 2)
+    # Alternate between five groups so files are evicted and reopened
+    events = [
+        WeeklyEvent(f"Group {i % 5}", f"g{i}", i % 5, time(9, 0), time(10, 0), max_reps=2)
+        for i in range(15)
+    ]
+    paths = split_moodle_csv(events, 2026, "en", "summer", tmp_path)
+    assert len(paths) == 5
+    lines = create_moodle_csv(events, 2026, "en", "summer").splitlines(keepends=True)
+    for group, path in paths.items():
+        expected = [lines[0]] + [line for line in lines[1:] if line.startswith(group + ";")]
+        assert path.read_bytes().decode("utf-8") == "".join(expected)
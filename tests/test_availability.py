@@ -0,0 +1,88 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from hm_semester.availability import AvailabilityIndex
+from hm_semester.types import WeeklyEvent
+
+EVENTS = [
+    WeeklyEvent("Algorithms", "CS101", 2, time(14, 0), time(16, 0), location="R1"),
+    WeeklyEvent("Lab A", "labA", 2, time(14, 0), time(16, 0), location="R2", biweekly=True, start_week=1),
+    WeeklyEvent("Seminar", "SEM", 2, time(10, 0), time(12, 0), location="R3"),
+    WeeklyEvent("Online", "ONL", 2, time(14, 0), time(16, 0)),
+]
+
+
+def _index(**kwargs):
+    return AvailabilityIndex.from_events(EVENTS, 2026, "summer", rooms=["R4"], **kwargs)
+
+
+def test_rooms_and_weeks():
+    index = _index()
+    assert index.rooms == ["R1", "R2", "R3", "R4"]
+    # The summer semester 2026 starts on Monday, 16 March
+    assert index.week_of(date(2026, 3, 18)) == 1
+    assert index.date_of(3, 2) == date(2026, 4, 1)
+
+
+def test_free_rooms():
+    index = _index()
+    assert index.free_rooms(2, time(14, 0), time(16, 0)) == ["R3", "R4"]
+    assert index.free_rooms(2, time(11, 0), time(13, 0)) == ["R1", "R2", "R4"]
+    assert index.free_rooms(2, time(16, 0), time(18, 0)) == ["R1", "R2", "R3", "R4"]
+    # Biweekly lab in odd weeks only: R2 is free on Wednesdays of week 2
+    assert "R2" in index.free_rooms(2, time(14, 0), time(16, 0), weeks=[2])
+    assert "R2" not in index.free_rooms(2, time(14, 0), time(16, 0), weeks=range(2, 4))
+
+
+THURSDAY = WeeklyEvent("Lab B", "labB", 3, time(14, 0), time(16, 0), location="R4")
+
+
+def test_is_free_respects_holidays():
+    index = _index()
+    index.add(THURSDAY)
+    assert not index.is_free("R4", date(2026, 5, 7), time(15, 0), time(15, 30))
+    # 14 May 2026 is Ascension Day
+    assert index.is_free("R4", date(2026, 5, 14), time(15, 0), time(15, 30))
+
+
+def test_add_and_remove():
+    index = _index()
+    extra = WeeklyEvent("Extra", "EX", 2, time(15, 0), time(17, 0), location="R1")
+    index.add(extra)
+    assert not index.is_free("R1", date(2026, 3, 18), time(16, 0), time(17, 0))
+    index.remove(extra)
+    assert index.is_free("R1", date(2026, 3, 18), time(16, 0), time(17, 0))
+    # The overlapping original lecture keeps its slots
+    assert not index.is_free("R1", date(2026, 3, 18), time(15, 0), time(16, 0))
+    index.remove(EVENTS[0])
+    assert "R1" in index.free_rooms(2, time(14, 0), time(16, 0))
+    with pytest.raises(ValueError):
+        index.remove(EVENTS[0])
+
+
+def test_next_free_slot():
+    index = _index(slot_minutes=30)
+    after = datetime(2026, 3, 18, 9, 0)
+    assert index.next_free_slot("R3", timedelta(hours=2), after) == datetime(2026, 3, 18, 12, 0)
+    assert index.next_free_slot("R3", timedelta(hours=1), after) == datetime(2026, 3, 18, 9, 0)
+    busy_day = index.next_free_slot("R1", timedelta(hours=7), after, earliest=time(8), latest=time(18))
+    assert busy_day == datetime(2026, 3, 19, 8, 0)
+    index.add(THURSDAY)
+    # 2 April 2026 is the first Thursday of the Easter break
+    easter = index.next_free_slot("R4", timedelta(hours=2), after, earliest=time(14), latest=time(16), weekdays=[3])
+    assert easter == datetime(2026, 4, 2, 14, 0)
+    assert index.next_free_slot("R1", timedelta(hours=13), after) is None
+
+
+def test_weeks_of_semester_starting_mid_week():
+    # The winter semester 2025 starts on Wednesday, 1 October
+    event = WeeklyEvent("Late start", "LATE", 0, time(14, 0), time(16, 0), location="R1", start_week=3)
+    index = AvailabilityIndex.from_events([event], 2025, "winter")
+    assert index.date_of(1, 0) == date(2025, 10, 6)
+    assert index.date_of(1, 2) == date(2025, 10, 1)
+    assert index.week_of(date(2025, 10, 20)) == 3
+    assert index.week_of(date(2025, 10, 1)) == 1
+    assert index.free_rooms(0, time(14, 0), time(16, 0), weeks=[3]) == []
+    assert index.free_rooms(0, time(14, 0), time(16, 0), weeks=[1, 2]) == ["R1"]
+    assert index.free_rooms(0, time(14, 0), time(16, 0)) == []
@@ -0,0 +1,41 @@
+from datetime import date
+
+import holidays
+import pytest
+
+from hm_semester import util
+from hm_semester.bavaria import bavarian_holidays
+from hm_semester.util import (
+    get_holiday_dates,
+    get_summer_semester_info,
+    get_winter_semester_info,
+    set_holiday_backend,
+)
+
+
+@pytest.mark.parametrize("year", range(1980, 2101))
+def test_matches_holidays_package(year):
+    assert bavarian_holidays(year) == dict(holidays.Germany(subdiv="BY", years=year))
+
+
+def test_known_dates():
+    days = bavarian_holidays(2026)
+    assert days[date(2026, 5, 14)] == "Christi Himmelfahrt"
+    assert days[date(2026, 6, 4)] == "Fronleichnam"
+    assert date(2026, 8, 15) not in days
+
+
+@pytest.mark.parametrize("year", range(2000, 2041))
+def test_native_backend_holiday_dates(year):
+    for info in (get_summer_semester_info(year, "en"), get_winter_semester_info(year, "en")):
+        assert get_holiday_dates(info, backend="native") == get_holiday_dates(
+            info, backend="holidays"
+        )
+
+
+def test_set_holiday_backend(monkeypatch):
+    monkeypatch.setattr(util, "_holiday_backend", "holidays")
+    set_holiday_backend("native")
+    assert util._holiday_backend == "native"
+    with pytest.raises(ValueError):
+        set_holiday_backend("unknown")
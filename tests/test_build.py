@@ -0,0 +1,61 @@
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from hm_semester.agenda import WeeklyEvent, create_moodle_csv, render_agenda
+from hm_semester.build import build_all, output_names, read_timetables
+
+STAMP = datetime(2026, 2, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+
+TIMETABLE = """calendar,summary,course_id,weekday,start_time,end_time,location,biweekly,start_week,max_reps
+Prof. A,Algorithms,CS101,0,09:00,11:00,Room 101,,,
+Prof. A,Seminar,CS303,4,14:00,16:00,Room 202,true,2,5
+Prof. B,Databases,CS202,2,13:00,15:00,Lab 305,,,
+"""
+
+
+def test_read_timetables(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_text(TIMETABLE)
+    timetables = read_timetables(path)
+    assert list(timetables) == ["Prof. A", "Prof. B"]
+    seminar = timetables["Prof. A"][1]
+    assert seminar == WeeklyEvent(
+        "Seminar", "CS303", 4, time(14), time(16), "Room 202", True, 2, 5
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_all(tmp_path, jobs):
+    path = tmp_path / "timetable.csv"
+    path.write_text(TIMETABLE)
+    timetables = read_timetables(path)
+
+    results = build_all(timetables, 2026, "summer", "en", tmp_path / "out", jobs=jobs, dtstamp=STAMP)
+
+    assert [r.name for r in results] == ["Prof. A", "Prof. B"]
+    for result in results:
+        events = timetables[result.name]
+        with open(result.ics_path, "rb") as f:
+            assert f.read() == render_agenda(events, 2026, "en", "summer", STAMP)
+        with open(result.csv_path, newline="", encoding="utf-8") as f:
+            assert f.read() == create_moodle_csv(events, 2026, "en", "summer")
+
+
+def test_output_names_are_distinct():
+    names = output_names(["A/B", "A B", "a_b", "A_B-2", "Prof. C"])
+    assert names == {"A/B": "A_B", "A B": "A_B-3", "a_b": "a_b-4", "A_B-2": "A_B-2", "Prof. C": "Prof._C"}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_all_colliding_names(tmp_path, jobs):
+    timetables = {
+        "A/B": [WeeklyEvent("One", "one", 0, time(9), time(10))],
+        "A B": [WeeklyEvent("Two", "two", 1, time(9), time(10))],
+    }
+    results = build_all(timetables, 2026, "summer", "en", tmp_path, jobs=jobs, dtstamp=STAMP)
+    assert [r.ics_path for r in results] == [str(tmp_path / "A_B.ics"), str(tmp_path / "A_B-2.ics")]
+    for result in results:
+        with open(result.ics_path, "rb") as f:
+            assert f.read() == render_agenda(timetables[result.name], 2026, "en", "summer", STAMP)
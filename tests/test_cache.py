@@ -0,0 +1,64 @@
+from dataclasses import FrozenInstanceError
+from datetime import date
+
+import pytest
+
+from hm_semester.cache import (
+    cache_info,
+    clear_caches,
+    get_semester_holiday_calendar,
+    get_semester_holiday_ordinals,
+    get_semester_holidays,
+    get_semester_info,
+)
+from hm_semester.util import get_holiday_dates, get_summer_semester_info
+
+
+def test_semester_info_is_shared():
+    clear_caches()
+    first = get_semester_info(2026, "summer", "de")
+    second = get_semester_info(2026, "summer", "de")
+    assert first is second
+    stats = cache_info()["semester_info"]
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_semester_info_matches_uncached():
+    assert get_semester_info(2026, "summer", "de") == get_summer_semester_info(2026, "de")
+
+
+def test_semester_info_is_immutable():
+    info = get_semester_info(2025, "winter", "en")
+    with pytest.raises(FrozenInstanceError):
+        info.label = "changed"
+    with pytest.raises(TypeError):
+        info.breaks["Extra"] = (date(2025, 11, 1), date(2025, 11, 2))
+
+
+def test_holidays_are_frozen_and_match_uncached():
+    holidays = get_semester_holidays(2026, "summer", "de")
+    assert isinstance(holidays, frozenset)
+    assert holidays == get_holiday_dates(get_summer_semester_info(2026, "de"))
+    assert get_semester_holidays(2026, "summer", "de") is holidays
+
+
+def test_holiday_calendar_matches_holiday_set():
+    holidays = get_semester_holidays(2025, "winter", "en")
+    calendar = get_semester_holiday_calendar(2025, "winter", "en")
+    assert calendar.to_set() == holidays
+    assert get_semester_holiday_ordinals(2025, "winter", "en") == tuple(
+        sorted(day.toordinal() for day in holidays)
+    )
+
+
+def test_clear_caches():
+    get_semester_info(2025, "winter", "en")
+    clear_caches()
+    assert cache_info()["semester_info"].currsize == 0
+    assert cache_info()["holidays"].currsize == 0
+
+
+def test_unknown_semester():
+    with pytest.raises(ValueError):
+        get_semester_info(2025, "spring", "en")
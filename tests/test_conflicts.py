@@ -0,0 +1,82 @@
+import random
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+from hm_semester.cache import get_semester_holidays, get_semester_info
+from hm_semester.conflicts import find_conflicts
+from hm_semester.occurrences import OccurrenceTable
+from hm_semester.types import WeeklyEvent
+
+UTC = ZoneInfo("UTC")
+
+
+def test_weekly_overlap_in_same_room():
+    events = [
+        WeeklyEvent("Algorithms", "CS101", 0, time(9, 0), time(11, 0), location="R1"),
+        WeeklyEvent("Databases", "CS202", 0, time(10, 0), time(12, 0), location="R1", max_reps=2),
+        WeeklyEvent("Networks", "CS303", 0, time(10, 0), time(12, 0), location="R2"),
+    ]
+    conflicts = find_conflicts(events, 2026, "summer")
+    assert len(conflicts) == 2
+    first = conflicts[0]
+    assert first.resource == "R1"
+    assert first.date == date(2026, 3, 16)
+    assert first.uid == "CS101-2026-summer-lesson-1@hm.edu"
+    assert first.other_uid == "CS202-2026-summer-lesson-1@hm.edu"
+    # 10:00-11:00 CET
+    assert (first.start, first.end) == (datetime(2026, 3, 16, 9, 0, tzinfo=UTC), datetime(2026, 3, 16, 10, 0, tzinfo=UTC))
+    assert (first.event, first.other_event) == (0, 1)
+
+
+def test_staggered_biweekly_groups_do_not_clash():
+    events = [
+        WeeklyEvent("Group A", "grpA", 2, time(14, 0), time(16, 0), location="Lab", biweekly=True, start_week=1),
+        WeeklyEvent("Group B", "grpB", 2, time(14, 0), time(16, 0), location="Lab", biweekly=True, start_week=2),
+        WeeklyEvent("Next slot", "next", 2, time(16, 0), time(17, 0), location="Lab"),
+    ]
+    assert find_conflicts(events, 2025, "winter") == []
+
+
+def test_custom_resource_key_and_time_zones():
+    lecturers = {"a": "Prof. X", "b": "Prof. X", "c": ""}
+    events = [
+        WeeklyEvent("Berlin", "a", 1, time(15, 0), time(16, 0), location="R1"),
+        # 09:30-10:30 in New York overlaps 15:00-16:00 in Berlin all semester
+        WeeklyEvent("Remote", "b", 1, time(9, 30), time(10, 30), location="Zoom", timezone="America/New_York"),
+        WeeklyEvent("Unassigned", "c", 1, time(15, 0), time(16, 0), location="R1"),
+    ]
+    by_lecturer = find_conflicts(events, 2025, "winter", key=lambda ev: lecturers[ev.course_id])
+    assert by_lecturer
+    assert {c.resource for c in by_lecturer} == {"Prof. X"}
+    assert all({c.event, c.other_event} == {0, 1} for c in by_lecturer)
+
+
+def test_matches_pairwise_comparison():
+    rng = random.Random(7)
+    events = [
+        WeeklyEvent(
+            f"C{i}", f"c{i}", rng.randrange(5), time(rng.randrange(8, 17)), time(rng.randrange(8, 17), 59),
+            location=f"R{rng.randrange(4)}", biweekly=rng.random() < 0.3, start_week=rng.randrange(1, 3),
+        )
+        for i in range(40)
+    ]
+    events = [ev for ev in events if ev.start_time < ev.end_time]
+    info = get_semester_info(2026, "summer", "en")
+    table = OccurrenceTable.build(events, info, get_semester_holidays(2026, "summer", "en"))
+    expected = set()
+    for i in range(len(table)):
+        for j in range(i + 1, len(table)):
+            a, b = table[i], table[j]
+            if events[a.event].location == events[b.event].location and a.start < b.end and b.start < a.end:
+                expected.add(frozenset((i, j)))
+
+    conflicts = find_conflicts(events, 2026, "summer", occurrences=table)
+    uids = {
+        frozenset(
+            row for row in range(len(table))
+            if f"{events[table[row].event].course_id}-2026-summer-lesson-{table[row].lesson}@hm.edu" in (c.uid, c.other_uid)
+        )
+        for c in conflicts
+    }
+    assert len(conflicts) == len(expected)
+    assert uids == expected
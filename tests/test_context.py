@@ -0,0 +1,26 @@
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from hm_semester.context import UTC, GenerationContext
+
+
+def test_dtstamp_normalized_to_utc():
+    ctx = GenerationContext(datetime(2026, 1, 1, 13, 0, 30, 123, tzinfo=timezone(timedelta(hours=1))))
+    assert ctx.dtstamp == datetime(2026, 1, 1, 12, 0, 30, tzinfo=UTC)
+    assert GenerationContext(datetime(2026, 1, 1, 12, 0)).dtstamp.tzinfo is UTC
+
+
+def test_offset_table_is_shared_per_context():
+    ctx = GenerationContext(first=date(2026, 3, 16), last=date(2026, 7, 10))
+    assert ctx.offsets("Europe/Berlin") is ctx.offsets("Europe/Berlin")
+
+
+def test_to_utc_matches_zoneinfo():
+    tz = ZoneInfo("Europe/Berlin")
+    day = date(2026, 3, 1)
+    for ctx in (GenerationContext(first=day, last=day + timedelta(days=60)), GenerationContext()):
+        for i in range(60):
+            for t in (time(0, 30), time(2, 30), time(9, 0), time(23, 59)):
+                d = day + timedelta(days=i)
+                expected = datetime.combine(d, t, tzinfo=tz).astimezone(UTC)
+                assert ctx.to_utc(d, t, "Europe/Berlin") == expected
@@ -0,0 +1,58 @@
+from dataclasses import replace
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+import icalendar
+
+from hm_semester.agenda import WeeklyEvent, create_agenda
+from hm_semester.diff import diff_agenda
+
+STAMP = datetime(2026, 2, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+
+EVENTS = [
+    WeeklyEvent("Algorithms", "CS101", 0, time(9, 0), time(11, 0), location="Room 101"),
+    WeeklyEvent("Databases", "CS202", 2, time(14, 0), time(16, 0), location="Lab 305"),
+]
+
+
+def _vevents(ical: bytes) -> dict[str, bytes]:
+    cal = icalendar.Calendar.from_ical(ical)
+    return {str(e["UID"]): e.to_ical() for e in cal.walk("VEVENT")}
+
+
+def test_no_changes():
+    diff = diff_agenda(EVENTS, EVENTS, 2026, "en", "summer", dtstamp=STAMP)
+    assert not diff
+    assert diff.update == b""
+    assert diff.cancel == b""
+
+
+def test_changed_location_emits_only_that_course():
+    new_events = [replace(EVENTS[0], location="Room 999", sequence=1), EVENTS[1]]
+    diff = diff_agenda(EVENTS, new_events, 2026, "en", "summer", dtstamp=STAMP)
+
+    assert diff.added == [] and diff.removed == []
+    assert diff.changed and all(uid.startswith("CS101-") for uid in diff.changed)
+
+    # The emitted VEVENTs equal those of a full regeneration
+    full = _vevents(create_agenda(new_events, 2026, "en", "summer", dtstamp=STAMP).to_ical())
+    emitted = _vevents(diff.update)
+    assert set(emitted) == set(diff.changed)
+    for uid, vevent in emitted.items():
+        assert vevent == full[uid]
+
+
+def test_removed_and_added_lessons():
+    new_events = [replace(EVENTS[0], max_reps=3), WeeklyEvent("New", "NEW1", 4, time(8), time(9))]
+    diff = diff_agenda(EVENTS, new_events, 2026, "en", "summer", dtstamp=STAMP)
+
+    assert diff.added and all(uid.startswith("NEW1-") for uid in diff.added)
+    assert any(uid.startswith("CS202-") for uid in diff.removed)
+    assert "CS101-2026-summer-lesson-4@hm.edu" in diff.removed
+    assert "CS101-2026-summer-lesson-3@hm.edu" not in diff.removed
+
+    cancel = icalendar.Calendar.from_ical(diff.cancel)
+    assert cancel["METHOD"] == "CANCEL"
+    cancelled = cancel.walk("VEVENT")
+    assert [str(e["UID"]) for e in cancelled] == diff.removed
+    assert all(e["STATUS"] == "CANCELLED" and e["SEQUENCE"] == 1 for e in cancelled)
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timedelta, timezone
+
+from icalendar import Calendar, Event
+
+from hm_semester.ical import (
+    LectureTemplate,
+    escape_text,
+    fold_line,
+    format_offset,
+    format_utc,
+    text_line,
+    unescape_text,
+    vtimezone,
+)
+
+
+def test_escape_text():
+    assert escape_text('a,b;c\\d\ne') == 'a\\,b\\;c\\\\d\\ne'
+
+
+def test_unescape_text_reverses_escape_text():
+    for text in ["plain", 'a,b;c\\d\ne', "\\n literal", "Prof. Müller; Room 1,2"]:
+        assert unescape_text(escape_text(text)) == text
+
+
+def test_fold_line_short_lines_unchanged():
+    assert fold_line("SUMMARY:short") == "SUMMARY:short"
+
+
+def test_fold_line_limits_octets():
+    folded = fold_line("SUMMARY:" + "ä" * 100)
+    for physical in folded.split("\r\n"):
+        assert len(physical.encode("utf-8")) <= 75
+
+
+def test_fold_line_keeps_escapes_together():
+    folded = fold_line("SUMMARY:" + "x" * 65 + "\\,tail")
+    assert "\\\r\n ," not in folded
+
+
+def test_text_line_matches_icalendar():
+    for text in ["Room 101", "A, B; C", "Ünïcödé " * 20, "x" * 66 + "\\,\\;" * 10]:
+        event = Event()
+        event.add("summary", text)
+        expected = [line for line in event.to_ical().split(b"\r\n") if line]
+        # BEGIN:VEVENT, folded SUMMARY, END:VEVENT
+        assert text_line("SUMMARY", text) == b"\r\n".join(expected[1:-1]) + b"\r\n"
+
+
+def test_format_utc():
+    assert format_utc(datetime(2026, 3, 16, 8, 0, tzinfo=timezone.utc)) == "20260316T080000Z"
+
+
+def test_lecture_template_matches_icalendar():
+    stamp = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    start = datetime(2026, 3, 16, 8, 0, tzinfo=timezone.utc)
+    end = datetime(2026, 3, 16, 10, 0, tzinfo=timezone.utc)
+    for sequence, location in [(0, ""), (3, "Room 101, Building A; a long location name")]:
+        template = LectureTemplate(
+            "Algorithms; Übung, part " + "x" * 50, "CS101-2026-summer-lesson-", "@hm.edu",
+            sequence, location, stamp,
+        )
+        event = Event()
+        event.add("summary", "Algorithms; Übung, part " + "x" * 50 + " (12)")
+        event.add("uid", "CS101-2026-summer-lesson-12@hm.edu")
+        event.add("dtstamp", stamp)
+        event.add("sequence", sequence)
+        if sequence > 0:
+            event.add("last-modified", stamp)
+        event.add("dtstart", start)
+        event.add("dtend", end)
+        if location:
+            event.add("location", location)
+        assert template.render(12, start, end) == event.to_ical()
+
+
+def test_format_offset():
+    assert format_offset(timedelta(hours=1)) == "+0100"
+    assert format_offset(timedelta(hours=-5)) == "-0500"
+    assert format_offset(timedelta(hours=5, minutes=30)) == "+0530"
+
+
+def test_vtimezone_lists_transitions():
+    ical = vtimezone("Europe/Berlin", date(2025, 10, 1), date(2026, 2, 7))
+    tz = Calendar.from_ical(b"BEGIN:VCALENDAR\r\n" + ical + b"END:VCALENDAR\r\n").walk("VTIMEZONE")[0]
+    observances = [(c.name, str(c.get("tzname"))) for c in tz.subcomponents]
+    assert observances == [("DAYLIGHT", "CEST"), ("STANDARD", "CET")]
+    assert b"DTSTART:20251026T030000\r\nTZOFFSETFROM:+0200\r\nTZOFFSETTO:+0100" in ical
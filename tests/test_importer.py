@@ -0,0 +1,130 @@
+import io
+from datetime import datetime, time
+
+import pytest
+
+from hm_semester.agenda import agenda_range, render_agenda
+from hm_semester.importer import (
+    group_lessons,
+    iter_content_lines,
+    iter_lessons,
+    read_agenda,
+    read_agendas,
+)
+from hm_semester.semester import render_calendar
+from hm_semester.types import WeeklyEvent
+
+DTSTAMP = datetime(2026, 1, 1, 12, 0)
+
+EVENTS = [
+    WeeklyEvent("Algorithms", "CS101", 0, time(9), time(11), "Room 101"),
+    WeeklyEvent("Databases", "CS202", 3, time(13, 15), time(14, 45), "Lab 305", sequence=2),
+    WeeklyEvent("Seminar", "CS303", 4, time(14), time(16), "Room 202", True, 2),
+    WeeklyEvent("Project", "CS404", 1, time(8), time(10), biweekly=True, max_reps=3),
+    WeeklyEvent("Kick-off", "CS505", 2, time(10), time(12), start_week=3, max_reps=1),
+    WeeklyEvent(
+        "Übung Künstliche Intelligenz; Gruppe A, B und C (Wiederholung)",
+        "AI-7",
+        2,
+        time(17),
+        time(18, 30),
+        "Raum R1.046, Lothstraße 64",
+    ),
+]
+
+
+def _read(data: bytes, timezone: str = "Europe/Berlin"):
+    return group_lessons(iter_lessons(io.BytesIO(data), timezone))
+
+
+@pytest.mark.parametrize("year,semester", [(2026, "summer"), (2025, "winter")])
+def test_round_trip(year, semester):
+    data = render_agenda(EVENTS, year, "en", semester, dtstamp=DTSTAMP)
+    (agenda,) = _read(data)
+    assert (agenda.year, agenda.semester) == (year, semester)
+    assert agenda.irregular == []
+    assert render_agenda(agenda.events, year, "en", semester, dtstamp=DTSTAMP) == data
+
+
+def test_recovers_event_fields():
+    (agenda,) = _read(render_agenda(EVENTS, 2026, "en", "summer", dtstamp=DTSTAMP))
+    by_id = {ev.course_id: ev for ev in agenda.events}
+    assert by_id["CS101"] == EVENTS[0]
+    assert by_id["CS202"].sequence == 2
+    assert by_id["CS303"].biweekly and by_id["CS303"].start_week == 2
+    assert by_id["CS404"].max_reps == 3
+    assert by_id["AI-7"].summary == EVENTS[5].summary
+    assert by_id["AI-7"].location == EVENTS[5].location
+
+
+def test_updated_events_round_trip():
+    data = render_agenda(EVENTS, 2026, "en", "summer", dtstamp=DTSTAMP)
+    (agenda,) = _read(data)
+    agenda.events[0].location = "Room 102"
+    agenda.events[0].sequence += 1
+    (updated,) = _read(render_agenda(agenda.events, 2026, "en", "summer", dtstamp=DTSTAMP))
+    assert updated.events[0].location == "Room 102"
+    assert updated.events[0].sequence == 1
+
+
+def test_other_time_zone():
+    events = [WeeklyEvent("Remote", "NY1", 0, time(9), time(10), timezone="America/New_York")]
+    data = render_agenda(events, 2026, "en", "summer", dtstamp=DTSTAMP)
+    (agenda,) = _read(data, "America/New_York")
+    assert agenda.events == events
+    # US and EU daylight saving time start on different days, so the lesson
+    # times drift when read as Berlin times
+    (berlin,) = _read(data)
+    assert berlin.irregular == ["NY1"]
+
+
+def test_lesson_moved_by_dst_switch():
+    # The second lesson falls on 2022-03-27, when 02:15 does not exist in Berlin
+    events = [WeeklyEvent("Night", "N1", 6, time(2, 15), time(4), start_week=2)]
+    data = render_agenda(events, 2022, "en", "summer", dtstamp=DTSTAMP)
+    (agenda,) = _read(data)
+    assert agenda.events == events
+    assert agenda.irregular == []
+    assert render_agenda(agenda.events, 2022, "en", "summer", dtstamp=DTSTAMP) == data
+
+
+def test_irregular_lessons_are_reported():
+    data = render_agenda(EVENTS[:1], 2026, "en", "summer", dtstamp=DTSTAMP)
+    # Drop the second lesson
+    start = data.index(b"BEGIN:VEVENT\r\nSUMMARY:Algorithms (2)")
+    end = data.index(b"END:VEVENT\r\n", start) + len(b"END:VEVENT\r\n")
+    (agenda,) = _read(data[:start] + data[end:])
+    assert agenda.irregular == ["CS101"]
+
+
+def test_unfolds_continuation_lines():
+    data = b"BEGIN:VEVENT\r\nSUMMARY:Long\r\n  summary\r\n\ttext\r\nEND:VEVENT\r\n"
+    assert list(iter_content_lines(io.BytesIO(data))) == [
+        "BEGIN:VEVENT",
+        "SUMMARY:Long summarytext",
+        "END:VEVENT",
+    ]
+
+
+def test_skips_non_lesson_events():
+    assert _read(render_calendar(2026, "summer", "en")) == []
+
+
+def test_multiple_semesters(tmp_path):
+    path = tmp_path / "range.ics"
+    path.write_bytes(b"".join(agenda_range(EVENTS, 2025, 2026, dtstamp=DTSTAMP)))
+    agendas = read_agendas(path)
+    assert [(a.year, a.semester) for a in agendas] == [
+        (2025, "summer"),
+        (2025, "winter"),
+        (2026, "summer"),
+        (2026, "winter"),
+    ]
+    with pytest.raises(ValueError, match="Expected one semester"):
+        read_agenda(path)
+
+
+def test_read_agenda(tmp_path):
+    path = tmp_path / "agenda.ics"
+    path.write_bytes(render_agenda(EVENTS, 2026, "en", "summer", dtstamp=DTSTAMP))
+    assert len(read_agenda(path).events) == len(EVENTS)
@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+import pytest
+
+from hm_semester.intervals import HolidayCalendar
+from hm_semester.schedule import calculate_lecture_dates
+from hm_semester.util import get_holiday_dates, get_summer_semester_info, get_winter_semester_info
+
+
+def _days(first: date, last: date) -> set[date]:
+    return {first + timedelta(days=i) for i in range((last - first).days + 1)}
+
+
+def test_merges_overlapping_and_adjacent_intervals():
+    cal = HolidayCalendar(
+        [(date(2026, 4, 2), date(2026, 4, 7)), (date(2026, 4, 6), date(2026, 4, 10))],
+        [date(2026, 4, 11), date(2026, 5, 1), date(2026, 5, 1)],
+    )
+    assert cal.intervals() == [
+        (date(2026, 4, 2), date(2026, 4, 11)),
+        (date(2026, 5, 1), date(2026, 5, 1)),
+    ]
+    assert len(cal) == 11
+
+
+def test_contains():
+    cal = HolidayCalendar([(date(2026, 4, 2), date(2026, 4, 7))], [date(2026, 5, 1)])
+    assert date(2026, 4, 2) in cal
+    assert date(2026, 4, 7) in cal
+    assert date(2026, 4, 8) not in cal
+    assert date(2026, 5, 1) in cal
+    assert date(2026, 1, 1) not in cal
+    assert "2026-05-01" not in cal
+
+
+def test_between_and_set_operations():
+    a = HolidayCalendar([(date(2026, 1, 1), date(2026, 1, 10)), (date(2026, 2, 1), date(2026, 2, 5))])
+    b = HolidayCalendar([(date(2026, 1, 8), date(2026, 2, 2))])
+    assert a.between(date(2026, 1, 5), date(2026, 2, 1)).to_set() == _days(
+        date(2026, 1, 5), date(2026, 1, 10)
+    ) | {date(2026, 2, 1)}
+    assert (a & b).to_set() == a.to_set() & b.to_set()
+    assert (a | b).to_set() == a.to_set() | b.to_set()
+    assert (a | b).intervals() == [(date(2026, 1, 1), date(2026, 2, 5))]
+
+
+@pytest.mark.parametrize("year", range(2020, 2031))
+@pytest.mark.parametrize("get_info", [get_summer_semester_info, get_winter_semester_info])
+def test_from_semester_matches_holiday_dates(year, get_info):
+    info = get_info(year, "de")
+    cal = HolidayCalendar.from_semester(info)
+    holidays = get_holiday_dates(info)
+    assert cal.to_set() == holidays
+    for weekday in range(5):
+        assert calculate_lecture_dates(
+            info.start_date, info.end_date, weekday, cal, True, 2
+        ) == calculate_lecture_dates(info.start_date, info.end_date, weekday, holidays, True, 2)
+
+
+def test_long_breaks_stay_compact():
+    cal = HolidayCalendar([(date(2000, 1, 1), date(2099, 12, 31))])
+    assert cal.intervals() == [(date(2000, 1, 1), date(2099, 12, 31))]
+    assert date(2050, 6, 1) in cal
+    assert cal.ordinals(date(2050, 6, 1).toordinal(), date(2050, 6, 3).toordinal()) == [
+        date(2050, 6, d).toordinal() for d in (1, 2, 3)
+    ]
+
+
+def test_from_semesters_matches_holiday_dates_range():
+    from hm_semester.util import get_holiday_dates_range
+
+    infos = [get_summer_semester_info(year, "en") for year in (2024, 2025)]
+    infos += [get_winter_semester_info(year, "en") for year in (2024, 2025)]
+    calendars = HolidayCalendar.from_semesters(infos)
+    assert [cal.to_set() for cal in calendars] == get_holiday_dates_range(infos)
@@ -0,0 +1,172 @@
+import json
+from datetime import time
+
+import pytest
+
+from hm_semester.loader import (
+    TimetableError,
+    TimetableLoader,
+    iter_timetable,
+    load_timetable,
+)
+from hm_semester.types import FrozenWeeklyEvent, WeeklyEvent
+
+CSV = """calendar,summary,course_id,weekday,start_time,end_time,location,biweekly,start_week,max_reps,timezone
+Prof. A,Algorithms,CS101,0,09:00,11:00,Room 101,,,,
+Prof. A,Seminar,CS303,4,14:00,16:00,Room 202,true,2,5,
+Prof. B,Databases,CS202,2,13:00,15:00,Lab 305,,,,America/New_York
+"""
+
+RECORDS = [
+    {"calendar": "Prof. A", "summary": "Algorithms", "course_id": "CS101", "weekday": 0,
+     "start_time": "09:00", "end_time": "11:00", "location": "Room 101"},
+    {"calendar": "Prof. A", "summary": "Seminar", "course_id": "CS303", "weekday": 4,
+     "start_time": "14:00", "end_time": "16:00", "location": "Room 202", "biweekly": True,
+     "start_week": 2, "max_reps": 5},
+    {"calendar": "Prof. B", "summary": "Databases", "course_id": "CS202", "weekday": 2,
+     "start_time": "13:00", "end_time": "15:00", "location": "Lab 305", "timezone": "America/New_York"},
+]
+
+EXPECTED = {
+    "Prof. A": [
+        WeeklyEvent("Algorithms", "CS101", 0, time(9), time(11), "Room 101"),
+        WeeklyEvent("Seminar", "CS303", 4, time(14), time(16), "Room 202", True, 2, 5),
+    ],
+    "Prof. B": [
+        WeeklyEvent("Databases", "CS202", 2, time(13), time(15), "Lab 305", timezone="America/New_York"),
+    ],
+}
+
+
+def test_load_csv(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_text(CSV)
+    result = load_timetable(path)
+    assert result.errors == []
+    assert result.timetables == EXPECTED
+    assert len(result.events) == 3
+
+
+def test_load_json_and_jsonl(tmp_path):
+    json_path = tmp_path / "timetable.json"
+    json_path.write_text(json.dumps({"events": RECORDS}))
+    jsonl_path = tmp_path / "timetable.jsonl"
+    jsonl_path.write_text("\n".join(json.dumps(r) for r in RECORDS) + "\n")
+    assert load_timetable(json_path).timetables == EXPECTED
+    assert load_timetable(jsonl_path).timetables == EXPECTED
+
+
+def test_iter_timetable_streams(tmp_path):
+    path = tmp_path / "timetable.txt"
+    path.write_text(CSV)
+    pairs = iter_timetable(path, "csv")
+    assert next(pairs) == ("Prof. A", EXPECTED["Prof. A"][0])
+    with pytest.raises(ValueError, match="Cannot infer"):
+        next(iter_timetable(path))
+
+
+def test_row_errors(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_text(
+        "summary,course_id,weekday,start_time,end_time,biweekly,timezone\n"
+        "Ok,A,0,09:00,10:00,,\n"
+        "Bad day,B,7,09:00,10:00,,\n"
+        "Backwards,C,1,11:00,10:00,,\n"
+        "Duplicate,A,2,09:00,10:00,,\n"
+        ",D,x,9am,10:00,maybe,Mars/Base\n"
+        "Bad day again,E,7,09:00,10:00,,\n"
+    )
+    result = load_timetable(path)
+    assert [ev.course_id for ev in result.events] == ["A"]
+    assert [(e.row, e.field) for e in result.errors] == [
+        (3, "weekday"),
+        (4, "end_time"),
+        (5, "course_id"),
+        (6, "summary"),
+        (6, "weekday"),
+        (6, "start_time"),
+        (6, "biweekly"),
+        (6, "timezone"),
+        (7, "weekday"),
+    ]
+    assert str(result.errors[0]) == "row 3, weekday: weekday must be 0 (Monday) to 6 (Sunday), got 7"
+    with pytest.raises(TimetableError, match="9 invalid timetable rows"):
+        result.raise_for_errors()
+
+
+def test_invalid_jsonl_lines(tmp_path):
+    path = tmp_path / "timetable.jsonl"
+    path.write_text(json.dumps(RECORDS[0]) + "\n{oops\n[1]\n")
+    result = load_timetable(path)
+    assert len(result.events) == 1
+    assert [(e.row, e.field) for e in result.errors] == [(2, None), (3, None)]
+
+
+def test_duplicate_course_ids_allowed_across_calendars():
+    loader = TimetableLoader(FrozenWeeklyEvent)
+    records = [
+        (1, {"calendar": "a", "summary": "S", "course_id": "X", "weekday": 0, "start_time": "09:00", "end_time": "10:00"}),
+        (2, {"calendar": "b", "summary": "S", "course_id": "X", "weekday": 0, "start_time": "09:00", "end_time": "10:00"}),
+    ]
+    events = list(loader.iter_records(records))
+    assert [calendar for calendar, _ in events] == ["a", "b"]
+    assert isinstance(events[0][1], FrozenWeeklyEvent)
+    assert loader.errors == []
+
+
+def test_time_formats(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_text(
+        "summary,course_id,weekday,start_time,end_time\n"
+        "Short,A,0,8:00,9:30\n"
+        "Seconds,B,0,08:00:00,09:30\n"
+        "Offset,C,0,10:00+01:00,11:00\n"
+        "Bad,D,0,25:00,26:00\n"
+    )
+    result = load_timetable(path)
+    assert [(ev.course_id, ev.start_time) for ev in result.events] == [("A", time(8)), ("B", time(8))]
+    assert [(e.row, e.field) for e in result.errors] == [(4, "start_time"), (5, "start_time"), (5, "end_time")]
+
+
+def test_json_scalar_document(tmp_path):
+    path = tmp_path / "timetable.json"
+    path.write_text("5")
+    with pytest.raises(ValueError, match="list of records"):
+        load_timetable(path)
+
+
+def test_csv_with_byte_order_mark(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_bytes(CSV.encode("utf-8-sig"))
+    result = load_timetable(path)
+    assert result.errors == []
+    assert result.timetables == EXPECTED
+
+
+def test_multiline_cells_keep_line_numbers(tmp_path):
+    path = tmp_path / "timetable.csv"
+    path.write_text(
+        'summary,course_id,weekday,start_time,end_time\n'
+        '"Two\nlines",A,0,09:00,10:00\n'
+        '\n'
+        'Bad,B,9,09:00,10:00\n'
+    )
+    result = load_timetable(path)
+    assert result.events[0].summary == "Two\nlines"
+    assert [(e.row, e.field) for e in result.errors] == [(5, "weekday")]
+
+
+def test_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr("hm_semester.loader._BATCH_SIZE", 2)
+    path = tmp_path / "timetable.csv"
+    path.write_text(
+        "summary,course_id,weekday,start_time,end_time\n"
+        "One,A,0,09:00,10:00\n"
+        "Two,B,1,09:00,10:00\n"
+        "Three,C,2,9:00,10:00\n"
+        "Again,A,3,09:00,10:00\n"
+        "Short,D,4\n"
+    )
+    result = load_timetable(path)
+    assert [ev.course_id for ev in result.events] == ["A", "B", "C"]
+    assert [(e.row, e.field) for e in result.errors] == [(5, "course_id"), (6, "start_time"), (6, "end_time")]
@@ -1,3 +1,4 @@
+import json
 import subprocess
 import sys
 
@@ -25,3 +26,77 @@ def test_main_cli(tmp_path):
     content = output_file.read_text()
     assert "BEGIN:VCALENDAR" in content
     assert "Winter Semester" in content or "Wintersemester" in content
+
+
+def test_build_all_cli(tmp_path):
+    (tmp_path / "timetable.csv").write_text(
+        "calendar,summary,course_id,weekday,start_time,end_time\n"
+        "Prof. A,Algorithms,CS101,0,09:00,11:00\n"
+        "Prof. B,Databases,CS202,2,13:00,15:00\n"
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "hm_semester",
+            "build-all",
+            "--input",
+            "timetable.csv",
+            "--year",
+            "2026",
+            "--semester",
+            "summer",
+            "--jobs",
+            "2",
+            "--out-dir",
+            "out",
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    report = json.loads((tmp_path / "out" / "build_report.json").read_text())
+    assert report["calendars"] == 2
+    assert (tmp_path / "out" / "Prof._A.ics").read_bytes().startswith(b"BEGIN:VCALENDAR")
+    assert (tmp_path / "out" / "Prof._B.csv").exists()
+
+
+def test_build_all_cli_reports_invalid_rows(tmp_path):
+    (tmp_path / "timetable.csv").write_text(
+        "calendar,summary,course_id,weekday,start_time,end_time\n"
+        "Prof. A,Algorithms,CS101,9,09:00,11:00\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "hm_semester", "build-all", "--input", "timetable.csv",
+         "--year", "2026", "--semester", "summer"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1
+    assert "Error: 1 invalid timetable rows: row 2, weekday" in result.stderr
+    assert "Traceback" not in result.stderr
+
+
+def _imported_modules(module: str) -> set[str]:
+    """Return the modules loaded by a fresh ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_cli_import_is_lazy():
+    """The CLI must not load holidays or icalendar just to start up."""
+    imported = _imported_modules("hm_semester.__main__")
+    assert "hm_semester.__main__" in imported
+    assert "holidays" not in imported
+    assert "icalendar" not in imported
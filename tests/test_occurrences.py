@@ -0,0 +1,95 @@
+import dataclasses
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from hm_semester.agenda import create_agenda, create_moodle_csv, iter_compact_agenda, render_agenda
+from hm_semester.cache import get_semester_holidays, get_semester_info
+from hm_semester.conflicts import find_conflicts
+from hm_semester.occurrences import OccurrenceTable
+from hm_semester.schedule import calculate_lecture_dates_bulk
+from hm_semester.types import FrozenWeeklyEvent, WeeklyEvent
+
+STAMP = datetime(2026, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
+
+
+def _events():
+    return [
+        FrozenWeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 30), location="R1", sequence=1),
+        FrozenWeeklyEvent("Lab", "lab", 3, time(13, 0), time(15, 0), biweekly=True, start_week=2),
+        FrozenWeeklyEvent("Seminar", "sem", 2, time(8, 0), time(9, 0), max_reps=3, timezone="America/New_York"),
+    ]
+
+
+def _table(events, year=2026, semester="summer"):
+    info = get_semester_info(year, semester, "en")
+    return OccurrenceTable.build(events, info, get_semester_holidays(year, semester, "en"))
+
+
+def test_frozen_weekly_event_is_slotted_and_immutable():
+    ev = FrozenWeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0))
+    assert not hasattr(ev, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ev.location = "R2"
+    assert ev == FrozenWeeklyEvent(**dataclasses.asdict(WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0))))
+
+
+def test_table_rows_match_bulk_schedule():
+    events = _events()
+    table = _table(events)
+    info = get_semester_info(2026, "summer", "en")
+    schedules = calculate_lecture_dates_bulk(events, info, get_semester_holidays(2026, "summer", "en"))
+    assert len(table) == sum(len(s) for s in schedules)
+    for index, dates in enumerate(schedules):
+        assert table.dates(index) == list(dates)
+        assert [table[row].lesson for row in table.rows(index)] == list(range(1, len(dates) + 1))
+
+
+def test_occurrence_times_are_utc():
+    table = _table(_events())
+    first = table[0]
+    # 16 March 2026 is before the switch to CEST
+    assert first.date == date(2026, 3, 16)
+    assert first.dtstart == datetime(2026, 3, 16, 8, 0, tzinfo=ZoneInfo("UTC"))
+    assert first.dtend - first.dtstart == (datetime(1, 1, 1, 10, 30) - datetime(1, 1, 1, 9, 0))
+
+
+def test_agenda_from_table_matches_events():
+    events = _events()
+    table = _table(events)
+    expected = create_agenda(events, 2026, "en", "summer", dtstamp=STAMP).to_ical()
+    assert create_agenda(events, 2026, "en", "summer", dtstamp=STAMP, occurrences=table).to_ical() == expected
+    assert render_agenda(events, 2026, "en", "summer", dtstamp=STAMP, occurrences=table) == expected
+
+
+def test_moodle_csv_from_table_matches_events():
+    events = _events()
+    table = _table(events)
+    expected = create_moodle_csv(events, 2026, "en", "summer")
+    assert create_moodle_csv(events, 2026, "en", "summer", occurrences=table) == expected
+
+
+@pytest.mark.parametrize(
+    "render",
+    [
+        lambda events, table: create_agenda(events, 2026, "en", "summer", occurrences=table),
+        lambda events, table: render_agenda(events, 2026, "en", "summer", occurrences=table),
+        lambda events, table: list(iter_compact_agenda(events, 2026, "en", "summer", occurrences=table)),
+        lambda events, table: create_moodle_csv(events, 2026, "en", "summer", occurrences=table),
+        lambda events, table: find_conflicts(events, 2026, "summer", occurrences=table),
+    ],
+)
+def test_table_must_match_events_and_semester(render):
+    events = _events()
+    with pytest.raises(ValueError, match="different events"):
+        render(events[:2], _table(events))
+    with pytest.raises(ValueError, match="semester starting"):
+        render(events, _table(events, 2025, "winter"))
+
+
+def test_table_memory_per_occurrence():
+    events = [FrozenWeeklyEvent(f"C{i}", f"c{i}", i % 5, time(9, 0), time(10, 0)) for i in range(200)]
+    table = _table(events, 2025, "winter")
+    assert len(table) > 2000
+    assert table.nbytes() == 26 * len(table) + 8 * (len(events) + 1)
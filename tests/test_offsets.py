@@ -0,0 +1,54 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from hm_semester.offsets import UTC, UtcOffsetTable
+
+TIMES = [time(h, m) for h in range(24) for m in (0, 30)]
+
+
+@pytest.mark.parametrize(
+    "tz_name", ["Europe/Berlin", "America/New_York", "Australia/Sydney", "Asia/Tokyo", "UTC"]
+)
+def test_matches_zoneinfo_for_semester(tz_name):
+    first, last = date(2025, 10, 1), date(2026, 7, 31)
+    table = UtcOffsetTable(tz_name, first, last)
+    day = first
+    while day <= last:
+        for t in TIMES:
+            expected = datetime.combine(day, t, tzinfo=table.tz).astimezone(UTC)
+            assert table.to_utc(day, t) == expected, (day, t)
+        day += timedelta(days=1)
+
+
+def test_days_without_transition_use_lookup():
+    table = UtcOffsetTable("Europe/Berlin", date(2026, 3, 16), date(2026, 7, 10))
+    # Only the days around 29 March 2026 need a full resolution
+    assert sum(offset is None for offset in table._days) <= 3
+
+
+def test_ambiguous_time():
+    # 25 October 2026, 02:30 occurs twice in Berlin
+    table = UtcOffsetTable("Europe/Berlin", date(2026, 10, 1), date(2026, 10, 31))
+    day, t = date(2026, 10, 25), time(2, 30)
+    assert table.to_utc(day, t) == datetime(2026, 10, 25, 0, 30, tzinfo=UTC)
+    assert table.to_utc(day, t, ambiguous="later") == datetime(2026, 10, 25, 1, 30, tzinfo=UTC)
+    with pytest.raises(ValueError):
+        table.to_utc(day, t, ambiguous="raise")
+
+
+def test_nonexistent_time():
+    # 29 March 2026, 02:30 does not exist in Berlin
+    table = UtcOffsetTable("Europe/Berlin", date(2026, 3, 1), date(2026, 3, 31))
+    day, t = date(2026, 3, 29), time(2, 30)
+    assert table.to_utc(day, t) == datetime(2026, 3, 29, 1, 30, tzinfo=UTC)
+    assert table.to_utc(day, t, nonexistent="shift_backward") == datetime(
+        2026, 3, 29, 0, 30, tzinfo=UTC
+    )
+    with pytest.raises(ValueError):
+        table.to_utc(day, t, nonexistent="raise")
+
+
+def test_outside_range_falls_back_to_zoneinfo():
+    table = UtcOffsetTable("Europe/Berlin", date(2026, 3, 16), date(2026, 7, 10))
+    assert table.to_utc(date(2026, 12, 1), time(9)) == datetime(2026, 12, 1, 8, tzinfo=UTC)
@@ -0,0 +1,85 @@
+import logging
+from datetime import time
+
+import pytest
+
+from hm_semester.agenda import create_agenda, create_moodle_csv, render_agenda
+from hm_semester.cache import clear_caches
+from hm_semester.profiling import Profile, count, phase, profile
+from hm_semester.semester import generate_calendar, render_calendar
+from hm_semester.types import WeeklyEvent
+
+EVENTS = [
+    WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0)),
+    WeeklyEvent("Lab", "lab", 2, time(13, 0), time(15, 0), biweekly=True),
+]
+
+
+def test_disabled_phase_and_count_do_nothing():
+    with phase("anything"):
+        count("anything")
+        count("lazy", lambda: pytest.fail("count computed without a profile"))
+
+
+def test_lazy_counts():
+    with profile() as prof:
+        count("lazy", lambda: 3)
+        count("compact", 2)
+    assert dict(prof.counts) == {"lazy": 3, "compact": 2}
+
+
+def test_render_agenda_phases_and_counts():
+    clear_caches()
+    with profile() as prof:
+        ical = render_agenda(EVENTS, 2026, "en", "summer")
+    result = prof.as_dict()
+    assert set(result["timings"]) == {"semester_info", "holidays", "scheduling", "serialization"}
+    assert result["counts"]["events"] == 2
+    assert result["counts"]["occurrences"] == ical.count(b"BEGIN:VEVENT")
+    assert result["cache"]["semester_info"]["misses"] == 1
+    assert result["total"] >= sum(result["timings"].values())
+
+
+def test_cache_hits_are_reported():
+    render_agenda(EVENTS, 2026, "en", "summer")
+    with profile() as prof:
+        render_agenda(EVENTS, 2026, "en", "summer")
+    assert prof.cache["semester_info"]["misses"] == 0
+    assert prof.cache["holiday_calendar"] == {"hits": 1, "misses": 0}
+
+
+def test_create_agenda_and_moodle_phases():
+    with profile() as prof:
+        create_agenda(EVENTS, 2026, "en", "summer")
+        create_moodle_csv(EVENTS, 2026, "en", "summer")
+    assert {"semester_info", "holidays", "scheduling", "vevents"} <= set(prof.timings)
+    assert prof.counts["events"] == 4
+
+
+def test_semester_calendar_phases():
+    with profile() as prof:
+        generate_calendar(2025, "winter", "de")
+        render_calendar(2025, "winter", "de")
+    assert {"semester_info", "vevents", "serialization"} <= set(prof.timings)
+    assert prof.counts["vevents"] == 2 * 3  # start, end and Christmas break
+
+
+def test_callback_and_logging(caplog):
+    received = []
+    with profile(callback=received.append) as prof:
+        render_calendar(2025, "winter", "de")
+    assert received == [prof.as_dict()]
+    with caplog.at_level(logging.INFO, logger="hm_semester"):
+        prof.log()
+    assert "semester_info=" in caplog.text
+    assert "vevents=3" in caplog.text
+
+
+def test_profiles_do_not_leak():
+    with profile() as outer:
+        with profile() as inner:
+            count("x")
+        count("y")
+    assert dict(inner.counts) == {"x": 1}
+    assert dict(outer.counts) == {"y": 1}
+    assert isinstance(outer, Profile)
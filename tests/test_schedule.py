@@ -0,0 +1,145 @@
+from datetime import date, timedelta
+
+import pytest
+
+from hm_semester.schedule import (
+    calculate_lecture_dates,
+    first_lecture_ordinal,
+    holiday_ordinals,
+    lecture_ordinals,
+    weekly_exdates,
+)
+from hm_semester.util import (
+    get_holiday_dates,
+    get_summer_semester_info,
+    get_winter_semester_info,
+)
+
+
+def _reference_lecture_dates(start_date, end_date, weekday, holidays, biweekly, start_week):
+    """Day-by-day walk the ordinal engine must reproduce exactly."""
+    lecture_dates = []
+    current = start_date
+    while current.weekday() != weekday:
+        current += timedelta(days=1)
+    if start_week > 1:
+        current += timedelta(days=7 * (start_week - 1))
+    occurrence_count = 0
+    while current <= end_date:
+        if current not in holidays:
+            if not biweekly:
+                lecture_dates.append(current)
+            else:
+                if occurrence_count % 2 == 0:
+                    lecture_dates.append(current)
+                occurrence_count += 1
+        current += timedelta(days=7)
+    return lecture_dates
+
+
+def test_first_lecture_ordinal():
+    start = date(2026, 3, 16)  # Monday
+    assert date.fromordinal(first_lecture_ordinal(start.toordinal(), 0)) == start
+    assert date.fromordinal(first_lecture_ordinal(start.toordinal(), 3)) == date(2026, 3, 19)
+    assert date.fromordinal(first_lecture_ordinal(start.toordinal(), 3, 3)) == date(2026, 4, 2)
+    assert first_lecture_ordinal(start.toordinal(), 0, None) == start.toordinal()
+
+
+@pytest.mark.parametrize("year", range(2020, 2031))
+@pytest.mark.parametrize("get_info", [get_summer_semester_info, get_winter_semester_info])
+def test_matches_day_by_day_walk(year, get_info):
+    info = get_info(year, "en")
+    holidays = get_holiday_dates(info)
+    for weekday in range(7):
+        for biweekly in (False, True):
+            for start_week in range(1, 6):
+                expected = _reference_lecture_dates(
+                    info.start_date, info.end_date, weekday, holidays, biweekly, start_week
+                )
+                actual = calculate_lecture_dates(
+                    info.start_date, info.end_date, weekday, holidays, biweekly, start_week
+                )
+                assert actual == expected
+
+
+def test_biweekly_holiday_shift():
+    # Week 3 Thursday of summer 2026 (April 2) is in the Easter break
+    info = get_summer_semester_info(2026, "en")
+    dates = calculate_lecture_dates(
+        info.start_date, info.end_date, 3, get_holiday_dates(info), True, 3
+    )
+    assert dates[:2] == [date(2026, 4, 9), date(2026, 4, 23)]
+
+
+def test_start_week_after_end():
+    start, end = date(2026, 3, 16), date(2026, 4, 1)
+    assert lecture_ordinals(start.toordinal(), end.toordinal(), 0, [], False, 10) == []
+
+
+def test_holiday_ordinals_sorted():
+    days = {date(2026, 5, 1), date(2026, 1, 6), date(2026, 4, 3)}
+    assert holiday_ordinals(days) == sorted(d.toordinal() for d in days)
+
+
+def test_bulk_matches_single_event_schedule():
+    from datetime import time
+
+    from hm_semester.schedule import calculate_lecture_dates_bulk
+    from hm_semester.types import WeeklyEvent
+
+    info = get_summer_semester_info(2026, "en")
+    holidays = get_holiday_dates(info)
+    events = [
+        WeeklyEvent(f"Course {i}", f"c{i}", i % 5, time(8), time(10),
+                    biweekly=bool(i % 2), start_week=1 + i % 3)
+        for i in range(60)
+    ]
+    events.append(WeeklyEvent("Short", "short", 0, time(8), time(10), max_reps=3))
+
+    schedules = calculate_lecture_dates_bulk(events, info, holidays)
+
+    assert len(schedules) == len(events)
+    for ev, dates in zip(events, schedules):
+        expected = calculate_lecture_dates(
+            info.start_date, info.end_date, ev.weekday, holidays, ev.biweekly, ev.start_week
+        )
+        if ev.max_reps is not None:
+            expected = expected[: ev.max_reps]
+        assert list(dates) == expected
+    # Events with the same schedule key share one series
+    assert schedules[0] is schedules[30]
+    assert len(schedules[-1]) == 3
+
+
+@pytest.mark.parametrize("year", [2024, 2025, 2026])
+@pytest.mark.parametrize("get_info", [get_summer_semester_info, get_winter_semester_info])
+def test_matrix_matches_python_backend(year, get_info):
+    pytest.importorskip("numpy")
+    from hm_semester.schedule import _lecture_dates_python, lecture_dates_matrix
+
+    info = get_info(year, "en")
+    holidays = get_holiday_dates(info)
+    keys = [(wd, bw, sw) for wd in range(7) for bw in (False, True) for sw in range(1, 8)]
+    assert lecture_dates_matrix(keys, info, holidays) == _lecture_dates_python(keys, info, holidays)
+
+
+def test_matrix_falls_back_without_numpy(monkeypatch):
+    from hm_semester import schedule
+
+    monkeypatch.setattr(schedule, "_numpy", lambda: None)
+    info = get_summer_semester_info(2026, "en")
+    holidays = get_holiday_dates(info)
+    [dates] = schedule.lecture_dates_matrix([(3, True, 3)], info, holidays)
+    assert dates == calculate_lecture_dates(
+        info.start_date, info.end_date, 3, holidays, True, 3
+    )
+
+
+def test_weekly_exdates():
+    mondays = [date(2026, 3, 16) + timedelta(weeks=w) for w in (0, 1, 3, 4)]
+    assert weekly_exdates(mondays) == [date(2026, 3, 30)]
+    assert weekly_exdates(mondays[:2]) == []
+    biweekly = [date(2026, 3, 16), date(2026, 3, 30), date(2026, 4, 27)]
+    assert weekly_exdates(biweekly, 2) == [date(2026, 4, 13)]
+    # A shifted biweekly date is not on the two-week grid
+    assert weekly_exdates([date(2026, 3, 16), date(2026, 4, 6)], 2) is None
@@ -121,3 +121,44 @@ def test_holiday_dates_outside_semester_not_included():
     # Fronleichnam 2026 = 4 June is well outside winter semester
     assert date(2026, 6, 4) not in holidays, "Summer holiday should not appear in winter semester"
 
+
+
+def test_render_calendar_matches_generate_calendar():
+    from datetime import datetime
+
+    from hm_semester.semester import generate_calendar, render_calendar
+
+    stamp = datetime(2026, 1, 1, 12, 0)
+    for year in range(2024, 2028):
+        for semester in ("winter", "summer"):
+            for lang in ("de", "en"):
+                expected = generate_calendar(year, semester, lang, stamp).to_ical()
+                assert render_calendar(year, semester, lang, stamp) == expected
+
+
+def test_generate_calendar_range_per_semester():
+    from datetime import datetime
+
+    from hm_semester.semester import generate_calendar_range, render_calendar
+
+    stamp = datetime(2026, 1, 1, 12, 0)
+    chunks = list(generate_calendar_range(2024, 2026, lang="de", dtstamp=stamp, combined=False))
+    expected = [
+        render_calendar(year, semester, "de", stamp)
+        for year in range(2024, 2027)
+        for semester in ("summer", "winter")
+    ]
+    assert chunks == expected
+
+
+def test_generate_calendar_range_combined():
+    import icalendar
+
+    from hm_semester.semester import generate_calendar_range
+
+    ical = b"".join(generate_calendar_range(2024, 2025, ("winter",)))
+    cal = icalendar.Calendar.from_ical(ical)
+    uids = {str(e.get("uid")) for e in cal.walk("VEVENT")}
+    assert "winter-start-2024@hm-semester.example.com" in uids
+    assert "winter-end-2025@hm-semester.example.com" in uids
+    assert not any(uid.startswith("summer") for uid in uids)
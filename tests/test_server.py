@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime, time
+
+from hm_semester.agenda import render_agenda
+from hm_semester.semester import render_calendar
+from hm_semester.server import CalendarServer
+from hm_semester.types import WeeklyEvent
+
+STAMP = datetime(2026, 1, 1, 12, 0)
+EVENTS = [WeeklyEvent("Lecture", "lec", 0, time(9, 0), time(10, 0), location="R1")]
+
+
+def _server(**kwargs):
+    return CalendarServer({"cs": EVENTS}, dtstamp=STAMP, **kwargs)
+
+
+def test_semester_feed():
+    response = asyncio.run(_server().handle("GET", "/semester/2025/winter.ics?lang=de", {}))
+    assert response.status == 200
+    assert response.body == render_calendar(2025, "winter", "de", STAMP)
+    assert response.headers["Content-Type"].startswith("text/calendar")
+    assert response.headers["ETag"].startswith('"')
+
+
+def test_agenda_feed():
+    response = asyncio.run(_server().handle("GET", "/agenda/cs/2026/summer.ics", {}))
+    assert response.status == 200
+    assert response.body == render_agenda(EVENTS, 2026, "en", "summer", STAMP)
+
+
+def test_if_none_match_returns_not_modified():
+    async def run():
+        server = _server()
+        first = await server.handle("GET", "/semester/2025/winter.ics", {})
+        etag = first.headers["ETag"]
+        second = await server.handle("GET", "/semester/2025/winter.ics", {"if-none-match": f'"x", W/{etag}'})
+        return server, second, etag
+
+    server, response, etag = asyncio.run(run())
+    assert response.status == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == etag
+    assert (server.hits, server.misses) == (1, 1)
+
+
+def test_errors():
+    server = _server()
+    assert asyncio.run(server.handle("GET", "/semester/2025/spring.ics", {})).status == 404
+    assert asyncio.run(server.handle("GET", "/agenda/nope/2025/winter.ics", {})).status == 404
+    assert asyncio.run(server.handle("GET", "/semester/2025/winter.ics?lang=fr", {})).status == 400
+    response = asyncio.run(server.handle("POST", "/semester/2025/winter.ics", {}))
+    assert response.status == 405
+    assert response.headers["Allow"] == "GET, HEAD"
+
+
+def test_concurrent_requests_render_once():
+    async def run():
+        server = _server()
+        responses = await asyncio.gather(
+            *(server.handle("GET", "/agenda/cs/2026/summer.ics", {}) for _ in range(5))
+        )
+        return server, responses
+
+    server, responses = asyncio.run(run())
+    assert server.misses == 1
+    assert len({r.body for r in responses}) == 1
+
+
+def test_lru_eviction_and_set_timetable():
+    async def run():
+        server = _server(cache_size=1)
+        await server.handle("GET", "/semester/2025/winter.ics", {})
+        await server.handle("GET", "/semester/2026/summer.ics", {})
+        await server.handle("GET", "/semester/2025/winter.ics", {})
+        assert server.misses == 3
+        old = await server.handle("GET", "/agenda/cs/2026/summer.ics", {})
+        server.set_timetable("cs", [WeeklyEvent("Lab", "lab", 1, time(9, 0), time(10, 0))])
+        new = await server.handle("GET", "/agenda/cs/2026/summer.ics", {})
+        return old, new
+
+    old, new = asyncio.run(run())
+    assert old.headers["ETag"] != new.headers["ETag"]
+    assert b"SUMMARY:Lab (1)" in new.body
+
+
+def test_http_round_trip_over_loopback():
+    async def request(port, raw):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data
+
+    async def run():
+        server = _server()
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            get = await request(port, b"GET /semester/2025/winter.ics HTTP/1.1\r\nHost: x\r\n\r\n")
+            head = await request(port, b"HEAD /semester/2025/winter.ics HTTP/1.1\r\n\r\n")
+            bad = await request(port, b"garbage\r\n\r\n")
+        return get, head, bad
+
+    get, head, bad = asyncio.run(run())
+    status, _, body = get.partition(b"\r\n\r\n")
+    assert status.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert body == render_calendar(2025, "winter", "en", STAMP)
+    assert head.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert head.endswith(b"\r\n\r\n")
+    assert bad.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+
+
+def test_percent_encoded_timetable_name():
+    server = CalendarServer({"Prof Müller": EVENTS}, dtstamp=STAMP)
+    response = asyncio.run(server.handle("GET", "/agenda/Prof%20M%C3%BCller/2026/summer.ics", {}))
+    assert response.status == 200
+    assert response.body == render_agenda(EVENTS, 2026, "en", "summer", STAMP)
+
+
+def test_year_out_of_range_and_render_errors():
+    server = _server()
+    assert asyncio.run(server.handle("GET", "/semester/0000/winter.ics", {})).status == 400
+
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    server._renderer = lambda key: fail
+    assert asyncio.run(server.handle("GET", "/semester/2025/winter.ics", {})).status == 500
+
+
+def test_set_timetable_discards_in_flight_render():
+    async def run():
+        server = _server()
+        stale = asyncio.ensure_future(server.handle("GET", "/agenda/cs/2026/summer.ics", {}))
+        await asyncio.sleep(0)  # Rendering of the old timetable has started
+        server.set_timetable("cs", [WeeklyEvent("Lab", "lab", 1, time(9, 0), time(10, 0))])
+        await stale
+        return await server.handle("GET", "/agenda/cs/2026/summer.ics", {})
+
+    response = asyncio.run(run())
+    assert b"SUMMARY:Lab (1)" in response.body
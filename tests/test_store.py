@@ -0,0 +1,96 @@
+import os
+from dataclasses import replace
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+from hm_semester.agenda import WeeklyEvent, create_moodle_csv, render_agenda
+from hm_semester.semester import generate_calendar
+from hm_semester import store
+from hm_semester.store import OutputCache, cache_key
+
+STAMP = datetime(2026, 2, 1, 9, 0, tzinfo=ZoneInfo("UTC"))
+EVENTS = [WeeklyEvent("Algorithms", "CS101", 0, time(9, 0), time(11, 0), location="Room 101")]
+
+
+def test_cache_key_is_stable_and_input_sensitive():
+    key = cache_key("agenda", EVENTS, year=2026, lang="en", semester="summer")
+    assert key == cache_key("agenda", list(EVENTS), year=2026, lang="en", semester="summer")
+    moved = [replace(EVENTS[0], location="Room 999")]
+    assert key != cache_key("agenda", moved, year=2026, lang="en", semester="summer")
+    assert key != cache_key("agenda", EVENTS, year=2026, lang="de", semester="summer")
+    assert key != cache_key("moodle", EVENTS, year=2026, lang="en", semester="summer")
+
+
+def test_agenda_hit_and_miss(tmp_path):
+    cache = OutputCache(tmp_path)
+    first = cache.agenda(EVENTS, 2026, "en", "summer", STAMP)
+    second = cache.agenda(EVENTS, 2026, "en", "summer", STAMP)
+    assert first == second == render_agenda(EVENTS, 2026, "en", "summer", STAMP)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_moodle_and_semester_outputs(tmp_path):
+    cache = OutputCache(tmp_path)
+    assert cache.moodle_csv(EVENTS, 2026, "en", "summer") == create_moodle_csv(
+        EVENTS, 2026, "en", "summer"
+    )
+    expected = generate_calendar(2026, "summer", "en", STAMP).to_ical()
+    assert cache.semester_calendar(2026, "summer", "en", STAMP) == expected
+    assert cache.semester_calendar(2026, "summer", "en", STAMP) == expected
+    assert cache.hits == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = OutputCache(tmp_path, max_bytes=250)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, b"x" * 100)
+        os.utime(tmp_path / key, (1000 + i, 1000 + i))
+    # "a" is the oldest entry and had to go when "c" was added
+    assert cache.get("a") is None
+    assert cache.get("b") == b"x" * 100
+    assert cache.get("c") == b"x" * 100
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".tmp-")]
+
+
+def test_package_versions_are_looked_up_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(store, "version", lambda name: calls.append(name) or "1.0")
+    store._version.cache_clear()
+    try:
+        for year in (2025, 2026):
+            cache_key("agenda", EVENTS, year=year, lang="en", semester="summer")
+        assert sorted(calls) == ["hm-semester", "holidays"]
+    finally:
+        store._version.cache_clear()
+
+
+def test_cache_key_depends_on_holiday_source(monkeypatch):
+    versions = {"hm-semester": "1.0", "holidays": "0.80"}
+    monkeypatch.setattr(store, "_version", versions.get)
+    monkeypatch.setattr(store, "get_holiday_backend", lambda: "holidays")
+    key = cache_key("agenda", EVENTS, year=2026, lang="en", semester="summer")
+    versions["holidays"] = "0.81"
+    upgraded = cache_key("agenda", EVENTS, year=2026, lang="en", semester="summer")
+    assert upgraded != key
+    monkeypatch.setattr(store, "get_holiday_backend", lambda: "native")
+    native = cache_key("agenda", EVENTS, year=2026, lang="en", semester="summer")
+    assert native not in (key, upgraded)
+    versions["holidays"] = "0.82"
+    assert cache_key("agenda", EVENTS, year=2026, lang="en", semester="summer") == native
+
+
+def test_overwrite_does_not_grow_size(tmp_path):
+    cache = OutputCache(tmp_path, max_bytes=250)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 100)
+    for _ in range(5):
+        cache.put("b", b"y" * 100)
+    assert cache._size == 200
+    assert cache.get("a") == b"x" * 100
+
+
+def test_clear(tmp_path):
+    cache = OutputCache(tmp_path)
+    cache.put("a", b"data")
+    cache.clear()
+    assert cache.get("a") is None
@@ -0,0 +1,10 @@
+import dataclasses
+
+from hm_semester.types import FrozenWeeklyEvent, WeeklyEvent
+
+
+def test_frozen_weekly_event_matches_weekly_event():
+    def spec(cls):
+        return [(f.name, f.type, f.default) for f in dataclasses.fields(cls)]
+
+    assert spec(FrozenWeeklyEvent) == spec(WeeklyEvent)
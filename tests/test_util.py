@@ -119,3 +119,26 @@ def test_holiday_dates_outside_semester_not_included():
     info = get_winter_semester_info(2025, "de")
     holidays = get_holiday_dates(info)
     assert date(2026, 6, 4) not in holidays, "Summer holiday should not appear in winter semester"
+
+
+def test_holiday_dates_range_matches_per_semester():
+    from hm_semester.util import get_holiday_dates_range
+
+    infos = [get_summer_semester_info(2025, "de"), get_winter_semester_info(2025, "de")]
+    assert get_holiday_dates_range(infos) == [get_holiday_dates(info) for info in infos]
+
+
+def test_holiday_calendar_matches_holiday_dates():
+    from hm_semester.intervals import HolidayCalendar
+
+    for info in [get_summer_semester_info(2026, "en"), get_winter_semester_info(2025, "en")]:
+        assert set(HolidayCalendar.from_semester(info)) == get_holiday_dates(info)
+
+
+def test_semester_range_is_chronological():
+    from hm_semester.util import semester_range
+
+    assert semester_range(2024, 2025) == [
+        (2024, "summer"), (2024, "winter"), (2025, "summer"), (2025, "winter"),
+    ]
+    assert semester_range(2024, 2025, ("winter",)) == [(2024, "winter"), (2025, "winter")]